@@ -12,6 +12,14 @@ from cli.templates import (
     env_file,
     gitignore_generator,
     docker_files,
+    cache_files,
+    commands_files,
+    serialization_files,
+    benchmark_files,
+    observability_files,
+    gunicorn_files,
+    lifecycle_files,
+    server_files,
 )
 
 
@@ -28,6 +36,8 @@ def _setup_project_structure(project_path, db_type='sqlite'):
     (project_path / 'services').mkdir(exist_ok=True)
     (project_path / 'routes').mkdir(exist_ok=True)
     (project_path / 'db').mkdir(exist_ok=True)
+    (project_path / 'commands').mkdir(exist_ok=True)
+    (project_path / 'benchmarks').mkdir(exist_ok=True)
     (project_path / 'static').mkdir(exist_ok=True)
     (project_path / 'static' / 'js').mkdir(exist_ok=True)
     (project_path / 'static' / 'css').mkdir(exist_ok=True)
@@ -50,6 +60,22 @@ def _setup_project_structure(project_path, db_type='sqlite'):
     # Create services directory files
     services_files.create(project_path / 'services')
 
+    # Create cache backend and query cache
+    cache_files.create(project_path)
+
+    # Create custom Flask CLI commands
+    commands_files.create(project_path / 'commands')
+
+    # Create JSON serialization and benchmarks
+    benchmark_files.create(project_path / 'benchmarks')
+    serialization_files.create(project_path)
+
+    # Create observability (SQL instrumentation, ...)
+    observability_files.create(project_path)
+
+    # Create worker warm-up
+    lifecycle_files.create(project_path)
+
     # Create requirements.txt with appropriate database driver
     requirements_files.create(project_path, db_type)
 
@@ -58,6 +84,8 @@ def _setup_auth(project_path):
     """Add Flask-Security-Too authentication to the project"""
     from cli.templates.auth import (
         auth_models,
+        auth_routes,
+        auth_service,
         auth_templates,
         auth_requirements,
     )
@@ -68,25 +96,37 @@ def _setup_auth(project_path):
     # Create auth HTML templates
     auth_templates.create(project_path / 'templates')
 
+    # Create admin-only blueprints (memory diagnostics)
+    auth_routes.create(project_path / 'routes')
+
+    # Create AuthService (user creation, password and login tracking helpers)
+    auth_service.create(project_path / 'services')
+
     # Update requirements.txt with Flask-Security-Too, argon2, and python-dotenv
     auth_requirements.update(project_path / 'requirements.txt')
 
 
-def _setup_config_files(project_path, with_auth=False, db_type='sqlite'):
+def _setup_config_files(project_path, with_auth=False, db_type='sqlite', server_mode='sync', pgbouncer=False):
     """Generate .env, .env.example, and .gitignore"""
     # Create .env with secure generated secrets
-    env_file.create(project_path, db_type)
+    env_file.create(project_path, db_type, server_mode, pgbouncer)
 
     # Create .env.example for documentation
-    env_file.create_sample(project_path, db_type)
+    env_file.create_sample(project_path, db_type, server_mode, pgbouncer)
 
     # Create .gitignore to protect secrets and common files
     gitignore_generator.create(project_path)
 
 
-def _setup_docker(project_path, db_type='sqlite'):
-    """Generate Docker configuration files"""
-    docker_files.create(project_path, db_type)
+def _setup_server(project_path, server_mode='sync', db_type='sqlite', with_auth=False):
+    """Add the files and dependencies of the selected server mode"""
+    server_files.create(project_path, server_mode, db_type, with_auth)
+
+
+def _setup_docker(project_path, db_type='sqlite', server_mode='sync', pgbouncer=False):
+    """Generate Docker and gunicorn configuration files"""
+    gunicorn_files.create(project_path)
+    docker_files.create(project_path, db_type, server_mode, pgbouncer)
 
 
 def _print_success_message(project_path, with_auth, db_type='sqlite'):
@@ -236,6 +276,15 @@ def build():
     else:
         click.echo("\n✅ SQLite selected - zero configuration needed\n")
 
+    pgbouncer = False
+    if db_type == 'postgres':
+        click.echo("Add PgBouncer (transaction pooling) in front of PostgreSQL?\n")
+        click.echo("  1) No (workers connect to PostgreSQL directly)")
+        click.echo("  2) Yes (recommended when running several app containers)\n")
+
+        pgbouncer = click.prompt("Enter your choice", type=click.Choice(['1', '2'])) == '2'
+        click.echo("")
+
     # ========================
     # Question 3: Authentication
     # ========================
@@ -246,6 +295,17 @@ def build():
     auth_choice = click.prompt("Enter your choice", type=click.Choice(['1', '2']))
     with_auth = auth_choice == '2'
 
+    # ========================
+    # Question 4: Server Mode
+    # ========================
+    click.echo("\nQuestion 4: Which server mode?\n")
+    click.echo("  1) Sync WSGI (gunicorn sync workers - simplest)")
+    click.echo("  2) Async ASGI (Quart async API + async SQLAlchemy on uvicorn workers)")
+    click.echo("  3) gevent (whole Flask app on cooperative greenlets)\n")
+
+    server_choice = click.prompt("Enter your choice", type=click.Choice(['1', '2', '3']))
+    server_mode = {'1': 'sync', '2': 'async', '3': 'gevent'}[server_choice]
+
     # ========================
     # Setup Project
     # ========================
@@ -263,18 +323,23 @@ def build():
             app_py.create(project_path, project_path.name)
 
         # 3. Create config files (.env, .env.example, .gitignore)
-        _setup_config_files(project_path, with_auth, db_type)
+        _setup_config_files(project_path, with_auth, db_type, server_mode, pgbouncer)
 
         # 4. Add authentication if requested
         if with_auth:
             click.echo("")
             _setup_auth(project_path)
 
-        # 5. Setup Docker
+        # 5. Add server mode files (async API, gevent patching)
+        if server_mode != 'sync':
+            click.echo("")
+            _setup_server(project_path, server_mode, db_type, with_auth)
+
+        # 6. Setup Docker
         click.echo("")
-        _setup_docker(project_path, db_type)
+        _setup_docker(project_path, db_type, server_mode, pgbouncer)
 
-        # 6. Print success message
+        # 7. Print success message
         _print_success_message(project_path, with_auth, db_type)
 
     except Exception as e:
@@ -10,6 +10,11 @@ import os
 from dotenv import load_dotenv
 from flask import Flask
 from db.database import db, init_db
+from cache import init_cache, init_fragment_cache, init_template_cache, query_cache
+from commands import register_commands
+from serialization import init_json
+from observability import init_metrics, init_profiling, init_tracing, sql_instrumentation
+from lifecycle import init_probes
 from routes import register_blueprints
 
 # Load environment variables from .env file
@@ -24,15 +29,123 @@ def create_app(config=None):
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///app.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+    # Connection pool per worker process - size it to the requests a worker runs at once
+    app.config['DB_POOL_SIZE'] = int(os.getenv('DB_POOL_SIZE', 5))
+    app.config['DB_MAX_OVERFLOW'] = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    app.config['DB_POOL_TIMEOUT'] = float(os.getenv('DB_POOL_TIMEOUT', 30))
+    # PgBouncer (transaction pooling) in front of PostgreSQL: small pools, no prepared statements
+    app.config['DB_PGBOUNCER'] = os.getenv('DB_PGBOUNCER', 'False').lower() in ('true', '1', 'yes')
+
+    # SQLite single-writer mode (opt-in): reader pool + one serialized writer per worker
+    app.config['SQLITE_SINGLE_WRITER'] = os.getenv('SQLITE_SINGLE_WRITER', 'False').lower() in ('true', '1', 'yes')
+    app.config['SQLITE_BUSY_TIMEOUT_MS'] = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    app.config['SQLITE_WRITE_RETRIES'] = int(os.getenv('SQLITE_WRITE_RETRIES', 3))
+    app.config['SQLITE_BATCH_SIZE'] = int(os.getenv('SQLITE_BATCH_SIZE', 100))
+    app.config['SQLITE_BATCH_WINDOW_MS'] = float(os.getenv('SQLITE_BATCH_WINDOW_MS', 2))
+
+    # Read replicas (opt-in): GET requests and @read_only() code read from them
+    app.config['DATABASE_REPLICA_URLS'] = os.getenv('DATABASE_REPLICA_URLS', '')
+    app.config['REPLICA_EJECT_SECONDS'] = float(os.getenv('REPLICA_EJECT_SECONDS', 30))
+    app.config['REPLICA_MAX_LAG_SECONDS'] = float(os.getenv('REPLICA_MAX_LAG_SECONDS', 10))
+    app.config['REPLICA_CHECK_SECONDS'] = float(os.getenv('REPLICA_CHECK_SECONDS', 5))
+    app.config['REPLICA_STICKY_SECONDS'] = int(os.getenv('REPLICA_STICKY_SECONDS', 5))
+
+    # Hash sharding (opt-in): tables of ShardedMixin models live on these shards
+    app.config['DATABASE_SHARD_URLS'] = os.getenv('DATABASE_SHARD_URLS', '')
+    app.config['SHARD_SLOTS'] = int(os.getenv('SHARD_SLOTS', 4096))
+    app.config['SHARD_VNODES'] = int(os.getenv('SHARD_VNODES', 64))
+    app.config['SHARD_MAP_TTL'] = float(os.getenv('SHARD_MAP_TTL', 5))
+
+    # Create upcoming partitions of PartitionedModel tables and expire old ones at startup
+    app.config['PARTITION_MAINTENANCE'] = os.getenv('PARTITION_MAINTENANCE', 'True').lower() in ('true', '1', 'yes')
+
+    # Cache configuration - use FileSystemCache or RedisCache with several workers
+    app.config['CACHE_TYPE'] = os.getenv('CACHE_TYPE', 'SimpleCache')
+    app.config['CACHE_REDIS_URL'] = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    app.config['QUERY_CACHE_ENABLED'] = os.getenv('QUERY_CACHE_ENABLED', 'False').lower() in ('true', '1', 'yes')
+    app.config['QUERY_CACHE_TIMEOUT'] = int(os.getenv('QUERY_CACHE_TIMEOUT', 300))
+
+    # Template configuration - auto-reload only in debug, bytecode shared on disk
+    app.config['TEMPLATES_AUTO_RELOAD'] = os.getenv('FLASK_DEBUG', 'False').lower() in ('true', '1', 'yes')
+    app.config['TEMPLATE_CACHE_DIR'] = os.getenv('TEMPLATE_CACHE_DIR')
+    app.config['FRAGMENT_CACHE_ENABLED'] = os.getenv('FRAGMENT_CACHE_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    app.config['FRAGMENT_CACHE_VERSION'] = os.getenv('FRAGMENT_CACHE_VERSION', '1')
+
+    # JSON encoder - auto picks orjson, then msgspec, then stdlib json
+    app.config['JSON_BACKEND'] = os.getenv('JSON_BACKEND', 'auto')
+
+    # SQL instrumentation - auto: every request in debug, sampled in production
+    app.config['SQL_INSTRUMENTATION'] = os.getenv('SQL_INSTRUMENTATION', 'auto')
+    app.config['SQL_SAMPLE_RATE'] = float(os.getenv('SQL_SAMPLE_RATE', 0.01))
+    app.config['SQL_SLOW_QUERY_MS'] = float(os.getenv('SQL_SLOW_QUERY_MS', 200))
+    app.config['SQL_N_PLUS_ONE_THRESHOLD'] = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', 5))
+    # Where workers write their hot statements for flask db advise ('' disables)
+    app.config['SQL_HOT_DIR'] = os.getenv('SQL_HOT_DIR', 'instance/sql_hot')
+    app.config['SQL_HOT_FLUSH_SECONDS'] = float(os.getenv('SQL_HOT_FLUSH_SECONDS', 60))
+
+    # Prometheus metrics at /metrics
+    app.config['METRICS_ENABLED'] = os.getenv('METRICS_ENABLED', 'True').lower() in ('true', '1', 'yes')
+
+    # Request tracing (opt-in) - exporter: file, console, otlp or module:Class
+    app.config['TRACING_ENABLED'] = os.getenv('TRACING_ENABLED', 'False').lower() in ('true', '1', 'yes')
+    app.config['TRACING_SAMPLE_RATE'] = float(os.getenv('TRACING_SAMPLE_RATE', 0.1))
+    app.config['TRACING_EXPORTER'] = os.getenv('TRACING_EXPORTER', 'file')
+    app.config['TRACING_FILE'] = os.getenv('TRACING_FILE', 'instance/traces.jsonl')
+    app.config['TRACING_SERVICE_NAME'] = os.getenv('TRACING_SERVICE_NAME', 'flaskmeridian-app')
+    app.config['OTEL_EXPORTER_OTLP_ENDPOINT'] = os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT', 'http://localhost:4318')
+
+    # Request profiling (opt-in) - X-Profile header with the secret, or sampled
+    app.config['PROFILING_ENABLED'] = os.getenv('PROFILING_ENABLED', 'False').lower() in ('true', '1', 'yes')
+    app.config['PROFILING_SECRET'] = os.getenv('PROFILING_SECRET')
+    app.config['PROFILING_ROLE'] = os.getenv('PROFILING_ROLE', 'admin')
+    app.config['PROFILING_SAMPLE_RATE'] = float(os.getenv('PROFILING_SAMPLE_RATE', 0.0))
+    app.config['PROFILING_INTERVAL_MS'] = float(os.getenv('PROFILING_INTERVAL_MS', 5))
+    app.config['PROFILING_DIR'] = os.getenv('PROFILING_DIR', 'instance/profiles')
+    app.config['PROFILING_MAX_FILES'] = int(os.getenv('PROFILING_MAX_FILES', 50))
+
+    # Worker warm-up before accepting traffic (run by gunicorn.conf.py)
+    app.config['WARMUP_ENABLED'] = os.getenv('WARMUP_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    app.config['WARMUP_ROUTES'] = os.getenv('WARMUP_ROUTES', '/')
+
+    # /readyz caches its database checks for this many seconds
+    app.config['READYZ_CACHE_SECONDS'] = float(os.getenv('READYZ_CACHE_SECONDS', 2))
+
     if config:
         app.config.update(config)
 
+    # Install the fast JSON provider
+    init_json(app)
+
     # Initialize database
     init_db(app)
 
+    # Record per-request query count, DB time and N+1 candidates
+    sql_instrumentation.init_app(app)
+
+    # Initialize cache backend and query-result cache
+    init_cache(app)
+    query_cache.init_app(app)
+    init_template_cache(app)
+    init_fragment_cache(app)
+
+    # Prometheus metrics (request latency, pool usage) at /metrics
+    init_metrics(app)
+
+    # Distributed tracing spans (requests, SQL, templates, argon2, outbound HTTP)
+    init_tracing(app)
+
+    # On-demand / sampled profiling of single requests
+    init_profiling(app)
+
     # Register blueprints
     register_blueprints(app)
 
+    # Register custom CLI commands (flask templates compile, ...)
+    register_commands(app)
+
+    # /livez and /readyz answered before any other middleware or Flask
+    init_probes(app)
+
     return app
 
 
@@ -68,8 +181,14 @@ from dotenv import load_dotenv
 from flask import Flask
 from flask_security import Security, SQLAlchemyUserDatastore
 from db.database import db, init_db
+from cache import init_cache, init_fragment_cache, init_template_cache, query_cache
+from commands import register_commands
+from serialization import init_json
+from observability import init_metrics, init_profiling, init_tracing, sql_instrumentation
+from lifecycle import init_probes
 from db.models import User, Role
 from routes import register_blueprints
+from routes.memory import memory_bp
 
 # Load environment variables from .env file
 load_dotenv()
@@ -83,6 +202,87 @@ def create_app(config=None):
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///app.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+    # Connection pool per worker process - size it to the requests a worker runs at once
+    app.config['DB_POOL_SIZE'] = int(os.getenv('DB_POOL_SIZE', 5))
+    app.config['DB_MAX_OVERFLOW'] = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    app.config['DB_POOL_TIMEOUT'] = float(os.getenv('DB_POOL_TIMEOUT', 30))
+    # PgBouncer (transaction pooling) in front of PostgreSQL: small pools, no prepared statements
+    app.config['DB_PGBOUNCER'] = os.getenv('DB_PGBOUNCER', 'False').lower() in ('true', '1', 'yes')
+
+    # SQLite single-writer mode (opt-in): reader pool + one serialized writer per worker
+    app.config['SQLITE_SINGLE_WRITER'] = os.getenv('SQLITE_SINGLE_WRITER', 'False').lower() in ('true', '1', 'yes')
+    app.config['SQLITE_BUSY_TIMEOUT_MS'] = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    app.config['SQLITE_WRITE_RETRIES'] = int(os.getenv('SQLITE_WRITE_RETRIES', 3))
+    app.config['SQLITE_BATCH_SIZE'] = int(os.getenv('SQLITE_BATCH_SIZE', 100))
+    app.config['SQLITE_BATCH_WINDOW_MS'] = float(os.getenv('SQLITE_BATCH_WINDOW_MS', 2))
+
+    # Read replicas (opt-in): GET requests and @read_only() code read from them
+    app.config['DATABASE_REPLICA_URLS'] = os.getenv('DATABASE_REPLICA_URLS', '')
+    app.config['REPLICA_EJECT_SECONDS'] = float(os.getenv('REPLICA_EJECT_SECONDS', 30))
+    app.config['REPLICA_MAX_LAG_SECONDS'] = float(os.getenv('REPLICA_MAX_LAG_SECONDS', 10))
+    app.config['REPLICA_CHECK_SECONDS'] = float(os.getenv('REPLICA_CHECK_SECONDS', 5))
+    app.config['REPLICA_STICKY_SECONDS'] = int(os.getenv('REPLICA_STICKY_SECONDS', 5))
+
+    # Hash sharding (opt-in): tables of ShardedMixin models live on these shards
+    app.config['DATABASE_SHARD_URLS'] = os.getenv('DATABASE_SHARD_URLS', '')
+    app.config['SHARD_SLOTS'] = int(os.getenv('SHARD_SLOTS', 4096))
+    app.config['SHARD_VNODES'] = int(os.getenv('SHARD_VNODES', 64))
+    app.config['SHARD_MAP_TTL'] = float(os.getenv('SHARD_MAP_TTL', 5))
+
+    # Create upcoming partitions of PartitionedModel tables and expire old ones at startup
+    app.config['PARTITION_MAINTENANCE'] = os.getenv('PARTITION_MAINTENANCE', 'True').lower() in ('true', '1', 'yes')
+
+    # Cache configuration - use FileSystemCache or RedisCache with several workers
+    app.config['CACHE_TYPE'] = os.getenv('CACHE_TYPE', 'SimpleCache')
+    app.config['CACHE_REDIS_URL'] = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    app.config['QUERY_CACHE_ENABLED'] = os.getenv('QUERY_CACHE_ENABLED', 'False').lower() in ('true', '1', 'yes')
+    app.config['QUERY_CACHE_TIMEOUT'] = int(os.getenv('QUERY_CACHE_TIMEOUT', 300))
+
+    # Template configuration - auto-reload only in debug, bytecode shared on disk
+    app.config['TEMPLATES_AUTO_RELOAD'] = os.getenv('FLASK_DEBUG', 'False').lower() in ('true', '1', 'yes')
+    app.config['TEMPLATE_CACHE_DIR'] = os.getenv('TEMPLATE_CACHE_DIR')
+    app.config['FRAGMENT_CACHE_ENABLED'] = os.getenv('FRAGMENT_CACHE_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    app.config['FRAGMENT_CACHE_VERSION'] = os.getenv('FRAGMENT_CACHE_VERSION', '1')
+
+    # JSON encoder - auto picks orjson, then msgspec, then stdlib json
+    app.config['JSON_BACKEND'] = os.getenv('JSON_BACKEND', 'auto')
+
+    # SQL instrumentation - auto: every request in debug, sampled in production
+    app.config['SQL_INSTRUMENTATION'] = os.getenv('SQL_INSTRUMENTATION', 'auto')
+    app.config['SQL_SAMPLE_RATE'] = float(os.getenv('SQL_SAMPLE_RATE', 0.01))
+    app.config['SQL_SLOW_QUERY_MS'] = float(os.getenv('SQL_SLOW_QUERY_MS', 200))
+    app.config['SQL_N_PLUS_ONE_THRESHOLD'] = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', 5))
+    # Where workers write their hot statements for flask db advise ('' disables)
+    app.config['SQL_HOT_DIR'] = os.getenv('SQL_HOT_DIR', 'instance/sql_hot')
+    app.config['SQL_HOT_FLUSH_SECONDS'] = float(os.getenv('SQL_HOT_FLUSH_SECONDS', 60))
+
+    # Prometheus metrics at /metrics
+    app.config['METRICS_ENABLED'] = os.getenv('METRICS_ENABLED', 'True').lower() in ('true', '1', 'yes')
+
+    # Request tracing (opt-in) - exporter: file, console, otlp or module:Class
+    app.config['TRACING_ENABLED'] = os.getenv('TRACING_ENABLED', 'False').lower() in ('true', '1', 'yes')
+    app.config['TRACING_SAMPLE_RATE'] = float(os.getenv('TRACING_SAMPLE_RATE', 0.1))
+    app.config['TRACING_EXPORTER'] = os.getenv('TRACING_EXPORTER', 'file')
+    app.config['TRACING_FILE'] = os.getenv('TRACING_FILE', 'instance/traces.jsonl')
+    app.config['TRACING_SERVICE_NAME'] = os.getenv('TRACING_SERVICE_NAME', 'flaskmeridian-app')
+    app.config['OTEL_EXPORTER_OTLP_ENDPOINT'] = os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT', 'http://localhost:4318')
+
+    # Request profiling (opt-in) - X-Profile header with the secret, or sampled
+    app.config['PROFILING_ENABLED'] = os.getenv('PROFILING_ENABLED', 'False').lower() in ('true', '1', 'yes')
+    app.config['PROFILING_SECRET'] = os.getenv('PROFILING_SECRET')
+    app.config['PROFILING_ROLE'] = os.getenv('PROFILING_ROLE', 'admin')
+    app.config['PROFILING_SAMPLE_RATE'] = float(os.getenv('PROFILING_SAMPLE_RATE', 0.0))
+    app.config['PROFILING_INTERVAL_MS'] = float(os.getenv('PROFILING_INTERVAL_MS', 5))
+    app.config['PROFILING_DIR'] = os.getenv('PROFILING_DIR', 'instance/profiles')
+    app.config['PROFILING_MAX_FILES'] = int(os.getenv('PROFILING_MAX_FILES', 50))
+
+    # Worker warm-up before accepting traffic (run by gunicorn.conf.py)
+    app.config['WARMUP_ENABLED'] = os.getenv('WARMUP_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    app.config['WARMUP_ROUTES'] = os.getenv('WARMUP_ROUTES', '/,/login,/register')
+
+    # /readyz caches its database checks for this many seconds
+    app.config['READYZ_CACHE_SECONDS'] = float(os.getenv('READYZ_CACHE_SECONDS', 2))
+
     # Flask-Security configuration - loaded from environment
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     app.config['SECURITY_PASSWORD_SALT'] = os.getenv('SECURITY_PASSWORD_SALT', 'dev-salt-change-in-production')
@@ -106,9 +306,21 @@ def create_app(config=None):
     if config:
         app.config.update(config)
 
+    # Install the fast JSON provider
+    init_json(app)
+
     # Initialize database
     init_db(app)
 
+    # Record per-request query count, DB time and N+1 candidates
+    sql_instrumentation.init_app(app)
+
+    # Initialize cache backend and query-result cache
+    init_cache(app)
+    query_cache.init_app(app)
+    init_template_cache(app)
+    init_fragment_cache(app)
+
     # Setup Flask-Security (automatically registers all auth routes)
     # Routes provided by Flask-Security:
     # - GET/POST /login
@@ -123,9 +335,27 @@ def create_app(config=None):
     with app.app_context():
         _initialize_default_roles()
 
+    # Prometheus metrics (request latency, pool usage, argon2 timings) at /metrics
+    init_metrics(app)
+
+    # Distributed tracing spans (requests, SQL, templates, argon2, outbound HTTP)
+    init_tracing(app)
+
+    # On-demand / sampled profiling of single requests
+    init_profiling(app)
+
     # Register application blueprints
     register_blueprints(app)
 
+    # Admin-only memory diagnostics at /admin/memory
+    app.register_blueprint(memory_bp)
+
+    # Register custom CLI commands (flask templates compile, ...)
+    register_commands(app)
+
+    # /livez and /readyz answered before any other middleware or Flask
+    init_probes(app)
+
     return app
 
 
@@ -137,11 +367,12 @@ def _initialize_default_roles():
         ('moderator', 'Content moderator'),
     ]
 
-    for name, description in default_roles:
-        if not Role.query.filter_by(name=name).first():
-            role = Role(name=name, description=description)
-            db.session.add(role)
-            db.session.commit()
+    # One INSERT ... ON CONFLICT DO NOTHING instead of a query and commit per role
+    Role.bulk_upsert(
+        [{'name': name, 'description': description} for name, description in default_roles],
+        conflict_cols=['name'],
+        update_cols=(),
+    )
 
 
 # Create app instance for Flask CLI
@@ -33,6 +33,13 @@ class Role(BaseModel):
 
     def __str__(self):
         return self.name
+
+    # ========================
+    # Flask-Security-Too Required Methods
+    # ========================
+    def get_permissions(self):
+        """Flask-Security requirement: permissions granted by this role (none defined)"""
+        return set()
 '''
     with open(models_path / 'role.py', 'w', encoding='utf-8') as f:
         f.write(role_content)
@@ -51,7 +58,9 @@ from flask_security import verify_password
 roles_users = db.Table(
     'roles_users',
     db.Column('user_id', db.Integer(), db.ForeignKey('user.id'), primary_key=True),
-    db.Column('role_id', db.Integer(), db.ForeignKey('role.id'), primary_key=True)
+    db.Column('role_id', db.Integer(), db.ForeignKey('role.id'), primary_key=True),
+    # The primary key leads with user_id; role lookups (role.users) need their own index
+    db.Index('ix_roles_users_role_id', 'role_id'),
 )
 
 
@@ -59,6 +68,12 @@ class User(BaseModel):
     """User model with Flask-Security-Too and Flask-Login integration"""
     __tablename__ = 'user'
 
+    # Never serialized by to_dict() / JSON responses unless explicitly included
+    __serialize_exclude__ = frozenset({'password', 'fs_uniquifier'})
+
+    # Eager-load presets for User.with_preset() / keyset_page(preset=...)
+    __load_presets__ = {'with_roles': ('roles',)}
+
     email = db.Column(db.String(255), unique=True, nullable=False, index=True)
     username = db.Column(db.String(80), unique=True, nullable=True, index=True)
     password = db.Column(db.String(255), nullable=False)
@@ -186,10 +201,12 @@ def _update_models_init(models_path):
 
     updated_content = '''"""Database models for FlaskMeridian app"""
 from .base import BaseModel
+from .partitioned import PartitionedModel
 from .role import Role
+from .sharded import ShardedMixin
 from .user import User
 
-__all__ = ['BaseModel', 'Role', 'User']
+__all__ = ['BaseModel', 'PartitionedModel', 'Role', 'ShardedMixin', 'User']
 '''
 
     with open(init_file, 'w', encoding='utf-8') as f:
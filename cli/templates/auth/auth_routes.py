@@ -0,0 +1,202 @@
+"""Auth routes generator - admin-only blueprints for Flask-Security-Too projects"""
+import click
+
+
+def create(routes_path):
+    """Create admin-only route modules (require the Flask-Security admin role)
+
+    Args:
+        routes_path: Path to routes directory
+    """
+
+    # ========================
+    # routes/memory.py
+    # ========================
+    memory_content = '''"""Admin-only memory diagnostics
+
+Every route requires a logged-in user with the ``admin`` role. Results
+describe the gunicorn worker that served the request (``pid`` in every
+response); tracemalloc state and snapshots are per worker too, so repeat a
+call until it reaches the worker you are investigating.
+
+POST requests must send an ``X-Requested-With`` header. Cross-site forms
+cannot set it, so another site cannot make an admin's browser start tracing
+or take snapshots (CSRF).
+
+- GET  /admin/memory/                    RSS, GC counts, tracemalloc status
+- POST /admin/memory/tracemalloc/start   start tracing (?frames=N, default 1)
+- POST /admin/memory/tracemalloc/stop    stop tracing and drop snapshots
+- POST /admin/memory/snapshots           take a snapshot, return top sites
+- GET  /admin/memory/snapshots/diff      growth between two snapshots
+                                         (?old=ID&new=ID, default last two)
+- GET  /admin/memory/types               object counts by type (?limit=N)
+"""
+import gc
+import os
+import resource
+import tracemalloc
+from collections import Counter, OrderedDict
+
+from flask import Blueprint, abort, request
+from flask_security import auth_required, roles_required
+
+memory_bp = Blueprint('memory', __name__, url_prefix='/admin/memory')
+
+MAX_SNAPSHOTS = 5
+
+# Snapshot id -> tracemalloc.Snapshot, oldest first (per worker)
+_snapshots = OrderedDict()
+_next_snapshot_id = 1
+
+
+@memory_bp.before_request
+@auth_required()
+@roles_required('admin')
+def _require_admin():
+    """Every memory route is admin-only"""
+
+
+@memory_bp.before_request
+def _require_custom_header():
+    """State-changing routes need a header a cross-site form cannot send"""
+    if request.method == 'POST' and not request.headers.get('X-Requested-With'):
+        abort(403, description='POST requests must send an X-Requested-With header')
+
+
+def _rss_bytes():
+    """Current resident set size of this process"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        # Not Linux: fall back to the peak RSS (kilobytes on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == 'Darwin' else peak * 1024
+
+
+def _limit(default):
+    return min(request.args.get('limit', default, type=int), 500)
+
+
+def _site(stat):
+    frame = stat.traceback[0]
+    return f'{frame.filename}:{frame.lineno}'
+
+
+def _snapshot():
+    """Take a snapshot without tracemalloc's and the import system's own allocations"""
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ))
+
+
+@memory_bp.route('/')
+def summary():
+    """RSS, GC generation counts and tracemalloc status of this worker"""
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        'pid': os.getpid(),
+        'rss_bytes': _rss_bytes(),
+        'gc': {
+            'counts': gc.get_count(),
+            'thresholds': gc.get_threshold(),
+            'generations': gc.get_stats(),
+            'frozen': gc.get_freeze_count(),
+        },
+        'tracemalloc': {
+            'tracing': tracemalloc.is_tracing(),
+            'traced_bytes': current,
+            'peak_bytes': peak,
+            'snapshots': list(_snapshots),
+        },
+    }
+
+
+@memory_bp.route('/tracemalloc/start', methods=['POST'])
+def start_tracing():
+    """Start tracemalloc in this worker (slows allocations while running)"""
+    frames = request.args.get('frames', 1, type=int)
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    return {'pid': os.getpid(), 'tracing': True, 'frames': tracemalloc.get_traceback_limit()}
+
+
+@memory_bp.route('/tracemalloc/stop', methods=['POST'])
+def stop_tracing():
+    """Stop tracemalloc and free the stored snapshots"""
+    tracemalloc.stop()
+    _snapshots.clear()
+    return {'pid': os.getpid(), 'tracing': False}
+
+
+@memory_bp.route('/snapshots', methods=['POST'])
+def take_snapshot():
+    """Store a snapshot (the oldest is dropped beyond MAX_SNAPSHOTS)"""
+    global _next_snapshot_id
+    if not tracemalloc.is_tracing():
+        abort(409, description='tracemalloc is not running; POST tracemalloc/start first')
+
+    snapshot = _snapshot()
+    snapshot_id = _next_snapshot_id
+    _next_snapshot_id += 1
+    _snapshots[snapshot_id] = snapshot
+    while len(_snapshots) > MAX_SNAPSHOTS:
+        _snapshots.popitem(last=False)
+
+    stats = snapshot.statistics('lineno')
+    return {
+        'pid': os.getpid(),
+        'id': snapshot_id,
+        'total_bytes': sum(stat.size for stat in stats),
+        'top': [
+            {'site': _site(stat), 'bytes': stat.size, 'count': stat.count}
+            for stat in stats[:_limit(20)]
+        ],
+    }
+
+
+@memory_bp.route('/snapshots/diff')
+def diff_snapshots():
+    """Allocation sites that grew most between two snapshots"""
+    ids = list(_snapshots)
+    if len(ids) < 2:
+        abort(409, description='Take at least two snapshots first')
+    old_id = request.args.get('old', ids[-2], type=int)
+    new_id = request.args.get('new', ids[-1], type=int)
+    if old_id not in _snapshots or new_id not in _snapshots:
+        abort(404, description=f'Unknown snapshot; this worker has {ids}')
+
+    stats = _snapshots[new_id].compare_to(_snapshots[old_id], 'lineno')
+    return {
+        'pid': os.getpid(),
+        'old': old_id,
+        'new': new_id,
+        'total_growth_bytes': sum(stat.size_diff for stat in stats),
+        'top': [
+            {
+                'site': _site(stat),
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+                'bytes': stat.size,
+            }
+            for stat in stats[:_limit(20)]
+        ],
+    }
+
+
+@memory_bp.route('/types')
+def type_histogram():
+    """Most common object types among those tracked by the GC"""
+    counts = Counter(type(obj).__qualname__ for obj in gc.get_objects())
+    return {
+        'pid': os.getpid(),
+        'total': sum(counts.values()),
+        'types': [{'type': name, 'count': count} for name, count in counts.most_common(_limit(30))],
+    }
+'''
+    with open(routes_path / 'memory.py', 'w', encoding='utf-8') as f:
+        f.write(memory_content)
+
+    click.echo("✅ Created routes/memory.py (admin-only memory diagnostics)")
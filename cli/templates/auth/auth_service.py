@@ -7,8 +7,12 @@ def create(services_path):
     """Create auth_service.py using Flask-Security-Too's argon2 functions"""
 
     service_content = '''"""Authentication service - business logic using Flask-Security-Too with argon2"""
+from datetime import datetime
+
 from flask_security import hash_password, verify_password
-from db import db
+from sqlalchemy import func, update
+
+from db import db, write_queue
 from db.models import User, Role
 
 
@@ -57,12 +61,12 @@ class AuthService:
         # Assign roles
         if roles:
             for role_name in roles:
-                role = Role.query.filter_by(name=role_name).first()
+                role = Role.cached().filter_by(name=role_name).first()
                 if role:
                     user.roles.append(role)
         else:
             # Assign default 'user' role
-            user_role = Role.query.filter_by(name='user').first()
+            user_role = Role.cached().filter_by(name='user').first()
             if user_role:
                 user.roles.append(user_role)
 
@@ -106,19 +110,42 @@ class AuthService:
         """
         Track user login information
 
+        In single-writer SQLite mode this is a single UPDATE through
+        write_queue, so concurrent logins share one write transaction;
+        pending changes in the session are committed first. Otherwise the
+        user is updated in the session and committed.
+
         Args:
             user: User instance
             ip_address: IP address of the login
         """
-        from datetime import datetime
-
-        user.last_login_at = user.current_login_at
-        user.last_login_ip = user.current_login_ip
-        user.current_login_at = datetime.utcnow()
-        user.current_login_ip = ip_address
-        user.login_count = (user.login_count or 0) + 1
+        if not write_queue.batching:
+            user.last_login_at = user.current_login_at
+            user.last_login_ip = user.current_login_ip
+            user.current_login_at = datetime.utcnow()
+            user.current_login_ip = ip_address
+            user.login_count = (user.login_count or 0) + 1
+            db.session.commit()
+            return
 
+        # The session would hold the writer the batch needs
         db.session.commit()
+        users = User.__table__
+        write_queue.execute(
+            update(users)
+            .where(users.c.id == user.id)
+            .values(
+                last_login_at=users.c.current_login_at,
+                last_login_ip=users.c.current_login_ip,
+                current_login_at=datetime.utcnow(),
+                current_login_ip=ip_address,
+                login_count=func.coalesce(users.c.login_count, 0) + 1,
+            )
+        )
+        # Reload the tracking columns on next access
+        db.session.expire(user, [
+            'last_login_at', 'last_login_ip', 'current_login_at', 'current_login_ip', 'login_count',
+        ])
 
     @staticmethod
     def deactivate_user(user):
@@ -146,7 +173,7 @@ class AuthService:
         Returns:
             Updated user instance
         """
-        role = Role.query.filter_by(name=role_name).first()
+        role = Role.cached().filter_by(name=role_name).first()
         if role and role not in user.roles:
             user.roles.append(role)
             db.session.commit()
@@ -164,7 +191,7 @@ class AuthService:
         Returns:
             Updated user instance
         """
-        role = Role.query.filter_by(name=role_name).first()
+        role = Role.cached().filter_by(name=role_name).first()
         if role and role in user.roles:
             user.roles.remove(role)
             db.session.commit()
@@ -200,9 +227,11 @@ class AuthService:
             ('moderator', 'Content moderator'),
         ]
 
-        for name, description in default_roles:
-            if not Role.query.filter_by(name=name).first():
-                AuthService.create_role(name, description)
+        Role.bulk_upsert(
+            [{'name': name, 'description': description} for name, description in default_roles],
+            conflict_cols=['name'],
+            update_cols=(),
+        )
 '''
 
     service_file = services_path / 'auth_service.py'
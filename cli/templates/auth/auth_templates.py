@@ -216,12 +216,14 @@ def create(templates_path):
             {{ login_user_form.submit(class="btn-signin") }}
         </form>
 
+        {% cache 'login_footer', 3600 %}
         <div class="auth-footer">
             <p>Don't have an account? <a href="{{ url_for('security.register') }}">Create one now</a></p>
             {% if config.SECURITY_RECOVERABLE %}
             <p><a href="{{ url_for('security.forgot_password') }}">Forgot password?</a></p>
             {% endif %}
         </div>
+        {% endcache %}
     </div>
 </div>
 {% endblock %}
@@ -418,9 +420,11 @@ def create(templates_path):
             {{ register_user_form.submit(class="btn-signup", value="Create Account") }}
         </form>
 
+        {% cache 'register_footer', 3600 %}
         <div class="auth-footer">
             <p>Already have an account? <a href="{{ url_for('security.login') }}">Sign in here</a></p>
         </div>
+        {% endcache %}
     </div>
 </div>
 {% endblock %}
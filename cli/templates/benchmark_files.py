@@ -0,0 +1,21 @@
+"""Benchmark files generator - package for the generated performance scripts"""
+import click
+
+
+def create(benchmarks_path):
+    """Create benchmarks/__init__.py
+
+    Individual benchmark scripts are written by the generators of the
+    features they measure.
+    """
+
+    init_content = '''"""Performance benchmarks for FlaskMeridian app
+
+Run each benchmark as a module from the project root, for example:
+    python -m benchmarks.json_providers
+"""
+'''
+    with open(benchmarks_path / '__init__.py', 'w', encoding='utf-8') as f:
+        f.write(init_content)
+
+    click.echo("✅ Created benchmarks/__init__.py")
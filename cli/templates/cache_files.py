@@ -0,0 +1,450 @@
+"""Cache files generator - Flask-Caching backend and model-aware query-result cache"""
+import click
+
+
+def create(project_path):
+    """Create the cache/ package with the shared backend and the query cache
+
+    Args:
+        project_path: Path to project directory
+    """
+
+    cache_path = project_path / 'cache'
+    cache_path.mkdir(exist_ok=True)
+
+    # ========================
+    # cache/__init__.py
+    # ========================
+    cache_init_content = '''"""Cache module for FlaskMeridian app"""
+from .backend import cache, init_cache
+from .bytecode import init_template_cache
+from .fragments import init_fragment_cache
+from .query_cache import query_cache
+
+__all__ = ['cache', 'init_cache', 'init_template_cache', 'init_fragment_cache', 'query_cache']
+'''
+    with open(cache_path / '__init__.py', 'w', encoding='utf-8') as f:
+        f.write(cache_init_content)
+
+    # ========================
+    # cache/backend.py
+    # ========================
+    backend_content = '''"""Cache backend initialization and configuration
+
+The backend is selected with CACHE_TYPE in .env:
+- SimpleCache       in-process memory (one copy per gunicorn worker)
+- FileSystemCache   shared by all workers in a container (CACHE_DIR)
+- RedisCache        shared by all workers and containers (CACHE_REDIS_URL)
+"""
+import os
+
+from flask_caching import Cache
+
+cache = Cache()
+
+
+def init_cache(app):
+    """Initialize cache backend with Flask app"""
+    app.config.setdefault('CACHE_TYPE', 'SimpleCache')
+    app.config.setdefault('CACHE_DEFAULT_TIMEOUT', 300)
+
+    if app.config['CACHE_TYPE'] == 'FileSystemCache':
+        app.config.setdefault('CACHE_DIR', os.path.join(app.instance_path, 'cache'))
+
+    cache.init_app(app)
+'''
+    with open(cache_path / 'backend.py', 'w', encoding='utf-8') as f:
+        f.write(backend_content)
+
+    # ========================
+    # cache/bytecode.py
+    # ========================
+    bytecode_content = '''"""Jinja bytecode cache shared by all workers
+
+Compiled templates are written to TEMPLATE_CACHE_DIR, so a fresh gunicorn
+worker loads bytecode from disk instead of parsing and compiling every
+template on its first request. Run ``flask templates compile`` (done in the
+Dockerfile) to fill the cache ahead of time.
+"""
+import os
+
+from jinja2 import FileSystemBytecodeCache
+
+
+def init_template_cache(app):
+    """Attach an on-disk bytecode cache to the app's Jinja environment"""
+    cache_dir = app.config.get('TEMPLATE_CACHE_DIR') or os.path.join(
+        app.instance_path, 'jinja_cache'
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+    # Checking template mtimes on every render is only useful while developing
+    app.jinja_env.auto_reload = app.config.get('TEMPLATES_AUTO_RELOAD', app.debug)
+
+
+def compile_templates(app):
+    """Load every template once so its bytecode lands in the cache
+
+    Returns:
+        Tuple of (compiled template names, {name: error} for failures)
+    """
+    compiled, failed = [], {}
+    for name in sorted(app.jinja_env.list_templates()):
+        try:
+            app.jinja_env.get_template(name)
+            compiled.append(name)
+        except Exception as e:
+            failed[name] = str(e)
+    return compiled, failed
+'''
+    with open(cache_path / 'bytecode.py', 'w', encoding='utf-8') as f:
+        f.write(bytecode_content)
+
+    # ========================
+    # cache/fragments.py
+    # ========================
+    fragments_content = '''"""Fragment caching for Jinja templates
+
+Wrap an expensive, mostly static part of a template in a cache block:
+
+    {% cache 'footer', 3600 %}...{% endcache %}
+    {% cache 'nav', 600, 'role' %}...{% endcache %}
+
+Arguments are the fragment key, an optional timeout in seconds and an
+optional ``vary`` value:
+- 'role'  one copy per combination of the current user's roles
+- 'user'  one copy per user
+The rendered HTML is stored in the app cache backend, so with a shared
+backend every worker reuses it. Never wrap blocks that child templates
+override or content holding per-request data such as CSRF tokens.
+"""
+from flask import current_app, has_request_context
+from jinja2 import nodes
+from jinja2.ext import Extension
+
+from .backend import cache
+
+
+class FragmentCacheExtension(Extension):
+    """Jinja extension adding the {% cache %} tag"""
+
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        template = parser.name or '<string>'
+
+        args = [parser.parse_expression()]
+        for _ in range(2):
+            if parser.stream.skip_if('comma'):
+                args.append(parser.parse_expression())
+            else:
+                args.append(nodes.Const(None))
+        args.append(nodes.Const(f'{template}:{lineno}'))
+
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method('_render_cached', args), [], [], body
+        ).set_lineno(lineno)
+
+    def _render_cached(self, key, timeout, vary, location, caller):
+        if not current_app.config.get('FRAGMENT_CACHE_ENABLED', True):
+            return caller()
+
+        version = current_app.config.get('FRAGMENT_CACHE_VERSION', '1')
+        cache_key = f'frag:{version}:{location}:{key}:{_vary_token(vary)}'
+
+        rendered = cache.get(cache_key)
+        if rendered is None:
+            rendered = caller()
+            cache.set(cache_key, rendered, timeout=timeout)
+        return rendered
+
+
+def _vary_token(vary):
+    """Describe the current user for role- or user-specific fragments"""
+    if not vary:
+        return ''
+    if vary not in ('role', 'user'):
+        raise ValueError(f"Unsupported fragment cache vary value: {vary!r}")
+
+    user = _current_user()
+    if user is None or not user.is_authenticated:
+        return 'anonymous'
+    if vary == 'user':
+        return f'user={user.get_id()}'
+    return 'roles=' + ','.join(sorted(role.name for role in user.roles))
+
+
+def _current_user():
+    if not has_request_context() or not hasattr(current_app, 'login_manager'):
+        return None
+    try:
+        from flask_login import current_user
+    except ImportError:
+        return None
+    return current_user
+
+
+def init_fragment_cache(app):
+    """Register the {% cache %} tag on the app's Jinja environment"""
+    app.jinja_env.add_extension(FragmentCacheExtension)
+'''
+    with open(cache_path / 'fragments.py', 'w', encoding='utf-8') as f:
+        f.write(fragments_content)
+
+    # ========================
+    # cache/query_cache.py
+    # ========================
+    query_cache_content = '''"""Query-result cache for BaseModel subclasses
+
+Opt in per query with ``Model.cached()`` (or the ``query_cache`` execution
+option). Results are stored in the shared cache backend keyed on the
+compiled SQL statement, its parameters and the current *generation* of
+every table the statement reads from.
+
+Whenever a session flushes changes to a table, the table is remembered and
+its generation is bumped after the transaction commits. Old entries are
+never looked up again and simply expire, so no cache scan is needed.
+Until then the session bypasses the cache: it neither reads entries that
+would miss its own writes nor stores results others could see before a
+rollback.
+
+Hits, misses and the database time saved are counted in ``query_cache.stats``
+and exported on /metrics (see observability/metrics.py).
+
+Usage:
+    Role.cached().filter_by(name='admin').first()
+    User.query.filter_by(active=True).execution_options(query_cache=60).all()
+"""
+import hashlib
+import logging
+import threading
+import uuid
+from time import perf_counter
+
+from flask import g, has_app_context, has_request_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session, loading
+from sqlalchemy.sql.util import find_tables
+
+from .backend import cache
+
+logger = logging.getLogger(__name__)
+
+PENDING_TABLES_KEY = 'query_cache_tables'
+
+
+class QueryCacheStats:
+    """Process-wide hit/miss counters and database time saved"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
+            self.db_seconds = 0.0
+            self.saved_seconds = 0.0
+
+    def record_hit(self, saved_seconds):
+        with self._lock:
+            self.hits += 1
+            self.saved_seconds += saved_seconds
+
+    def record_miss(self, db_seconds):
+        with self._lock:
+            self.misses += 1
+            self.db_seconds += db_seconds
+
+    def record_invalidation(self, count):
+        with self._lock:
+            self.invalidations += count
+
+    @property
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self):
+        """Return a snapshot of the counters"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hit_ratio, 4),
+            'invalidations': self.invalidations,
+            'db_ms': round(self.db_seconds * 1000, 2),
+            'saved_db_ms': round(self.saved_seconds * 1000, 2),
+        }
+
+
+class QueryCache:
+    """Caches ORM SELECT results and invalidates them per table on commit"""
+
+    def __init__(self, prefix='qc'):
+        self.prefix = prefix
+        self.enabled = False
+        self.default_timeout = 300
+        self.stats = QueryCacheStats()
+        self._listening = False
+
+    def init_app(self, app):
+        """Read configuration and register SQLAlchemy session events"""
+        self.enabled = app.config.get('QUERY_CACHE_ENABLED', False)
+        self.default_timeout = app.config.get('QUERY_CACHE_TIMEOUT', 300)
+        app.extensions['query_cache'] = self
+
+        if not self._listening:
+            event.listen(Session, 'do_orm_execute', self._on_orm_execute)
+            event.listen(Session, 'after_flush', self._on_after_flush)
+            event.listen(Session, 'after_commit', self._on_after_commit)
+            event.listen(Session, 'after_rollback', self._on_after_rollback)
+            self._listening = True
+
+        @app.after_request
+        def _log_query_cache(response):
+            request_stats = g.pop('query_cache', None)
+            if request_stats and logger.isEnabledFor(logging.DEBUG):
+                logger.debug('query cache: %s, process: %s', request_stats, self.stats.as_dict())
+            return response
+
+    # ========================
+    # Table generations
+    # ========================
+    def _generation_key(self, table_name):
+        return f'{self.prefix}:gen:{table_name}'
+
+    def _generations(self, table_names):
+        """Fetch the current generation token of each table
+
+        Tokens are random rather than counters, so a token evicted from
+        the backend can never come back with a value older entries used.
+        """
+        keys = [self._generation_key(name) for name in table_names]
+        tokens = cache.get_many(*keys) if keys else []
+        generations = []
+        for key, token in zip(keys, tokens):
+            if token is None:
+                cache.add(key, uuid.uuid4().hex, timeout=0)
+                token = cache.get(key)
+            generations.append(token)
+        return generations
+
+    def invalidate(self, *table_names):
+        """Bump the generation of the given tables, dropping their entries"""
+        for name in table_names:
+            cache.set(self._generation_key(name), uuid.uuid4().hex, timeout=0)
+        self.stats.record_invalidation(len(table_names))
+
+    # ========================
+    # Cache keys
+    # ========================
+    def _make_key(self, session, statement, parameters, table_names):
+        dialect = session.get_bind().dialect
+        compiled = statement.compile(dialect=dialect)
+        params = dict(compiled.params)
+        if parameters:
+            params.update(parameters)
+
+        generations = self._generations(table_names)
+        material = '|'.join([
+            str(compiled),
+            repr(sorted(params.items(), key=lambda item: item[0])),
+            ','.join(f'{name}={gen}' for name, gen in zip(table_names, generations)),
+        ])
+        digest = hashlib.sha1(material.encode('utf-8')).hexdigest()
+        return f'{self.prefix}:q:{digest}'
+
+    # ========================
+    # Session events
+    # ========================
+    def _on_orm_execute(self, orm_context):
+        """Serve cached SELECT results, or run and store them"""
+        if orm_context.is_select:
+            option = orm_context.execution_options.get('query_cache')
+            if not self.enabled or not option or not has_app_context():
+                return None
+            if self._has_uncommitted_writes(orm_context.session):
+                # Cached results would miss this transaction's own writes,
+                # and its results must not be shared before it commits
+                return None
+            return self._execute_cached(orm_context, option)
+
+        # Bulk UPDATE/DELETE statements bypass the flush, record them here
+        if orm_context.is_update or orm_context.is_delete or orm_context.is_insert:
+            tables = {t.name for t in find_tables(orm_context.statement, include_crud=True)}
+            orm_context.session.info.setdefault(PENDING_TABLES_KEY, set()).update(tables)
+        return None
+
+    @staticmethod
+    def _has_uncommitted_writes(session):
+        """Whether the session has flushed or pending changes (autoflush would send them)"""
+        return bool(
+            session.info.get(PENDING_TABLES_KEY)
+            or session.new or session.dirty or session.deleted
+        )
+
+    def _execute_cached(self, orm_context, option):
+        statement = orm_context.statement
+        timeout = self.default_timeout if option is True else option
+        table_names = sorted({t.name for t in find_tables(statement, include_aliases=True)})
+        key = self._make_key(orm_context.session, statement, orm_context.parameters, table_names)
+
+        entry = cache.get(key)
+        if entry is not None:
+            frozen, saved_seconds = entry
+            self.stats.record_hit(saved_seconds)
+            self._record_request('hits')
+            return loading.merge_frozen_result(
+                orm_context.session, statement, frozen, load=False
+            )()
+
+        start = perf_counter()
+        frozen = orm_context.invoke_statement().freeze()
+        elapsed = perf_counter() - start
+        cache.set(key, (frozen, elapsed), timeout=timeout)
+        self.stats.record_miss(elapsed)
+        self._record_request('misses')
+        return frozen()
+
+    def _on_after_flush(self, session, flush_context):
+        """Remember every table written by this flush"""
+        tables = session.info.setdefault(PENDING_TABLES_KEY, set())
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+            mapper = getattr(obj, '__mapper__', None)
+            if mapper is None:
+                continue
+            tables.update(table.name for table in mapper.tables)
+            for relationship in mapper.relationships:
+                if relationship.secondary is not None:
+                    tables.add(relationship.secondary.name)
+
+    def _on_after_commit(self, session):
+        tables = session.info.pop(PENDING_TABLES_KEY, None)
+        if tables and self.enabled and has_app_context():
+            self.invalidate(*sorted(tables))
+
+    def _on_after_rollback(self, session):
+        session.info.pop(PENDING_TABLES_KEY, None)
+
+    @staticmethod
+    def _record_request(counter):
+        if has_request_context():
+            request_stats = g.setdefault('query_cache', {'hits': 0, 'misses': 0})
+            request_stats[counter] += 1
+
+
+query_cache = QueryCache()
+'''
+    with open(cache_path / 'query_cache.py', 'w', encoding='utf-8') as f:
+        f.write(query_cache_content)
+
+    click.echo("✅ Created cache/backend.py (Flask-Caching)")
+    click.echo("✅ Created cache/bytecode.py (shared Jinja bytecode cache)")
+    click.echo("✅ Created cache/fragments.py ({% cache %} template tag)")
+    click.echo("✅ Created cache/query_cache.py (table-generation invalidation)")
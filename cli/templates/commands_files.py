@@ -0,0 +1,355 @@
+"""Commands files generator - custom Flask CLI command groups"""
+import click
+
+
+def create(commands_path):
+    """Create commands directory files registered on the Flask CLI"""
+
+    # ========================
+    # commands/__init__.py
+    # ========================
+    init_content = '''"""Custom Flask CLI commands for FlaskMeridian app
+
+Available commands:
+- flask templates compile    Precompile all templates into the bytecode cache
+- flask export MODEL         Stream a table to NDJSON or CSV
+- flask shards status|plan|move|rebalance
+                             Inspect and rebalance the hash shards
+- flask partitions status|maintain
+                             Create and expire time-range partitions
+- flask db maintain          ANALYZE/VACUUM the databases (schedule nightly)
+- flask db advise            EXPLAIN the hot statements, suggest missing indexes
+"""
+from .database import db_cli
+from .export import export_command
+from .partitions import partitions_cli
+from .shards import shards_cli
+from .templates import templates_cli
+
+
+def register_commands(app):
+    """Register custom command groups on the Flask CLI"""
+    app.cli.add_command(templates_cli)
+    app.cli.add_command(export_command)
+    app.cli.add_command(shards_cli)
+    app.cli.add_command(partitions_cli)
+    app.cli.add_command(db_cli)
+'''
+    with open(commands_path / '__init__.py', 'w', encoding='utf-8') as f:
+        f.write(init_content)
+
+    # ========================
+    # commands/templates.py
+    # ========================
+    templates_content = '''"""Template commands"""
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from cache.bytecode import compile_templates
+
+templates_cli = AppGroup('templates', help='Template utilities.')
+
+
+@templates_cli.command('compile')
+def compile_command():
+    """Precompile all templates into the Jinja bytecode cache"""
+    compiled, failed = compile_templates(current_app)
+
+    for name, error in failed.items():
+        click.echo(f"⚠️  {name}: {error}", err=True)
+
+    cache_dir = current_app.jinja_env.bytecode_cache.directory
+    click.echo(f"✅ Compiled {len(compiled)} templates into {cache_dir}")
+'''
+    with open(commands_path / 'templates.py', 'w', encoding='utf-8') as f:
+        f.write(templates_content)
+
+    # ========================
+    # commands/export.py
+    # ========================
+    export_content = '''"""Export command"""
+import sys
+
+import click
+from flask.cli import with_appcontext
+
+from db import db
+from services.export_service import FORMATS, ExportService
+
+
+def _find_model(name):
+    """Look up a mapped model by class or table name (case-insensitive)"""
+    for mapper in db.Model.registry.mappers:
+        model = mapper.class_
+        if name.lower() in (model.__name__.lower(), model.__tablename__.lower()):
+            return model
+    raise click.BadParameter(f"No model named '{name}'", param_hint='MODEL')
+
+
+@click.command('export')
+@click.argument('model_name', metavar='MODEL')
+@click.option('--format', 'fmt', type=click.Choice(sorted(FORMATS)), default='ndjson', show_default=True)
+@click.option('--fields', help='Comma-separated columns to export (default: all public columns)')
+@click.option('--gzip', is_flag=True, help='Compress the output with gzip')
+@click.option('--batch-size', type=int, default=1000, show_default=True, help='Rows per cursor fetch')
+@click.option('-o', '--output', type=click.Path(dir_okay=False), help='Output file (default: stdout)')
+@with_appcontext
+def export_command(model_name, fmt, fields, gzip, batch_size, output):
+    """Stream a table to NDJSON or CSV in constant memory"""
+    model = _find_model(model_name)
+    field_list = [name.strip() for name in fields.split(',')] if fields else None
+
+    try:
+        blocks = ExportService.stream(model, fmt, fields=field_list, gzip=gzip, batch_size=batch_size)
+        if output:
+            with open(output, 'wb') as f:
+                for block in blocks:
+                    f.write(block)
+            click.echo(f"✅ Exported {model.__tablename__} to {output}", err=True)
+        else:
+            for block in blocks:
+                sys.stdout.buffer.write(block)
+            sys.stdout.buffer.flush()
+    except ValueError as e:
+        raise click.UsageError(str(e))
+'''
+    with open(commands_path / 'export.py', 'w', encoding='utf-8') as f:
+        f.write(export_content)
+
+    # ========================
+    # commands/shards.py
+    # ========================
+    shards_content = '''"""Shard commands (hash sharding with DATABASE_SHARD_URLS)"""
+import click
+from flask.cli import AppGroup
+
+from db.sharding import shards
+
+shards_cli = AppGroup('shards', help='Inspect and rebalance the hash shards.')
+
+
+def _require_shards():
+    if not shards.enabled:
+        raise click.UsageError('Sharding is off: set DATABASE_SHARD_URLS')
+
+
+def _print_moves(moves):
+    for start, end, source, target in moves:
+        click.echo(f"  slots {start}-{end} ({end - start + 1}): {source} -> {target}")
+
+
+@shards_cli.command('status')
+def status_command():
+    """Show the slots and rows held by each shard"""
+    _require_shards()
+    shards.reload()
+    slots, moving = {}, []
+    for start, end, shard, state in shards.map.rows:
+        slots[shard] = slots.get(shard, 0) + end - start + 1
+        if state != 'active':
+            moving.append(f"{start}-{end}")
+
+    for name, tables in shards.counts().items():
+        share = slots.get(name, 0) / shards.slots
+        rows = ', '.join(f"{table}={count}" for table, count in tables.items()) or 'no sharded tables'
+        click.echo(f"{name}: {slots.get(name, 0)} slots ({share:.1%}), {rows}")
+    for name in sorted(set(slots) - set(shards.engines)):
+        click.echo(f"⚠️  {name} owns {slots[name]} slots but is not in DATABASE_SHARD_URLS", err=True)
+    if moving:
+        click.echo(f"⚠️  Moving: {', '.join(moving)}", err=True)
+
+
+@shards_cli.command('plan')
+def plan_command():
+    """List the moves that give the configured shards their share of slots"""
+    _require_shards()
+    moves = shards.plan()
+    if not moves:
+        click.echo("✅ The shard map matches DATABASE_SHARD_URLS")
+        return
+    click.echo(f"{len(moves)} moves:")
+    _print_moves(moves)
+
+
+@shards_cli.command('move')
+@click.argument('slots', metavar='START-END')
+@click.argument('target')
+@click.option('--batch-size', type=int, default=1000, show_default=True, help='Rows copied per statement')
+def move_command(slots, target, batch_size):
+    """Move a slot range (and its rows) to the TARGET shard"""
+    _require_shards()
+    try:
+        start, end = (int(part) for part in slots.split('-'))
+    except ValueError:
+        raise click.BadParameter('expected START-END, e.g. 0-255', param_hint='START-END')
+    if not 0 <= start <= end < shards.slots:
+        raise click.BadParameter(f'slots go from 0 to {shards.slots - 1}', param_hint='START-END')
+    if target not in shards.engines:
+        raise click.BadParameter(f"unknown shard '{target}'", param_hint='TARGET')
+
+    moves = shards.moves_to(start, end, target)
+    _print_moves(moves)
+    moved = shards.move(moves, batch_size=batch_size, echo=click.echo)
+    click.echo(f"✅ Moved {moved} rows")
+
+
+@shards_cli.command('rebalance')
+@click.option('--batch-size', type=int, default=1000, show_default=True, help='Rows copied per statement')
+@click.option('--yes', is_flag=True, help='Do not ask for confirmation')
+def rebalance_command(batch_size, yes):
+    """Move slots so that every configured shard gets its share (after adding a shard)"""
+    _require_shards()
+    moves = shards.plan()
+    if not moves:
+        click.echo("✅ Nothing to move")
+        return
+    _print_moves(moves)
+    if not yes:
+        click.confirm(f"Move {len(moves)} slot ranges?", abort=True)
+    moved = shards.move(moves, batch_size=batch_size, echo=click.echo)
+    click.echo(f"✅ Moved {moved} rows")
+'''
+    with open(commands_path / 'shards.py', 'w', encoding='utf-8') as f:
+        f.write(shards_content)
+
+    # ========================
+    # commands/partitions.py
+    # ========================
+    partitions_content = '''"""Partition commands (PartitionedModel tables on PostgreSQL)"""
+import click
+from flask.cli import AppGroup
+
+from db.partitioning import partitions
+
+partitions_cli = AppGroup('partitions', help='Create and expire the partitions of PartitionedModel tables.')
+
+
+@partitions_cli.command('status')
+def status_command():
+    """List the attached partitions of every partitioned table"""
+    tables = partitions.tables()
+    if not tables:
+        click.echo("No partitioned tables (PartitionedModel on a PostgreSQL database)")
+        return
+    for table, engine in tables:
+        settings = table.info['partitioning']
+        with engine.connect() as connection:
+            attached = partitions.partitions(connection, table)
+        retention = settings['retention']
+        keep = 'all' if retention is None else f"{retention} + current, then {settings['expire']}"
+        click.echo(f"{table.name}: {len(attached)} {settings['interval']} partitions (keep {keep})")
+        for name in sorted(attached):
+            click.echo(f"  {name}")
+
+
+@partitions_cli.command('maintain')
+@click.option('--now', type=click.DateTime(), default=None,
+              help='Pretend the database clock is at this time (default LOCALTIMESTAMP)')
+def maintain_command(now):
+    """Create upcoming partitions and detach or drop expired ones (run daily)"""
+    for table, changes in partitions.maintain(now):
+        for name in changes['created']:
+            click.echo(f"✅ Created {name}")
+        for name in changes['expired']:
+            click.echo(f"🗑️  Expired {name}")
+        if not changes['created'] and not changes['expired']:
+            click.echo(f"✅ {table} is up to date")
+'''
+    with open(commands_path / 'partitions.py', 'w', encoding='utf-8') as f:
+        f.write(partitions_content)
+
+    # ========================
+    # commands/database.py
+    # ========================
+    database_content = '''"""Database maintenance commands (ANALYZE/VACUUM and the index advisor)"""
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from db import advisor, maintenance
+from db.database import db, is_read_bind
+
+db_cli = AppGroup('db', help='Database maintenance and index advice.')
+
+
+def _shorten(statement, limit=160):
+    statement = ' '.join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + '...'
+
+
+@db_cli.command('maintain')
+@click.option('--vacuum', is_flag=True, help='VACUUM every table (SQLite: the whole file), bloated or not')
+@click.option('--max-dead-ratio', type=float, default=0.2, show_default=True,
+              help='PostgreSQL: VACUUM tables with more dead rows than this share of live rows')
+@click.option('--max-stale-ratio', type=float, default=0.1, show_default=True,
+              help='PostgreSQL: ANALYZE tables with more changed rows than this share since the last analyze')
+@click.option('--max-free-ratio', type=float, default=0.25, show_default=True,
+              help='SQLite: VACUUM when free pages exceed this share of the file')
+@click.option('--dry-run', is_flag=True, help='Only print what would run')
+def maintain_command(vacuum, max_dead_ratio, max_stale_ratio, max_free_ratio, dry_run):
+    """ANALYZE and VACUUM every writable database (schedule it nightly)"""
+    for key, engine in db.engines.items():
+        if is_read_bind(key):
+            continue
+        click.echo(f"{key or 'default'} ({engine.dialect.name}):")
+        actions = maintenance.maintain(
+            engine, dry_run=dry_run, vacuum=vacuum, max_dead_ratio=max_dead_ratio,
+            max_stale_ratio=max_stale_ratio, max_free_ratio=max_free_ratio,
+        )
+        for statement, reason in actions:
+            click.echo(f"  {statement:<45} {reason}")
+        if not actions:
+            click.echo("  ✅ Nothing to do")
+    if dry_run:
+        click.echo("Dry run: nothing was executed")
+
+
+@db_cli.command('advise')
+@click.option('--limit', type=int, default=20, show_default=True, help='Hot statements to EXPLAIN')
+@click.option('--plans', is_flag=True, help='Print the plan of every statement')
+@click.option('--create', is_flag=True, help='Create the suggested indexes')
+def advise_command(limit, plans, create):
+    """EXPLAIN the hot statements and suggest missing indexes"""
+    hot_dir = current_app.config.get('SQL_HOT_DIR')
+    advice = advisor.advise(db.engine, hot_dir=hot_dir, limit=limit)
+
+    if advice.explained:
+        click.echo(f"Hot statements ({len(advice.explained)}):")
+    else:
+        click.echo(f"No hot statements captured yet: serve some traffic with SQL_INSTRUMENTATION "
+                   f"on and SQL_HOT_DIR set (now {hot_dir or 'unset'})")
+    for number, explained in enumerate(advice.explained, start=1):
+        click.echo(f"{number:>3}. {explained.calls} calls, {explained.seconds * 1000:.1f} ms: "
+                   f"{_shorten(explained.statement)}")
+        if explained.error:
+            click.echo(f"     ⚠️  not explained: {_shorten(explained.error, 100)}")
+        elif explained.full_scans:
+            click.echo(f"     full scan of {', '.join(sorted(explained.full_scans))}")
+        if plans:
+            for line in explained.plan:
+                click.echo(f"     | {line}")
+
+    click.echo("")
+    if not advice.suggestions:
+        click.echo("✅ No missing indexes found")
+    for suggestion in advice.suggestions:
+        name = advisor.index_name(suggestion.table, suggestion.columns)
+        columns = ', '.join(suggestion.columns)
+        click.echo(f"💡 {name} on {suggestion.table} ({columns}): {'; '.join(suggestion.reasons)}")
+        if create:
+            advisor.create_index(db.engine, suggestion)
+            click.echo(f"   ✅ Created. Also declare it on the model: "
+                       f"db.Index('{name}', {', '.join(repr(column) for column in suggestion.columns)})")
+
+    for table, name, columns in advice.unused:
+        click.echo(f"❔ {name} on {table} ({', '.join(columns)}) is not used by the captured statements")
+'''
+    with open(commands_path / 'database.py', 'w', encoding='utf-8') as f:
+        f.write(database_content)
+
+    click.echo("✅ Created commands/__init__.py and commands/templates.py")
+    click.echo("✅ Created commands/export.py (flask export)")
+    click.echo("✅ Created commands/shards.py (flask shards)")
+    click.echo("✅ Created commands/partitions.py (flask partitions)")
+    click.echo("✅ Created commands/database.py (flask db maintain / advise)")
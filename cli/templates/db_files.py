@@ -15,8 +15,12 @@ def create(db_path):
     db_init_content = '''"""Database module for FlaskMeridian app"""
 from .database import db
 from .models import BaseModel
+from .replicas import read_only
+from .routing import use_writer
+from .sharding import shards
+from .sqlite import write_queue
 
-__all__ = ['db', 'BaseModel']
+__all__ = ['db', 'BaseModel', 'read_only', 'shards', 'use_writer', 'write_queue']
 '''
     with open(db_path / '__init__.py', 'w', encoding='utf-8') as f:
         f.write(db_init_content)
@@ -26,27 +30,1932 @@ __all__ = ['db', 'BaseModel']
     # ========================
     database_content = '''"""Database initialization and configuration"""
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
 
-db = SQLAlchemy()
+from . import partitioning, replicas, routing, sharding, sqlite
+
+# RoutingSession only routes reads once single-writer SQLite mode or replicas set a read router
+db = SQLAlchemy(session_options={'class_': routing.RoutingSession})
+
+
+def _pool_options(app):
+    """Engine pool options from DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT
+
+    Behind PgBouncer (DB_PGBOUNCER=True) the bouncer holds the database
+    connections. Workers then keep at most DB_POOL_SIZE connections to it,
+    with no overflow, and DB_POOL_SIZE=0 switches to NullPool.
+    """
+    url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'):
+        return {}  # In-memory SQLite uses a single static connection
+    if app.config.get('DB_PGBOUNCER'):
+        options = {'poolclass': NullPool} if not app.config.get('DB_POOL_SIZE') else {
+            'pool_size': app.config['DB_POOL_SIZE'],
+            'max_overflow': 0,
+            'pool_timeout': app.config.get('DB_POOL_TIMEOUT', 30),
+        }
+        if url.get_driver_name() == 'psycopg':
+            # Transaction pooling hands each transaction any server connection (psycopg2 never prepares)
+            options['connect_args'] = {'prepare_threshold': None}
+        return options
+    return {
+        'pool_size': app.config.get('DB_POOL_SIZE', 5),
+        'max_overflow': app.config.get('DB_MAX_OVERFLOW', 10),
+        'pool_timeout': app.config.get('DB_POOL_TIMEOUT', 30),
+    }
+
+
+def is_read_bind(key):
+    """Binds reading the default database (they have no tables of their own)"""
+    return key == sqlite.READER_BIND or replicas.is_replica_bind(key)
 
 
 def init_db(app):
     """Initialize database with Flask app"""
+    single_writer = sqlite.single_writer_enabled(app)
+    if single_writer:
+        sqlite.configure(app)
+    with_replicas = bool(replicas.replica_urls(app))
+    if with_replicas:
+        replicas.configure(app)
+    with_shards = bool(sharding.shard_urls(app))
+    if with_shards:
+        sharding.configure(app)
+
+    options = app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    for key, value in _pool_options(app).items():
+        options.setdefault(key, value)
     db.init_app(app)
 
     with app.app_context():
-        db.create_all()
+        if single_writer:
+            sqlite.install(app, db.engines)
+        if with_replicas:
+            replicas.install(app, db.engines)
+        sqlite.write_queue.init_app(app, db.engine)
+        db.create_all(bind_key=[key for key in db.metadatas if key in db.engines and not is_read_bind(key)])
+        if with_shards:
+            sharding.shards.init_app(app, db.engines)
+            if sharding.SHARDED_BIND in db.metadatas:
+                sharding.shards.create_tables(db.metadatas[sharding.SHARDED_BIND])
+        partitioning.partitions.init_app(app, db.metadatas, db.engines)
 '''
     with open(db_path / 'database.py', 'w', encoding='utf-8') as f:
         f.write(database_content)
 
+    # ========================
+    # db/sqlite.py
+    # ========================
+    sqlite_content = '''"""Single-writer SQLite mode (opt-in with SQLITE_SINGLE_WRITER=True)
+
+Several gunicorn workers writing to one SQLite file contend on its lock,
+and a transaction that read before writing cannot wait for the lock at
+all: it fails with ``database is locked``. With this mode on:
+
+- The database runs in WAL mode, so readers never block the writer.
+- Reads go through a separate read-only pool (the ``reader`` bind).
+- Writes go through a single writer connection per worker, which
+  serializes them inside the process. Each write transaction starts with
+  BEGIN IMMEDIATE, so it takes the file lock before doing any work. While
+  another process holds the lock, it waits busy_timeout and retries with
+  backoff; it never fails half way through.
+- ``write_queue`` batches small writes submitted from many threads into
+  one transaction.
+
+db.session (db/routing.py) sends queries to the reader until the
+transaction writes, then to the writer until commit or rollback. Call
+``use_writer()`` before a read-modify-write to read on the writer too.
+
+Usage:
+    from db import write_queue
+    write_queue.execute(update(Counter.__table__).values(hits=Counter.hits + 1))  # waits
+    write_queue.submit(insert(AuditLog.__table__).values(event='login'))          # returns a Future
+"""
+import logging
+import os
+import queue
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from .routing import WRITER_KEY, note_write, set_read_router
+
+logger = logging.getLogger(__name__)
+
+READER_BIND = 'reader'
+READ_PREFIXES = ('SELECT', 'PRAGMA', 'EXPLAIN')
+# Maintenance statements (flask db maintain) take their own locks; VACUUM refuses to run in a transaction
+MAINTENANCE_PREFIXES = ('ANALYZE', 'VACUUM')
+
+
+def single_writer_enabled(app):
+    """Whether the app uses single-writer mode on a file-backed SQLite database"""
+    if not app.config.get('SQLITE_SINGLE_WRITER'):
+        return False
+    url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+
+def configure(app):
+    """Add the read-only ``reader`` bind and size the writer pool (before db.init_app)"""
+    url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    database = url.database[5:] if url.query.get('uri') else url.database
+    reader_url = url.set(database=f'file:{database}', query={'mode': 'ro', 'uri': 'true'})
+
+    options = app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    options['pool_size'] = 1
+    options['max_overflow'] = 0
+
+    binds = app.config.setdefault('SQLALCHEMY_BINDS', {})
+    binds[READER_BIND] = {
+        'url': reader_url.render_as_string(hide_password=False),
+        'pool_size': app.config.get('DB_POOL_SIZE', 5),
+        'max_overflow': app.config.get('DB_MAX_OVERFLOW', 10),
+    }
+
+
+def install(app, engines):
+    """Set up WAL, busy_timeout and BEGIN IMMEDIATE on the engines (after db.init_app)"""
+    busy_timeout = int(app.config.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    retries = int(app.config.get('SQLITE_WRITE_RETRIES', 3))
+    writer, reader = engines[None], engines[READER_BIND]
+
+    @event.listens_for(writer, 'connect')
+    def on_writer_connect(dbapi_connection, connection_record):
+        # Transactions are opened by begin_immediate(), not by the driver
+        dbapi_connection.isolation_level = None
+        dbapi_connection.execute('PRAGMA journal_mode=WAL')
+        dbapi_connection.execute('PRAGMA synchronous=NORMAL')
+        dbapi_connection.execute(f'PRAGMA busy_timeout={busy_timeout}')
+
+    @event.listens_for(writer, 'before_cursor_execute')
+    def on_writer_execute(connection, cursor, statement, parameters, context, executemany):
+        dbapi_connection = connection.connection.dbapi_connection
+        if not dbapi_connection.in_transaction and not statement.lstrip().upper().startswith(
+                READ_PREFIXES + MAINTENANCE_PREFIXES):
+            begin_immediate(dbapi_connection, retries)
+
+    @event.listens_for(reader, 'connect')
+    def on_reader_connect(dbapi_connection, connection_record):
+        dbapi_connection.execute('PRAGMA query_only=ON')
+        dbapi_connection.execute(f'PRAGMA busy_timeout={busy_timeout}')
+
+    # Switch the file to WAL before any reader opens it
+    with writer.connect() as connection:
+        connection.exec_driver_sql('SELECT 1')
+    set_read_router(app, ReaderRouter(reader))
+
+
+def begin_immediate(dbapi_connection, retries=3):
+    """Take the database write lock, retrying with jittered backoff while it is busy"""
+    for attempt in range(retries + 1):
+        try:
+            dbapi_connection.execute('BEGIN IMMEDIATE')
+            return
+        except sqlite3.OperationalError as e:
+            if attempt == retries or 'locked' not in str(e) and 'busy' not in str(e):
+                raise
+            delay = min(0.05 * 2 ** attempt, 1.0) * random.uniform(0.5, 1.5)
+            logger.warning('SQLite write lock busy (attempt %s of %s), retrying in %.0f ms',
+                           attempt + 1, retries + 1, delay * 1000)
+            time.sleep(delay)
+
+
+class ReaderRouter:
+    """Read router sending every read to the reader bind (see db/routing.py)"""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def reader(self, session):
+        return self.engine
+
+    def on_write(self, session):
+        pass
+
+
+class WriteQueue:
+    """Run small writes from many threads in shared transactions
+
+    Jobs are Core DML statements (their rowcount is the result) or
+    callables taking a Connection. A background thread per process takes
+    up to SQLITE_BATCH_SIZE jobs that arrive within SQLITE_BATCH_WINDOW_MS
+    and runs them in one transaction, each inside a SAVEPOINT, so one
+    failing job does not undo the others. Tables written by statement jobs
+    are invalidated in the query cache; callables invalidate their own.
+
+    Without single-writer mode each job runs immediately in its own
+    transaction.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.engine = None
+        self.batching = False
+        self.batch_size = 100
+        self.window = 0.002
+        self._queue = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app, engine):
+        self.app = app
+        self.engine = engine
+        self.batching = single_writer_enabled(app)
+        self.batch_size = int(app.config.get('SQLITE_BATCH_SIZE', 100))
+        self.window = float(app.config.get('SQLITE_BATCH_WINDOW_MS', 2)) / 1000
+        app.extensions['write_queue'] = self
+
+    def submit(self, job, *args):
+        """Queue a write job; return a Future of its result"""
+        note_write()
+        future = Future()
+        if not self.batching:
+            try:
+                self._run_batch([(job, args, future)])
+            except Exception:
+                pass  # Already set on the future
+            return future
+        self._ensure_thread()
+        self._queue.put((job, args, future))
+        return future
+
+    def execute(self, job, *args, timeout=30):
+        """Run a write job and wait for its result
+
+        Commit the session first if it has written: it holds the writer,
+        which the batch needs.
+        """
+        if self.batching:
+            from .database import db
+            if db.session.info.get(WRITER_KEY):
+                raise RuntimeError('Commit the session before write_queue.execute(); it holds the writer')
+        return self.submit(job, *args).result(timeout=timeout)
+
+    def _ensure_thread(self):
+        # The queue and thread belong to the process that started them (gunicorn forks)
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.SimpleQueue()
+                threading.Thread(target=self._run, name='sqlite-writer', daemon=True).start()
+                self._pid = os.getpid()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._run_batch(batch)
+            except Exception:
+                logger.exception('SQLite write batch of %s jobs failed', len(batch))
+
+    def _run_batch(self, batch):
+        """Run jobs in one transaction and resolve their futures"""
+        results, tables = [], set()
+        try:
+            with self.engine.connect() as connection:
+                with connection.begin():
+                    for job, args, future in batch:
+                        if len(batch) == 1:
+                            # No SAVEPOINT needed: a failure rolls the transaction back
+                            results.append((future, self._run_job(connection, job, args), None))
+                        else:
+                            try:
+                                with connection.begin_nested():
+                                    results.append((future, self._run_job(connection, job, args), None))
+                            except Exception as e:
+                                results.append((future, None, e))
+                                continue
+                        table = getattr(job, 'table', None)
+                        if table is not None:
+                            tables.add(table.name)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            raise
+
+        if tables:
+            self._invalidate(tables)
+        for future, result, error in results:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    @staticmethod
+    def _run_job(connection, job, args):
+        if callable(job):
+            return job(connection, *args)
+        return connection.execute(job, *args).rowcount
+
+    def _invalidate(self, tables):
+        from cache import query_cache
+        if query_cache.enabled:
+            with self.app.app_context():
+                query_cache.invalidate(*sorted(tables))
+
+
+write_queue = WriteQueue()
+'''
+    with open(db_path / 'sqlite.py', 'w', encoding='utf-8') as f:
+        f.write(sqlite_content)
+
+    # ========================
+    # db/routing.py
+    # ========================
+    routing_content = '''"""Read/write routing for db.session
+
+RoutingSession sends each statement of a model on the default bind either
+to the primary or to a read engine chosen by the app's read router:
+- db/sqlite.py registers the read-only SQLite pool (single-writer mode)
+- db/replicas.py registers the PostgreSQL read replicas
+
+Without a router every statement goes to the primary, as with a plain
+Flask-SQLAlchemy session. Once a transaction writes (a flush, or an
+INSERT / UPDATE / DELETE / text() statement) it stays on the primary until
+commit or rollback, so it sees its own changes. Call ``use_writer()``
+before a read-modify-write to read on the primary too.
+"""
+from flask import current_app, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql.elements import TextClause
+
+WRITER_KEY = 'db_writer'
+WROTE_KEY = 'db_wrote'
+READER_KEY = 'db_reader'
+
+
+def set_read_router(app, router):
+    """Register the object choosing read engines for the app's sessions
+
+    The router provides ``reader(session)``, returning an engine or None
+    for the primary, and ``on_write(session)``, called when a transaction
+    first writes. It may keep per-transaction state in
+    ``session.info[READER_KEY]``, which is cleared at commit or rollback.
+    """
+    app.extensions['db_read_router'] = router
+
+
+class RoutingSession(Session):
+    """Session sending reads to the app's read router until it writes"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        router = current_app.extensions.get('db_read_router')
+        if router is None or bind is not None or engine is not self._db.engines.get(None):
+            return engine
+        writing = self._flushing or _is_write(clause)
+        if writing and not self.info.get(WROTE_KEY):
+            self.info[WROTE_KEY] = True
+            router.on_write(self)
+        if writing or self.info.get(WRITER_KEY):
+            self.info[WRITER_KEY] = True
+            return engine
+        return router.reader(self) or engine
+
+
+def _is_write(clause):
+    return getattr(clause, 'is_dml', False) or isinstance(clause, TextClause)
+
+
+@event.listens_for(RoutingSession, 'after_transaction_end')
+def _reset_routing(session, transaction):
+    if transaction.parent is None:
+        for key in (WRITER_KEY, WROTE_KEY, READER_KEY):
+            session.info.pop(key, None)
+
+
+def note_write(session=None):
+    """Tell the read router about a write made outside db.session (write_queue)"""
+    router = current_app.extensions.get('db_read_router') if has_app_context() else None
+    if router is not None:
+        router.on_write(session)
+
+
+def use_writer(session=None):
+    """Route the rest of this transaction's reads to the primary (read-modify-write)"""
+    if session is None:
+        from .database import db
+        session = db.session
+    session.info[WRITER_KEY] = True
+'''
+    with open(db_path / 'routing.py', 'w', encoding='utf-8') as f:
+        f.write(routing_content)
+
+    # ========================
+    # db/replicas.py
+    # ========================
+    replicas_content = '''"""PostgreSQL read replicas (opt-in with DATABASE_REPLICA_URLS)
+
+Each URL in the comma-separated DATABASE_REPLICA_URLS becomes a bind
+(``replica_1``, ``replica_2``, ...). db.session then reads from a replica
+when the data may be slightly behind the primary:
+
+- inside GET / HEAD / OPTIONS requests
+- inside functions decorated with ``@read_only()`` (or a
+  ``with read_only():`` block), in any request or outside of one
+
+Everything else, including every statement of a transaction after it
+writes, goes to the primary. Replicas are used round-robin, one per
+transaction. A request that writes sets a short-lived cookie, and the
+client's next requests read from the primary until it expires, so users
+see their own changes despite replication lag.
+
+A replica is ejected for REPLICA_EJECT_SECONDS when a connection to it
+fails or when its replay lag goes above REPLICA_MAX_LAG_SECONDS (checked
+every REPLICA_CHECK_SECONDS). With every replica ejected, reads go to the
+primary.
+
+Usage:
+    @read_only()
+    def monthly_report():
+        return User.query.filter(User.created_at >= start).count()
+"""
+import itertools
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+from flask import g, has_request_context, request
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+
+from . import routing
+
+logger = logging.getLogger(__name__)
+
+REPLICA_PREFIX = 'replica_'
+STICKY_COOKIE = 'db_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Seconds the replica is behind the primary (0 when it has replayed all it received)
+LAG_QUERY = text(
+    'SELECT CASE WHEN NOT pg_is_in_recovery() '
+    'OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END'
+)
+
+_read_only = ContextVar('db_read_only', default=False)
+
+
+def replica_urls(app):
+    """Replica URLs from DATABASE_REPLICA_URLS"""
+    urls = app.config.get('DATABASE_REPLICA_URLS') or ''
+    return [url.strip() for url in urls.split(',') if url.strip()]
+
+
+def is_replica_bind(key):
+    return isinstance(key, str) and key.startswith(REPLICA_PREFIX)
+
+
+def configure(app):
+    """Add a bind per replica URL (before db.init_app)"""
+    binds = app.config.setdefault('SQLALCHEMY_BINDS', {})
+    for number, url in enumerate(replica_urls(app), start=1):
+        options = {
+            'url': url,
+            'pool_size': app.config.get('DB_POOL_SIZE', 5),
+            'max_overflow': app.config.get('DB_MAX_OVERFLOW', 10),
+            'pool_timeout': app.config.get('DB_POOL_TIMEOUT', 30),
+            'pool_pre_ping': True,
+        }
+        if make_url(url).get_backend_name() == 'postgresql':
+            # Fail fast on a dead replica instead of hanging the request
+            options['connect_args'] = {'connect_timeout': 2}
+        binds[f'{REPLICA_PREFIX}{number}'] = options
+
+
+def install(app, engines):
+    """Route reads to the replica binds (after db.init_app)"""
+    keys = sorted((key for key in engines if is_replica_bind(key)),
+                  key=lambda key: int(key[len(REPLICA_PREFIX):]))
+    replica_set = ReplicaSet(
+        [Replica(key, engines[key]) for key in keys],
+        eject_seconds=float(app.config.get('REPLICA_EJECT_SECONDS', 30)),
+        max_lag=float(app.config.get('REPLICA_MAX_LAG_SECONDS', 10)),
+        check_seconds=float(app.config.get('REPLICA_CHECK_SECONDS', 5)),
+    )
+    router = ReplicaRouter(replica_set, sticky_seconds=int(app.config.get('REPLICA_STICKY_SECONDS', 5)))
+    # Replicas take precedence over the single-writer SQLite reader
+    routing.set_read_router(app, router)
+    app.extensions['replicas'] = replica_set
+    app.after_request(router.set_sticky_cookie)
+
+
+@contextmanager
+def read_only():
+    """Let db.session read from a replica (``@read_only()`` or ``with read_only():``)
+
+    Wrap regular functions only: a generator runs after the decorator returns.
+    """
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+# ========================
+# Health and selection
+# ========================
+class Replica:
+    """One replica engine and its health"""
+
+    def __init__(self, key, engine):
+        self.key = key
+        self.engine = engine
+        self.is_postgres = engine.dialect.name == 'postgresql'
+        self.ejected_until = 0.0
+        self.checked_at = None
+        self.lag = None
+        self.lock = threading.Lock()
+
+
+class ReplicaSet:
+    """Round-robin over the replicas that are up and not lagging"""
+
+    def __init__(self, replicas, eject_seconds=30, max_lag=10, check_seconds=5):
+        self.replicas = replicas
+        self.eject_seconds = eject_seconds
+        self.max_lag = max_lag
+        self.check_seconds = check_seconds
+        self._counter = itertools.count()
+        for replica in replicas:
+            event.listen(replica.engine, 'handle_error', self._on_error(replica))
+
+    def pick(self):
+        """Return the next healthy replica, or None to read from the primary"""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._counter) % len(self.replicas)]
+            if self.available(replica):
+                return replica
+        return None
+
+    def available(self, replica):
+        now = monotonic()
+        if now < replica.ejected_until:
+            return False
+        if replica.checked_at is None or now - replica.checked_at >= self.check_seconds:
+            # One thread checks; the others go by the last result meanwhile
+            if replica.lock.acquire(blocking=replica.checked_at is None):
+                try:
+                    self._check(replica)
+                finally:
+                    replica.lock.release()
+        return monotonic() >= replica.ejected_until
+
+    def _check(self, replica):
+        try:
+            with replica.engine.connect() as connection:
+                if replica.is_postgres:
+                    replica.lag = float(connection.execute(LAG_QUERY).scalar() or 0)
+                else:
+                    connection.execute(text('SELECT 1'))
+                    replica.lag = 0.0
+        except Exception as e:
+            self.eject(replica, f'{type(e).__name__}: {e}')
+        else:
+            if replica.lag > self.max_lag:
+                self.eject(replica, f'replay lag {replica.lag:.1f}s')
+        finally:
+            replica.checked_at = monotonic()
+
+    def eject(self, replica, reason):
+        if monotonic() < replica.ejected_until:
+            return  # Already out (a failed check also raises handle_error)
+        replica.ejected_until = monotonic() + self.eject_seconds
+        logger.warning('Read replica %s ejected for %ss: %s', replica.key, self.eject_seconds, reason)
+
+    def _on_error(self, replica):
+        def on_error(context):
+            if context.is_disconnect or isinstance(context.sqlalchemy_exception, OperationalError):
+                self.eject(replica, type(context.original_exception).__name__)
+        return on_error
+
+    def as_dict(self):
+        """Health of each replica"""
+        now = monotonic()
+        return {
+            replica.key: {
+                'available': now >= replica.ejected_until,
+                'lag_seconds': replica.lag,
+                'ejected_for': round(max(replica.ejected_until - now, 0), 1),
+            }
+            for replica in self.replicas
+        }
+
+
+class ReplicaRouter:
+    """Read router for RoutingSession (see db/routing.py)"""
+
+    def __init__(self, replica_set, sticky_seconds=5):
+        self.replica_set = replica_set
+        self.sticky_seconds = sticky_seconds
+
+    def reader(self, session):
+        if not self._replicas_allowed():
+            return None
+        # Keep one replica per transaction unless it was ejected meanwhile
+        replica = session.info.get(routing.READER_KEY)
+        if replica is None or monotonic() < replica.ejected_until:
+            replica = self.replica_set.pick()
+            session.info[routing.READER_KEY] = replica
+        return replica.engine if replica is not None else None
+
+    def on_write(self, session):
+        if has_request_context():
+            g.db_wrote = True
+
+    @staticmethod
+    def _replicas_allowed():
+        if has_request_context():
+            if g.get('db_wrote') or STICKY_COOKIE in request.cookies:
+                return False
+            if request.method in SAFE_METHODS:
+                return True
+        return _read_only.get()
+
+    def set_sticky_cookie(self, response):
+        """Keep the client on the primary for a few seconds after it wrote"""
+        if g.get('db_wrote') and self.sticky_seconds > 0:
+            response.set_cookie(STICKY_COOKIE, '1', max_age=self.sticky_seconds,
+                                httponly=True, samesite='Lax', secure=request.is_secure)
+        return response
+'''
+    with open(db_path / 'replicas.py', 'w', encoding='utf-8') as f:
+        f.write(replicas_content)
+
+    # ========================
+    # db/sharding.py
+    # ========================
+    sharding_content = '''"""Hash sharding for models marked with ShardedMixin (opt-in with DATABASE_SHARD_URLS)
+
+Each URL in the comma-separated DATABASE_SHARD_URLS becomes a bind
+(``shard_1``, ``shard_2``, ...) holding the tables of every sharded model.
+A row lives on the shard that owns the hash slot of its shard key:
+slots split the 64-bit hash space into SHARD_SLOTS equal arcs.
+
+The shard map assigns ranges of slots to shards. It is stored in the
+``shard_ranges`` table of the primary database and first filled by a
+consistent-hash ring over the shard names, so adding a shard only takes
+over about 1/n of the slots. Workers reload it every SHARD_MAP_TTL
+seconds. ``flask shards`` moves slot ranges between shards (rebalancing).
+
+Sharded models are read and written through ``shards.session``, a
+SQLAlchemy ShardedSession:
+- new rows go to the shard of their key
+- queries filtering the shard key with == or IN go to the matching
+  shards, any other query to every shard (results are concatenated)
+- ``shards.fan_out()`` runs a query on every shard at once and merges
+  the results in order
+
+A commit touching several shards commits each shard in turn; it is not
+atomic across shards.
+
+Usage:
+    from db import shards
+    shards.session.add(Event(user_id=42, kind='login'))
+    shards.session.commit()
+    shards.session.scalars(select(Event).where(Event.user_id == 42)).all()
+    latest = shards.fan_out(select(Event).order_by(Event.created_at.desc()).limit(20),
+                            key=attrgetter('created_at'), reverse=True, limit=20)
+"""
+import bisect
+import hashlib
+import heapq
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
+
+from flask.globals import app_ctx
+from sqlalchemy import Column, Integer, MetaData, String, Table, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.sql import operators, visitors
+
+logger = logging.getLogger(__name__)
+
+SHARD_PREFIX = 'shard_'
+SHARDED_BIND = 'sharded'  # Bind key of the sharded models' metadata; it has no engine
+ACTIVE = 'active'
+MOVING = 'moving'
+
+# The shard map lives on the primary database
+shard_ranges = Table(
+    'shard_ranges', MetaData(),
+    Column('start_slot', Integer, primary_key=True),
+    Column('end_slot', Integer, nullable=False),
+    Column('shard', String(64), nullable=False),
+    Column('state', String(16), nullable=False, default=ACTIVE),
+)
+
+
+class ShardMoveInProgress(RuntimeError):
+    """Raised when writing a row whose slot range is being moved"""
+
+
+def shard_urls(app):
+    """Shard URLs from DATABASE_SHARD_URLS"""
+    urls = app.config.get('DATABASE_SHARD_URLS') or ''
+    return [url.strip() for url in urls.split(',') if url.strip()]
+
+
+def is_shard_bind(key):
+    return isinstance(key, str) and key.startswith(SHARD_PREFIX)
+
+
+def configure(app):
+    """Add a bind per shard URL (before db.init_app)"""
+    binds = app.config.setdefault('SQLALCHEMY_BINDS', {})
+    for number, url in enumerate(shard_urls(app), start=1):
+        binds[f'{SHARD_PREFIX}{number}'] = {
+            'url': url,
+            'pool_size': app.config.get('DB_POOL_SIZE', 5),
+            'max_overflow': app.config.get('DB_MAX_OVERFLOW', 10),
+            'pool_timeout': app.config.get('DB_POOL_TIMEOUT', 30),
+            'pool_pre_ping': True,
+        }
+
+
+def hash_key(value):
+    """Stable 64-bit hash of a shard key (the same in every process)"""
+    digest = hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+# ========================
+# Shard map
+# ========================
+class HashRing:
+    """Consistent hashing of slots onto shards, with virtual nodes
+
+    Each shard gets ``vnodes`` points on the 64-bit ring and owns the arcs
+    ending at them, so a new shard takes over about 1/n of the slots, in
+    contiguous ranges, from every other shard.
+    """
+
+    def __init__(self, shard_names, vnodes=64):
+        points = sorted((hash_key(f'{name}#{i}'), name) for name in shard_names for i in range(vnodes))
+        self._hashes = [point for point, _ in points]
+        self._names = [name for _, name in points]
+
+    def owner(self, slot, slots):
+        index = bisect.bisect(self._hashes, (slot << 64) // slots) % len(self._hashes)
+        return self._names[index]
+
+    def ranges(self, slots):
+        """[(start_slot, end_slot, shard)] covering every slot"""
+        return _runs([self.owner(slot, slots) for slot in range(slots)])
+
+
+def _runs(values, offset=0):
+    """[(start, end, value)] for each run of equal values, skipping None"""
+    runs, start = [], 0
+    for index in range(1, len(values) + 1):
+        if index == len(values) or values[index] != values[start]:
+            if values[start] is not None:
+                runs.append((start + offset, index - 1 + offset, values[start]))
+            start = index
+    return runs
+
+
+class ShardMap:
+    """Slot ranges and their owners, as stored in shard_ranges"""
+
+    def __init__(self, rows):
+        self.rows = sorted((row.start_slot, row.end_slot, row.shard, row.state) for row in rows)
+        self._starts = [row[0] for row in self.rows]
+
+    def lookup(self, slot):
+        """(shard, state) owning the slot"""
+        start, end, shard, state = self.rows[bisect.bisect(self._starts, slot) - 1]
+        if not start <= slot <= end:
+            raise LookupError(f'Slot {slot} is not in the shard map')
+        return shard, state
+
+    def slots(self, slots):
+        """(owner, state) of every slot, as a list"""
+        entries = [None] * slots
+        for start, end, shard, state in self.rows:
+            entries[start:end + 1] = [(shard, state)] * (end - start + 1)
+        return entries
+
+
+# ========================
+# Routing
+# ========================
+def _shard_key_values(statement, column):
+    """Values compared to the shard key column with == or IN in the WHERE clause
+
+    Returns None when the statement does not restrict the shard key.
+    """
+    values = None
+
+    def visit_binary(binary):
+        nonlocal values
+        for col, other in ((binary.left, binary.right), (binary.right, binary.left)):
+            if getattr(col, 'key', None) != column.key or getattr(col, 'table', None) is not column.table:
+                continue
+            value = getattr(other, 'effective_value', None)
+            if binary.operator is operators.eq and value is not None:
+                values = (values or []) + [value]
+            elif binary.operator is operators.in_op and isinstance(value, (list, tuple)):
+                values = (values or []) + list(value)
+
+    where = getattr(statement, 'whereclause', None)
+    if where is not None:
+        visitors.traverse(where, {}, {'binary': visit_binary})
+    return values
+
+
+class Shards:
+    """Shard engines, the shard map and the ShardedSession for sharded models"""
+
+    def __init__(self):
+        self.app = None
+        self.engines = {}
+        self.slots = 4096
+        self.vnodes = 64
+        self.map_ttl = 5.0
+        self._map = None
+        self._loaded_at = None
+        self._primary = None
+        self._session = None
+        self.metadata = None
+
+    @property
+    def enabled(self):
+        return bool(self.engines)
+
+    def init_app(self, app, engines):
+        """Set up the shard engines and the shard map (after db.init_app and create_all)"""
+        self.app = app
+        self.engines = {key: engines[key] for key in engines if is_shard_bind(key)}
+        self.slots = int(app.config.get('SHARD_SLOTS', 4096))
+        self.vnodes = int(app.config.get('SHARD_VNODES', 64))
+        self.map_ttl = float(app.config.get('SHARD_MAP_TTL', 5))
+        self._primary = engines[None]
+        app.extensions['shards'] = self
+
+        shard_ranges.create(self._primary, checkfirst=True)
+        self._seed_map()
+        self._session = scoped_session(
+            sessionmaker(
+                class_=ShardedSession,
+                shards=self.engines,
+                shard_chooser=self._choose_for_instance,
+                identity_chooser=self._choose_for_identity,
+                execute_chooser=self._choose_for_statement,
+            ),
+            scopefunc=lambda: id(app_ctx._get_current_object()),
+        )
+
+        @app.teardown_appcontext
+        def _remove_shard_session(exc):
+            self._session.remove()
+
+    def create_tables(self, metadata):
+        """Create the sharded models' tables on every shard"""
+        self.metadata = metadata
+        for engine in self.engines.values():
+            metadata.create_all(engine)
+
+    @property
+    def session(self):
+        """ShardedSession of the current app context"""
+        if not self.enabled:
+            raise RuntimeError('Sharding is off: set DATABASE_SHARD_URLS')
+        return self._session
+
+    # ========================
+    # Shard map
+    # ========================
+    def ring_ranges(self):
+        """Slot ranges the consistent-hash ring gives the configured shards"""
+        return HashRing(sorted(self.engines), self.vnodes).ranges(self.slots)
+
+    def _seed_map(self):
+        with self._primary.begin() as connection:
+            if connection.execute(select(shard_ranges.c.start_slot).limit(1)).first():
+                return
+            try:
+                connection.execute(shard_ranges.insert(), [
+                    {'start_slot': start, 'end_slot': end, 'shard': shard, 'state': ACTIVE}
+                    for start, end, shard in self.ring_ranges()
+                ])
+            except IntegrityError:
+                pass  # Another worker seeded it first
+
+    @property
+    def map(self):
+        """The shard map, reloaded every SHARD_MAP_TTL seconds"""
+        if self._loaded_at is None or monotonic() - self._loaded_at >= self.map_ttl:
+            self.reload()
+        return self._map
+
+    def reload(self):
+        with self._primary.connect() as connection:
+            self._map = ShardMap(connection.execute(select(shard_ranges)).all())
+        self._loaded_at = monotonic()
+
+    def slot_for(self, key):
+        return (hash_key(key) * self.slots) >> 64
+
+    def shard_for(self, key, for_write=False):
+        """Name of the shard holding rows with this shard key"""
+        shard, state = self.map.lookup(self.slot_for(key))
+        if for_write and state == MOVING:
+            raise ShardMoveInProgress(f'Shard key {key!r} is being moved off {shard}; retry shortly')
+        return shard
+
+    # ========================
+    # ShardedSession choosers
+    # ========================
+    def _key_column(self, mapper):
+        key = getattr(mapper.class_, '__shard_key__', None)
+        if key is None:
+            raise TypeError(f'{mapper.class_.__name__} is not a sharded model')
+        return mapper.columns[key]
+
+    def _choose_for_instance(self, mapper, instance, clause=None):
+        if instance is None:
+            raise ValueError('Pass a shard key to write sharded rows (bulk statements run per shard)')
+        return self.shard_for(getattr(instance, mapper.class_.__shard_key__), for_write=True)
+
+    def _choose_for_identity(self, mapper, primary_key, **kw):
+        # Ids are unique across shards but do not tell where a row lives
+        return sorted(self.engines)
+
+    def _choose_for_statement(self, orm_context):
+        mapper = orm_context.bind_mapper
+        if mapper is None:
+            return sorted(self.engines)
+        values = _shard_key_values(orm_context.statement, self._key_column(mapper))
+        if values is None:
+            return sorted(self.engines)
+        return sorted({self.shard_for(value, for_write=not orm_context.is_select) for value in values})
+
+    # ========================
+    # Fan-out queries
+    # ========================
+    def fan_out(self, statement, key=None, reverse=False, limit=None):
+        """Run a SELECT on every shard at once and merge the rows
+
+        With ``key``, each shard's rows must already be sorted by it (ORDER BY
+        in the statement) and the merge keeps that order. ``limit`` cuts the
+        merged list; put the same LIMIT on the statement so each shard
+        returns no more than that. Objects are returned detached.
+        """
+        descriptions = statement.column_descriptions
+        entities = len(descriptions) == 1 and descriptions[0]['type'] is descriptions[0]['entity']
+
+        def run(engine):
+            with Session(engine) as session:
+                result = session.execute(statement)
+                rows = result.scalars().all() if entities else result.all()
+                session.expunge_all()
+                return rows
+
+        with ThreadPoolExecutor(max_workers=len(self.engines)) as executor:
+            results = list(executor.map(run, [self.engines[name] for name in sorted(self.engines)]))
+        if key is not None:
+            merged = heapq.merge(*results, key=key, reverse=reverse)
+        else:
+            merged = itertools.chain.from_iterable(results)
+        return list(itertools.islice(merged, limit))
+
+    # ========================
+    # Rebalancing
+    # ========================
+    def plan(self):
+        """Moves [(start, end, source, target)] giving every slot its owner on the ring"""
+        self.reload()
+        current = [shard for shard, _ in self._map.slots(self.slots)]
+        wanted = [None] * self.slots
+        for start, end, shard in self.ring_ranges():
+            wanted[start:end + 1] = [shard] * (end - start + 1)
+        pairs = [(have, want) if have != want else None for have, want in zip(current, wanted)]
+        return [(start, end, source, target) for start, end, (source, target) in _runs(pairs)]
+
+    def moves_to(self, start, end, target):
+        """Moves [(start, end, source, target)] giving slots start..end to target"""
+        self.reload()
+        owners = [shard for shard, _ in self._map.slots(self.slots)[start:end + 1]]
+        return [(first, last, source, target) for first, last, source in _runs(owners, offset=start)
+                if source != target]
+
+    def move(self, moves, batch_size=1000, echo=logger.info):
+        """Move slot ranges between shards; return the number of rows moved
+
+        1. Mark the ranges moving: writes to them fail, reads stay on the source.
+        2. Wait SHARD_MAP_TTL so that every worker has seen it.
+        3. Copy their rows to the target shards.
+        4. Give the ranges to the targets and wait again.
+        5. Delete the rows from the source shards.
+        """
+        unknown = {shard for _, _, source, target in moves for shard in (source, target)} - set(self.engines)
+        if unknown:
+            # A shard leaving DATABASE_SHARD_URLS must stay listed until its slots are moved off
+            raise ValueError(f'Not in DATABASE_SHARD_URLS: {", ".join(sorted(unknown))}')
+        if not moves:
+            return 0
+        tables = self.metadata.sorted_tables if self.metadata is not None else []
+
+        self._update_map(moves, owner_index=2, state=MOVING)
+        echo(f'Marked {len(moves)} slot ranges as moving; waiting {self.map_ttl:.0f}s for workers')
+        sleep(self.map_ttl + 1)
+
+        copied = 0
+        for start, end, source, target in moves:
+            for table in tables:
+                copied += self._copy(table, start, end, source, target, batch_size)
+        echo(f'Copied {copied} rows')
+
+        self._update_map(moves, owner_index=3, state=ACTIVE)
+        echo(f'Switched the ranges to their targets; waiting {self.map_ttl:.0f}s for workers')
+        sleep(self.map_ttl + 1)
+
+        for start, end, source, _ in moves:
+            for table in reversed(tables):
+                self._delete(self.engines[source], table, start, end, batch_size)
+        echo('Deleted the moved rows from their source shards')
+        return copied
+
+    def _update_map(self, moves, owner_index, state):
+        """Rewrite shard_ranges with new owners and state for the moved ranges"""
+        self.reload()
+        entries = self._map.slots(self.slots)
+        for move in moves:
+            start, end = move[0], move[1]
+            entries[start:end + 1] = [(move[owner_index], state)] * (end - start + 1)
+        with self._primary.begin() as connection:
+            connection.execute(shard_ranges.delete())
+            connection.execute(shard_ranges.insert(), [
+                {'start_slot': start, 'end_slot': end, 'shard': shard, 'state': range_state}
+                for start, end, (shard, range_state) in _runs(entries)
+            ])
+        self.reload()
+
+    def _copy(self, table, start, end, source, target, batch_size):
+        in_range = table.c.shard_slot.between(start, end)
+        # Rows left on the target by an interrupted move would collide
+        self._delete(self.engines[target], table, start, end, batch_size)
+        copied, last_id = 0, None
+        with self.engines[source].connect() as reader:
+            while True:
+                query = select(table).where(in_range).order_by(table.c.id).limit(batch_size)
+                if last_id is not None:
+                    query = query.where(table.c.id > last_id)
+                rows = [dict(row._mapping) for row in reader.execute(query)]
+                if not rows:
+                    return copied
+                with self.engines[target].begin() as writer:
+                    writer.execute(table.insert(), rows)
+                copied += len(rows)
+                last_id = rows[-1]['id']
+
+    @staticmethod
+    def _delete(engine, table, start, end, batch_size):
+        in_range = table.c.shard_slot.between(start, end)
+        while True:
+            with engine.begin() as connection:
+                ids = connection.scalars(select(table.c.id).where(in_range).limit(batch_size)).all()
+                if not ids:
+                    return
+                connection.execute(table.delete().where(table.c.id.in_(ids)))
+
+    def counts(self):
+        """{shard: {table: rows}} for the sharded tables"""
+        tables = self.metadata.sorted_tables if self.metadata is not None else []
+        counts = {}
+        for name in sorted(self.engines):
+            with self.engines[name].connect() as connection:
+                counts[name] = {
+                    table.name: connection.scalar(select(func.count()).select_from(table))
+                    for table in tables
+                }
+        return counts
+
+
+shards = Shards()
+'''
+    with open(db_path / 'sharding.py', 'w', encoding='utf-8') as f:
+        f.write(sharding_content)
+
+    # ========================
+    # db/partitioning.py
+    # ========================
+    partitioning_content = '''"""Time-range partitioning of PartitionedModel tables on PostgreSQL
+
+A model mixing in PartitionedModel is created ``PARTITION BY RANGE
+(created_at)``, with one partition per day, week or month named after
+its first day (``events_p20261001``). Queries filtering on created_at
+only scan the matching partitions, and old rows leave by detaching or
+dropping a whole partition instead of a mass DELETE.
+
+``partitions.maintain()`` creates the partitions of the current period
+and the next ``__partition_premake__`` ones, then detaches or drops the
+partitions older than ``__partition_retention__`` periods. It runs when
+the app starts (PARTITION_MAINTENANCE=True) and from
+``flask partitions maintain``; schedule the command daily so partitions
+always exist ahead of the rows.
+
+On SQLite the tables are regular tables and maintenance does nothing.
+"""
+import logging
+import re
+import zlib
+from datetime import datetime, timedelta
+
+from sqlalchemy import PrimaryKeyConstraint, text
+from sqlalchemy.ext.compiler import compiles
+
+logger = logging.getLogger(__name__)
+
+PARTITION_COLUMN = 'created_at'
+INTERVALS = ('day', 'week', 'month')
+EXPIRE_ACTIONS = ('detach', 'drop')
+
+
+@compiles(PrimaryKeyConstraint, 'postgresql')
+def _partitioned_primary_key(constraint, compiler, **kw):
+    """Add created_at to the primary key of partitioned tables
+
+    PostgreSQL requires the partition column in every unique constraint of
+    a partitioned table. The ORM keeps ``id`` as the identity.
+    """
+    table = constraint.table
+    if 'partitioning' not in table.info or PARTITION_COLUMN in constraint.columns:
+        return compiler.visit_primary_key_constraint(constraint, **kw)
+    names = [column.name for column in constraint.columns] + [PARTITION_COLUMN]
+    prefix = ''
+    if constraint.name is not None:
+        prefix = f'CONSTRAINT {compiler.preparer.format_constraint(constraint)} '
+    return prefix + 'PRIMARY KEY ({})'.format(', '.join(compiler.preparer.quote(name) for name in names))
+
+
+def period_start(value, interval):
+    """Start of the day, week (Monday) or month containing value"""
+    day = datetime(value.year, value.month, value.day)
+    if interval == 'day':
+        return day
+    if interval == 'week':
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def shift(start, interval, periods):
+    """Start of the period ``periods`` after (or before) the one starting at start"""
+    if interval == 'day':
+        return start + timedelta(days=periods)
+    if interval == 'week':
+        return start + timedelta(weeks=periods)
+    month = start.month - 1 + periods
+    return start.replace(year=start.year + month // 12, month=month % 12 + 1)
+
+
+def partition_name(table_name, start):
+    return f'{table_name}_p{start:%Y%m%d}'
+
+
+class Partitions:
+    """Creates and expires the partitions of every PartitionedModel table"""
+
+    def __init__(self):
+        self.metadatas = {}
+        self.engines = {}
+
+    def init_app(self, app, metadatas, engines):
+        """Keep the binds, then run maintenance (after db.init_app and create_all)"""
+        self.metadatas = metadatas
+        self.engines = engines
+        app.extensions['partitions'] = self
+        if app.config.get('PARTITION_MAINTENANCE', True):
+            for table, changes in self.maintain():
+                if changes['created'] or changes['expired']:
+                    logger.info('partitions of %s: %s', table, changes)
+
+    def tables(self):
+        """[(table, engine)] of the partitioned tables on PostgreSQL binds"""
+        found = []
+        for key, metadata in self.metadatas.items():
+            engine = self.engines.get(key)
+            if engine is None or engine.dialect.name != 'postgresql':
+                continue
+            found.extend((table, engine) for table in metadata.sorted_tables if 'partitioning' in table.info)
+        return found
+
+    def maintain(self, now=None):
+        """Create upcoming partitions and expire old ones on every table
+
+        Returns [(table name, {'created': [...], 'expired': [...]})].
+        """
+        return [(table.name, self.maintain_table(table, engine, now)) for table, engine in self.tables()]
+
+    def maintain_table(self, table, engine, now=None):
+        settings = table.info['partitioning']
+        interval = settings['interval']
+        with engine.begin() as connection:
+            # Workers starting together take turns
+            connection.execute(text('SELECT pg_advisory_xact_lock(:key)'),
+                               {'key': zlib.crc32(f'partitions:{table.name}'.encode('utf-8'))})
+            if not self._is_partitioned(connection, table):
+                logger.warning('%s exists but is not partitioned; recreate it to partition it', table.name)
+                return {'created': [], 'expired': []}
+
+            current = period_start(now or connection.scalar(text('SELECT LOCALTIMESTAMP')), interval)
+            existing = self.partitions(connection, table)
+            created = []
+            for offset in range(settings['premake'] + 1):
+                start = shift(current, interval, offset)
+                name = partition_name(table.name, start)
+                if name not in existing:
+                    self._create(connection, table, name, start, shift(start, interval, 1))
+                    created.append(name)
+
+            expired = []
+            if settings['retention'] is not None:
+                cutoff = shift(current, interval, -settings['retention'])
+                for name, start in sorted(existing.items(), key=lambda item: item[1]):
+                    if start < cutoff:
+                        self._expire(connection, table, name, settings['expire'])
+                        expired.append(name)
+        return {'created': created, 'expired': expired}
+
+    # ========================
+    # Catalog queries and DDL
+    # ========================
+    @staticmethod
+    def _is_partitioned(connection, table):
+        return connection.scalar(
+            text('SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:name)'),
+            {'name': table.name},
+        ) is not None
+
+    @staticmethod
+    def partitions(connection, table):
+        """{partition name: first day} of the attached partitions named by this module"""
+        names = connection.scalars(text(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = to_regclass(:name)'
+        ), {'name': table.name})
+        pattern = re.compile(re.escape(table.name) + '_p([0-9]{8})$')
+        found = {}
+        for name in names:
+            match = pattern.match(name)
+            if match:
+                found[name] = datetime.strptime(match.group(1), '%Y%m%d')
+        return found
+
+    @staticmethod
+    def _create(connection, table, name, start, end):
+        quote = connection.dialect.identifier_preparer.quote
+        connection.execute(text(
+            f'CREATE TABLE IF NOT EXISTS {quote(name)} PARTITION OF {quote(table.name)} '
+            f"FOR VALUES FROM ('{start.isoformat(sep=' ')}') TO ('{end.isoformat(sep=' ')}')"
+        ))
+
+    @staticmethod
+    def _expire(connection, table, name, action):
+        quote = connection.dialect.identifier_preparer.quote
+        if action == 'drop':
+            connection.execute(text(f'DROP TABLE {quote(name)}'))
+        else:
+            # The detached table keeps its rows; archive or drop it later
+            connection.execute(text(f'ALTER TABLE {quote(table.name)} DETACH PARTITION {quote(name)}'))
+
+
+partitions = Partitions()
+'''
+    with open(db_path / 'partitioning.py', 'w', encoding='utf-8') as f:
+        f.write(partitioning_content)
+
+    # ========================
+    # db/maintenance.py
+    # ========================
+    maintenance_content = '''"""ANALYZE / VACUUM per dialect (``flask db maintain``)
+
+SQLite never updates planner statistics or reclaims free pages on its own:
+- ANALYZE refreshes the statistics the query planner uses
+- VACUUM rewrites the file once free pages exceed max_free_ratio of it
+- in WAL mode, a TRUNCATE checkpoint shrinks the -wal file
+
+PostgreSQL's autovacuum does most of this; maintenance catches up on the
+tables it lags behind on:
+- VACUUM (ANALYZE) on bloated tables: more dead rows than max_dead_ratio
+  of their live rows (the autovacuum formula, with its base of 50 rows)
+- ANALYZE on tables never analyzed, or with more than max_stale_ratio of
+  their rows changed since the last analyze
+- ANALYZE on partitioned tables, which autovacuum never analyzes
+
+Schedule ``flask db maintain`` nightly (cron).
+"""
+import logging
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# Rows autovacuum tolerates on any table before the ratios apply
+BASE_THRESHOLD = 50
+
+
+def plan(connection, max_dead_ratio=0.2, max_stale_ratio=0.1, max_free_ratio=0.25, vacuum=False):
+    """[(statement, reason)] the database needs
+
+    Raises:
+        NotImplementedError: On databases other than PostgreSQL and SQLite
+    """
+    dialect = connection.dialect.name
+    if dialect == 'sqlite':
+        return _sqlite_plan(connection, max_free_ratio, vacuum)
+    if dialect == 'postgresql':
+        return _postgres_plan(connection, max_dead_ratio, max_stale_ratio, vacuum)
+    raise NotImplementedError(f'No maintenance for {dialect}')
+
+
+def maintain(engine, dry_run=False, **thresholds):
+    """Run the statements of plan() outside a transaction, as VACUUM needs
+
+    Returns:
+        The [(statement, reason)] run (or to run, with dry_run)
+    """
+    with engine.connect() as connection:
+        connection = connection.execution_options(isolation_level='AUTOCOMMIT')
+        actions = plan(connection, **thresholds)
+        if not dry_run:
+            for statement, reason in actions:
+                logger.info('%s (%s)', statement, reason)
+                connection.exec_driver_sql(statement)
+    return actions
+
+
+# ========================
+# SQLite
+# ========================
+def _sqlite_plan(connection, max_free_ratio, vacuum):
+    actions = [('ANALYZE', 'refresh planner statistics')]
+    pages = connection.exec_driver_sql('PRAGMA page_count').scalar() or 0
+    free = connection.exec_driver_sql('PRAGMA freelist_count').scalar() or 0
+    if vacuum or (pages and free / pages > max_free_ratio):
+        actions.append(('VACUUM', f'{free} of {pages} pages free'))
+    if connection.exec_driver_sql('PRAGMA journal_mode').scalar() == 'wal':
+        actions.append(('PRAGMA wal_checkpoint(TRUNCATE)', 'shrink the WAL file'))
+    return actions
+
+
+# ========================
+# PostgreSQL
+# ========================
+TABLE_STATS = text(
+    'SELECT schemaname, relname, n_live_tup, n_dead_tup, n_mod_since_analyze, '
+    'COALESCE(last_analyze, last_autoanalyze) IS NULL AS never_analyzed, '
+    'pg_total_relation_size(relid) AS size '
+    'FROM pg_stat_user_tables ORDER BY n_dead_tup DESC'
+)
+PARTITIONED_TABLES = text(
+    "SELECT n.nspname, c.relname FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+    "WHERE c.relkind = 'p' AND n.nspname NOT IN ('pg_catalog', 'information_schema')"
+)
+
+
+def _postgres_plan(connection, max_dead_ratio, max_stale_ratio, vacuum):
+    preparer = connection.dialect.identifier_preparer
+    actions = []
+    for schema, table, live, dead, modified, never_analyzed, size in connection.execute(TABLE_STATS):
+        name = f'{preparer.quote_schema(schema)}.{preparer.quote(table)}'
+        if vacuum or dead > BASE_THRESHOLD + max_dead_ratio * live:
+            actions.append((f'VACUUM (ANALYZE) {name}', f'{dead} dead / {live} live rows, {_megabytes(size)}'))
+        elif never_analyzed and live:
+            actions.append((f'ANALYZE {name}', 'never analyzed'))
+        elif modified > BASE_THRESHOLD + max_stale_ratio * live:
+            actions.append((f'ANALYZE {name}', f'{modified} rows changed since the last analyze'))
+    for schema, table in connection.execute(PARTITIONED_TABLES):
+        name = f'{preparer.quote_schema(schema)}.{preparer.quote(table)}'
+        actions.append((f'ANALYZE {name}', 'partitioned table (autovacuum skips it)'))
+    return actions
+
+
+def _megabytes(size):
+    return f'{size / 1024 / 1024:.1f} MB'
+'''
+    with open(db_path / 'maintenance.py', 'w', encoding='utf-8') as f:
+        f.write(maintenance_content)
+
+    # ========================
+    # db/advisor.py
+    # ========================
+    advisor_content = '''"""Index advisor (``flask db advise``)
+
+Hot statements come from the SQL instrumentation: every worker writes its
+``sql_instrumentation.hot`` totals to SQL_HOT_DIR (observability/sql.py).
+On PostgreSQL, pg_stat_statements is read as well when it is installed.
+
+Each hot SELECT, UPDATE or DELETE is EXPLAINed, never run, with NULL
+parameters (PostgreSQL plans it as a generic plan). When a table is read
+in full while the statement filters or joins it on columns that no index
+leads with, an index is suggested: equality columns first, then one range
+column. The columns are read from the SQL text, so this is a heuristic.
+
+Foreign keys without an index leading with their columns are suggested
+too: deleting a parent row or joining from it scans the child table.
+Non-unique indexes that none of the statements filter or sort on are
+listed as possibly unused.
+
+Usage:
+    advice = advise(db.engine)
+    for suggestion in advice.suggestions:
+        create_index(db.engine, suggestion)
+"""
+import json
+import re
+from collections import namedtuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import DBAPIError
+
+from observability.sql import HotStatements
+
+Suggestion = namedtuple('Suggestion', 'table columns reasons calls seconds')
+Explained = namedtuple('Explained', 'statement calls seconds plan full_scans error')
+
+EXPLAINABLE = re.compile(r'^[(\\s]*(SELECT|UPDATE|DELETE|WITH)[\\s(]', re.IGNORECASE)
+CATALOG = re.compile(r'pg_catalog|pg_stat|information_schema|sqlite_master|sqlite_schema', re.IGNORECASE)
+NAME = r'"?(\\w+)"?'
+COLUMN_REF = NAME + r'\\.' + NAME
+ALIAS = re.compile(r'(?:FROM|JOIN)\\s+' + NAME + r'\\s+AS\\s+' + NAME, re.IGNORECASE)
+EQUALITY = r'=|\\bIN\\b|\\bIS\\b(?!\\s+NOT)'
+RANGE = r'<=|>=|<|>|\\bBETWEEN\\b|\\bLIKE\\b'
+COLUMN_BEFORE_OP = re.compile(COLUMN_REF + r'\\s*(' + RANGE + '|' + EQUALITY + r')', re.IGNORECASE)
+COLUMN_AFTER_OP = re.compile(r'(=|<=|>=|<|>)\\s*' + COLUMN_REF)
+ORDER_BY = re.compile(r'\\bORDER BY\\b(.*?)(?:\\bLIMIT\\b|\\bOFFSET\\b|\\bFOR\\b|$)', re.IGNORECASE | re.DOTALL)
+PYFORMAT = re.compile(r'%\\((\\w+)\\)s|%s|%%')
+SQLITE_SCAN = re.compile(r'SCAN (?:TABLE )?(\\w+)(.*)')
+PREPARED_NAME = 'flaskmeridian_advise'
+
+
+class Advice:
+    """What advise() found"""
+
+    def __init__(self):
+        self.explained = []
+        self.suggestions = []
+        self.unused = []
+
+
+# ========================
+# Hot statements
+# ========================
+def captured_statements(engine, hot_dir, limit=20):
+    """[(statement, calls, seconds)] by total time: the workers' dumps plus pg_stat_statements"""
+    hot = HotStatements(max_entries=10000)
+    if hot_dir:
+        hot.load(hot_dir)
+    if engine.dialect.name == 'postgresql':
+        for statement, calls, seconds in _pg_stat_statements(engine, limit):
+            hot.record(statement, seconds, calls)
+    statements = [item for item in hot.top(None)
+                  if EXPLAINABLE.match(item[0]) and not CATALOG.search(item[0])]
+    return statements[:limit]
+
+
+def _pg_stat_statements(engine, limit):
+    try:
+        with engine.connect() as connection:
+            return connection.execute(text(
+                'SELECT query, calls, total_exec_time / 1000 FROM pg_stat_statements '
+                'WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database()) '
+                'ORDER BY total_exec_time DESC LIMIT :limit'
+            ), {'limit': limit}).all()
+    except DBAPIError:
+        return []  # Extension not installed
+
+
+# ========================
+# EXPLAIN
+# ========================
+def explain(engine, statement):
+    """(plan lines, {alias or table read in full}) without running the statement
+
+    Raises:
+        The driver's error when the database cannot plan the statement
+    """
+    connection = engine.raw_connection()
+    try:
+        if engine.dialect.name == 'sqlite':
+            return _explain_sqlite(connection, statement)
+        if engine.dialect.name == 'postgresql':
+            return _explain_postgres(connection, statement)
+        raise NotImplementedError(f'No EXPLAIN support for {engine.dialect.name}')
+    finally:
+        connection.rollback()
+        connection.close()
+
+
+def _explain_sqlite(connection, statement):
+    cursor = connection.cursor()
+    cursor.execute('EXPLAIN QUERY PLAN ' + statement, [None] * statement.count('?'))
+    lines = [row[3] for row in cursor.fetchall()]
+    scans = set()
+    for line in lines:
+        match = SQLITE_SCAN.match(line)
+        if match and 'INDEX' not in match.group(2):
+            scans.add(match.group(1))
+    return lines, scans
+
+
+def _explain_postgres(connection, statement):
+    statement, count = numbered_parameters(statement)
+    cursor = connection.cursor()
+    cursor.execute('SET LOCAL plan_cache_mode = force_generic_plan')
+    cursor.execute(f'PREPARE {PREPARED_NAME} AS {statement}')
+    arguments = '(' + ', '.join(['NULL'] * count) + ')' if count else ''
+    # Prepared statements outlive the transaction and the connection goes back
+    # to the pool. DEALLOCATE in this transaction: behind PgBouncer transaction
+    # pooling the next one may run on another server connection.
+    cursor.execute('SAVEPOINT flaskmeridian_explain')
+    try:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) EXECUTE {PREPARED_NAME}{arguments}')
+        plan = cursor.fetchone()[0]
+    except Exception:
+        cursor.execute('ROLLBACK TO SAVEPOINT flaskmeridian_explain')
+        raise
+    finally:
+        cursor.execute(f'DEALLOCATE {PREPARED_NAME}')
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    lines, scans = [], set()
+
+    def walk(node, depth):
+        relation = f" on {node['Relation Name']}" if 'Relation Name' in node else ''
+        condition = node.get('Index Cond') or node.get('Filter') or ''
+        lines.append(f"{'  ' * depth}{node['Node Type']}{relation} {condition}".rstrip())
+        if node['Node Type'] == 'Seq Scan':
+            scans.add(node['Relation Name'])
+        for child in node.get('Plans', []):
+            walk(child, depth + 1)
+
+    walk(plan[0]['Plan'], 0)
+    return lines, scans
+
+
+def numbered_parameters(statement):
+    """Rewrite %(name)s / %s placeholders as $1, $2... and count the parameters"""
+    if re.search(r'[$][0-9]', statement):
+        return statement, max(int(n) for n in re.findall(r'[$]([0-9]+)', statement))
+    numbers = {}
+
+    def number(match):
+        if match.group(0) == '%%':
+            return '%'
+        key = match.group(1) or len(numbers)
+        return f'${numbers.setdefault(key, len(numbers) + 1)}'
+
+    return PYFORMAT.sub(number, statement), len(numbers)
+
+
+# ========================
+# Reading the SQL text
+# ========================
+def aliases(statement):
+    """{alias: table} of the FROM and JOIN clauses"""
+    return {alias: table for table, alias in ALIAS.findall(statement)}
+
+
+def predicate_columns(statement):
+    """{table: ([equality columns], [range columns])} compared in the statement"""
+    names = aliases(statement)
+    found = {}
+
+    def add(qualifier, column, operator):
+        equality, ranges = found.setdefault(names.get(qualifier, qualifier), ([], []))
+        target = ranges if re.fullmatch(RANGE, operator, re.IGNORECASE) else equality
+        if column not in equality and column not in target:
+            target.append(column)
+
+    for qualifier, column, operator in COLUMN_BEFORE_OP.findall(statement):
+        add(qualifier, column, operator.strip())
+    for operator, qualifier, column in COLUMN_AFTER_OP.findall(statement):
+        add(qualifier, column, operator)
+    return found
+
+
+def used_columns(statement):
+    """{(table, column)} the statement filters, joins or sorts on"""
+    names = aliases(statement)
+    used = {(table, column) for table, (equality, ranges) in predicate_columns(statement).items()
+            for column in equality + ranges}
+    for clause in ORDER_BY.findall(statement):
+        used.update((names.get(qualifier, qualifier), column)
+                    for qualifier, column in re.findall(COLUMN_REF, clause))
+    return used
+
+
+# ========================
+# Advice
+# ========================
+def advise(engine, hot_dir=None, limit=20):
+    """EXPLAIN the hot statements and collect index suggestions"""
+    advice = Advice()
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    indexed = {table: _indexed_columns(inspector, table) for table in tables}
+    suggestions = {}
+
+    def suggest(table, columns, reason, calls=0, seconds=0.0):
+        if any(existing[:len(columns)] == list(columns) for existing in indexed[table]):
+            return
+        entry = suggestions.setdefault((table, tuple(columns)), [[], 0, 0.0])
+        if reason not in entry[0]:
+            entry[0].append(reason)
+        entry[1] += calls
+        entry[2] += seconds
+
+    statements = captured_statements(engine, hot_dir, limit)
+    touched = set()
+    for statement, calls, seconds in statements:
+        try:
+            plan, scans = explain(engine, statement)
+        except engine.dialect.loaded_dbapi.Error as exc:
+            advice.explained.append(Explained(statement, calls, seconds, [], set(), str(exc).strip()))
+            continue
+        names = aliases(statement)
+        full_scans = {names.get(scan, scan) for scan in scans}
+        advice.explained.append(Explained(statement, calls, seconds, plan, full_scans, None))
+        predicates = predicate_columns(statement)
+        touched.update(table for table in predicates if table in tables)
+        for table in full_scans & tables:
+            equality, ranges = predicates.get(table, ([], []))
+            leading = {existing[0] for existing in indexed[table]}
+            # Compared columns no index leads with; none left means the planner
+            # prefers to scan (a small table) or nothing filters the table
+            missing = [column for column in (equality or ranges[:1]) if column not in leading]
+            if not missing:
+                continue
+            if equality:
+                missing += [column for column in ranges if column not in equality][:1]
+            suggest(table, missing, 'full scan', calls, seconds)
+
+    for table in sorted(tables):
+        for foreign_key in inspector.get_foreign_keys(table):
+            suggest(table, foreign_key['constrained_columns'], f"foreign key to {foreign_key['referred_table']}")
+
+    advice.suggestions = sorted(
+        (Suggestion(table, columns, reasons, calls, seconds)
+         for (table, columns), (reasons, calls, seconds) in suggestions.items()),
+        key=lambda suggestion: suggestion.seconds, reverse=True,
+    )
+    if statements:
+        used = set().union(*(used_columns(statement) for statement, _, _ in statements))
+        for table in sorted(touched):
+            for index in inspector.get_indexes(table):
+                if not index['unique'] and index['column_names'][0] and (table, index['column_names'][0]) not in used:
+                    advice.unused.append((table, index['name'], index['column_names']))
+    return advice
+
+
+def _indexed_columns(inspector, table):
+    """Column lists of the primary key, unique constraints and indexes of a table"""
+    found = [inspector.get_pk_constraint(table)['constrained_columns']]
+    found += [constraint['column_names'] for constraint in inspector.get_unique_constraints(table)]
+    found += [index['column_names'] for index in inspector.get_indexes(table)]
+    return [columns for columns in found if columns and columns[0]]
+
+
+def index_name(table, columns):
+    return f"ix_{table}_{'_'.join(columns)}"[:63]
+
+
+def create_index(engine, suggestion):
+    """Create a suggested index (CONCURRENTLY on PostgreSQL, so writes go on)"""
+    preparer = engine.dialect.identifier_preparer
+    columns = ', '.join(preparer.quote(column) for column in suggestion.columns)
+    concurrently = 'CONCURRENTLY ' if engine.dialect.name == 'postgresql' else ''
+    name = index_name(suggestion.table, suggestion.columns)
+    with engine.connect() as connection:
+        connection.execution_options(isolation_level='AUTOCOMMIT').exec_driver_sql(
+            f'CREATE INDEX {concurrently}IF NOT EXISTS {preparer.quote(name)} '
+            f'ON {preparer.quote(suggestion.table)} ({columns})'
+        )
+    return name
+'''
+    with open(db_path / 'advisor.py', 'w', encoding='utf-8') as f:
+        f.write(advisor_content)
+
+    # ========================
+    # benchmarks/sqlite_writers.py
+    # ========================
+    benchmark_content = '''"""Concurrency benchmark: SQLite reads and writes from 1-16 worker processes
+
+Usage:
+    python -m benchmarks.sqlite_writers [--workers 1,2,4,8,16] [--threads 4]
+                                        [--ops 100] [--write-ratio 0.2]
+
+Each worker process creates the app on a scratch database
+(instance/bench_sqlite.db, recreated for every run) and runs --threads
+threads, as gthread or gevent workers would. Each thread performs --ops
+operations: a row lookup, or for --write-ratio of them a small write
+transaction (an INSERT and an UPDATE, like a tracked login). Modes:
+- default        one pool, the driver's deferred transactions
+- single-writer  SQLITE_SINGLE_WRITER=True, writes committed by the session
+- write-queue    SQLITE_SINGLE_WRITER=True, writes sent to write_queue
+
+Reports throughput, write latency and failed operations (``database is
+locked``), and checks that every acknowledged write is in the database.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, insert, select, update
+from sqlalchemy.exc import OperationalError
+
+COUNTERS = 100
+MODES = ('default', 'single-writer', 'write-queue')
+
+metadata = MetaData()
+counters = Table('bench_counters', metadata,
+                 Column('id', Integer, primary_key=True),
+                 Column('hits', Integer, nullable=False, default=0))
+events = Table('bench_events', metadata,
+               Column('id', Integer, primary_key=True),
+               Column('counter_id', Integer, nullable=False),
+               Column('at', Float, nullable=False))
+
+
+def _config(path, mode):
+    return {
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}',
+        'SQLITE_SINGLE_WRITER': mode != 'default',
+        'METRICS_ENABLED': False,
+        'SQL_INSTRUMENTATION': 'off',
+        'SQL_SLOW_QUERY_MS': 60000,  # Lock waits would flood the slow query log
+    }
+
+
+def _reset_database(path, mode):
+    """Recreate the scratch database, its app tables and the counters"""
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    from app import create_app
+    from db import db
+
+    app = create_app(_config(path, mode))
+    with app.app_context():
+        metadata.create_all(db.engine)
+        with db.engine.begin() as connection:
+            connection.execute(insert(counters), [{'id': i, 'hits': 0} for i in range(1, COUNTERS + 1)])
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+def _record_hit(connection, counter_id):
+    connection.execute(insert(events).values(counter_id=counter_id, at=time.time()))
+    connection.execute(update(counters).where(counters.c.id == counter_id).values(hits=counters.c.hits + 1))
+
+
+def _worker(path, mode, threads, ops, write_ratio, barrier, results):
+    os.environ['PROMETHEUS_MULTIPROC_DIR'] = ''
+    from app import create_app
+    from db import db, write_queue
+
+    app = create_app(_config(path, mode))
+    stats = {'ops': 0, 'writes': 0, 'errors': 0, 'latencies': []}
+    lock = threading.Lock()
+
+    def run(seed):
+        rng = random.Random(seed)
+        done, writes, errors, latencies = 0, 0, 0, []
+        with app.app_context():
+            for _ in range(ops):
+                counter_id = rng.randint(1, COUNTERS)
+                try:
+                    if rng.random() < write_ratio:
+                        start = time.perf_counter()
+                        if mode == 'write-queue':
+                            write_queue.execute(_record_hit, counter_id)
+                        else:
+                            db.session.execute(insert(events).values(counter_id=counter_id, at=time.time()))
+                            db.session.execute(update(counters).where(counters.c.id == counter_id)
+                                               .values(hits=counters.c.hits + 1))
+                            db.session.commit()
+                        latencies.append(time.perf_counter() - start)
+                        writes += 1
+                    else:
+                        db.session.execute(select(counters.c.hits).where(counters.c.id == counter_id)).scalar()
+                        db.session.commit()
+                    done += 1
+                except OperationalError:
+                    db.session.rollback()
+                    errors += 1
+        with lock:
+            stats['ops'] += done
+            stats['writes'] += writes
+            stats['errors'] += errors
+            stats['latencies'].extend(latencies)
+
+    pool = [threading.Thread(target=run, args=(os.getpid() * 100 + i,)) for i in range(threads)]
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    stats['seconds'] = time.perf_counter() - started
+    results.put(stats)
+
+
+def run_mode(path, mode, workers, args):
+    _reset_database(path, mode)
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=_worker, args=(path, mode, args.threads, args.ops, args.write_ratio, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    stats = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    with sqlite3.connect(path) as connection:
+        stored = connection.execute('SELECT SUM(hits) FROM bench_counters').fetchone()[0]
+    ops = sum(s['ops'] for s in stats)
+    writes = sum(s['writes'] for s in stats)
+    errors = sum(s['errors'] for s in stats)
+    latencies = sorted(x * 1000 for s in stats for x in s['latencies']) or [0.0]
+    seconds = max(s['seconds'] for s in stats)
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    check = 'ok' if stored == writes else f'{stored} stored != {writes} acknowledged'
+    return (f'{workers:<8}{mode:<15}{ops / seconds:>9.0f}{p50:>11.1f}{p99:>11.1f}'
+            f'{errors:>8}  {check}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', default='1,2,4,8,16', help='Comma-separated worker process counts')
+    parser.add_argument('--threads', type=int, default=4, help='Threads per worker')
+    parser.add_argument('--ops', type=int, default=100, help='Operations per thread')
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--modes', default=','.join(MODES))
+    parser.add_argument('--database', default=os.path.join('instance', 'bench_sqlite.db'))
+    args = parser.parse_args()
+    path = os.path.abspath(args.database)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    print(f"{'workers':<8}{'mode':<15}{'ops/s':>9}{'write p50':>11}{'write p99':>11}{'errors':>8}  writes")
+    for workers in (int(n) for n in args.workers.split(',')):
+        for mode in args.modes.split(','):
+            print(run_mode(path, mode, workers, args), flush=True)
+
+
+if __name__ == '__main__':
+    main()
+'''
+    with open(db_path.parent / 'benchmarks' / 'sqlite_writers.py', 'w', encoding='utf-8') as f:
+        f.write(benchmark_content)
+
     # ========================
     # db/models/__init__.py
     # ========================
     models_init_content = '''"""Database models for FlaskMeridian app"""
 from .base import BaseModel
+from .partitioned import PartitionedModel
+from .sharded import ShardedMixin
 
-__all__ = ['BaseModel']
+__all__ = ['BaseModel', 'PartitionedModel', 'ShardedMixin']
 '''
     with open(models_path / '__init__.py', 'w', encoding='utf-8') as f:
         f.write(models_init_content)
@@ -55,28 +1964,693 @@ __all__ = ['BaseModel']
     # db/models/base.py
     # ========================
     base_model_content = '''"""Base model with common attributes"""
+from sqlalchemy.orm import declared_attr
+
 from ..database import db
+from .bulk import BulkMixin
+from .querying import QueryMixin
+from .serialization import SerializerMixin
 
 
-class BaseModel(db.Model):
+class BaseModel(SerializerMixin, QueryMixin, BulkMixin, db.Model):
     """Base model with common attributes"""
     __abstract__ = True
 
     id = db.Column(db.Integer, primary_key=True)
-    created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+    # server_default lets COPY and raw SQL loads fill timestamps in the database
+    created_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=db.func.current_timestamp(),
+        server_default=db.func.current_timestamp()
+    )
     updated_at = db.Column(
         db.DateTime, 
         default=db.func.current_timestamp(),
+        server_default=db.func.current_timestamp(),
         onupdate=db.func.current_timestamp()
     )
 
+    @declared_attr.directive
+    def __table_args__(cls):
+        """Index (created_at, id) so keyset pagination seeks stay index-only
+
+        Subclasses defining their own __table_args__ should include
+        ``*BaseModel.__table_args__`` to keep this index.
+        """
+        return (db.Index(f'ix_{cls.__tablename__}_created_at_id', 'created_at', 'id'),)
+
     def __repr__(self):
         return f'<{self.__class__.__name__} {self.id}>'
+
+    @classmethod
+    def cached(cls, timeout=None):
+        """Query whose results are served from the query cache
+
+        Entries are invalidated automatically when any table the query
+        reads from is written and committed (see cache/query_cache.py).
+
+        Args:
+            timeout: Optional entry lifetime in seconds (default QUERY_CACHE_TIMEOUT)
+        """
+        return cls.query.execution_options(query_cache=timeout or True)
 '''
     with open(models_path / 'base.py', 'w', encoding='utf-8') as f:
         f.write(base_model_content)
 
+    # ========================
+    # db/models/bulk.py
+    # ========================
+    bulk_content = '''"""Bulk insert / upsert mixin
+
+Adding rows one ORM object at a time costs a flush round trip and identity
+map bookkeeping per row. These helpers send plain dicts straight to Core
+INSERT statements in chunks instead; SQLAlchemy batches each chunk into
+multi-row VALUES (executemany), and very large PostgreSQL loads use COPY.
+created_at / updated_at are filled by the database.
+"""
+import io
+from itertools import islice
+
+from sqlalchemy import ARRAY, func, insert
+
+from ..database import db
+
+DEFAULT_CHUNK_SIZE = 1000
+COPY_THRESHOLD = 50000
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+
+# Tables written outside the ORM flush are reported to the query cache here
+QUERY_CACHE_TABLES_KEY = 'query_cache_tables'
+
+
+def _chunks(rows, size):
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _group_by_keys(chunk):
+    """Split a chunk into groups of rows sharing the same set of keys
+
+    executemany binds every row to the statement built from the first
+    one, so rows that omit different optional columns are sent separately.
+    """
+    groups = {}
+    for row in chunk:
+        groups.setdefault(frozenset(row), []).append(row)
+    return groups.values()
+
+
+def _copy_field(value, process=None):
+    """Format one value for COPY ... (FORMAT csv)
+
+    COPY reads an unquoted empty field as NULL and a quoted one as an
+    empty string, so every value except None is quoted. process is the
+    column type's bind processor (JSON dumps, enum names...), since COPY
+    bypasses SQLAlchemy.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = '\\\\x' + bytes(value).hex()  # bytea hex format
+    elif process is not None:
+        value = process(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _dialect_insert(dialect_name):
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"bulk_upsert is not supported on {dialect_name}")
+    return dialect_insert
+
+
+class BulkMixin:
+    """Adds bulk_insert() and bulk_upsert() to BaseModel"""
+
+    @classmethod
+    def bulk_insert(cls, rows, chunk_size=DEFAULT_CHUNK_SIZE, use_copy=None, commit=True):
+        """Insert many rows without creating ORM objects
+
+        Args:
+            rows: Iterable of dicts mapping column names to values
+            chunk_size: Rows per INSERT batch
+            use_copy: Force (True) or disable (False) PostgreSQL COPY; by
+                default COPY is used for sized inputs of COPY_THRESHOLD rows
+            commit: Commit the session when done
+
+        Returns:
+            Number of rows inserted
+        """
+        bind = db.session.get_bind()
+        if use_copy is None:
+            use_copy = hasattr(rows, '__len__') and len(rows) >= COPY_THRESHOLD
+        if use_copy and bind.dialect.name == 'postgresql':
+            count = cls._copy_rows(rows, chunk_size * 50)
+            if count is not None:
+                if commit:
+                    db.session.commit()
+                return count
+
+        table = cls.__table__
+        count = 0
+        for chunk in _chunks(rows, chunk_size):
+            for group in _group_by_keys(chunk):
+                db.session.execute(insert(table), group)
+            count += len(chunk)
+
+        if commit:
+            db.session.commit()
+        return count
+
+    @classmethod
+    def bulk_upsert(cls, rows, conflict_cols, update_cols=None,
+                    chunk_size=DEFAULT_CHUNK_SIZE, commit=True):
+        """Insert rows, updating existing ones that collide on conflict_cols
+
+        Uses INSERT ... ON CONFLICT on PostgreSQL and SQLite. conflict_cols
+        must match a unique index or constraint.
+
+        Args:
+            rows: Iterable of dicts mapping column names to values
+            conflict_cols: Columns identifying an existing row, e.g. ['email']
+            update_cols: Columns to overwrite on conflict; by default every
+                supplied column except conflict_cols, id and created_at. An
+                empty sequence keeps existing rows untouched (DO NOTHING).
+            chunk_size: Rows per INSERT batch
+            commit: Commit the session when done
+
+        Returns:
+            Number of rows sent. Rows skipped by DO NOTHING and rows
+            updated in place are both counted; this is not the number of
+            rows inserted or updated.
+
+        Raises:
+            NotImplementedError: On databases other than PostgreSQL and SQLite
+        """
+        dialect_insert = _dialect_insert(db.session.get_bind().dialect.name)
+        table = cls.__table__
+        skip = set(conflict_cols) | {'id', 'created_at'}
+        count = 0
+
+        for chunk in _chunks(rows, chunk_size):
+            for group in _group_by_keys(chunk):
+                stmt = dialect_insert(table)
+                columns = update_cols
+                if columns is None:
+                    columns = [key for key in group[0] if key not in skip]
+
+                if columns:
+                    set_ = {name: stmt.excluded[name] for name in columns}
+                    if 'updated_at' in table.c and 'updated_at' not in set_:
+                        set_['updated_at'] = func.current_timestamp()
+                    stmt = stmt.on_conflict_do_update(index_elements=conflict_cols, set_=set_)
+                else:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=conflict_cols)
+
+                db.session.execute(stmt, group)
+            count += len(chunk)
+
+        if commit:
+            db.session.commit()
+        return count
+
+    @classmethod
+    def _copy_rows(cls, rows, batch_size):
+        """Stream rows into PostgreSQL with COPY ... FROM STDIN
+
+        Python-side column defaults are applied here because COPY bypasses
+        SQLAlchemy; SQL defaults come from the server_default in the table.
+
+        Returns:
+            Number of rows copied, or None when the driver has no COPY support
+            or the table has ARRAY columns (sent with INSERT instead)
+        """
+        table = cls.__table__
+        if any(isinstance(column.type, ARRAY) for column in table.columns):
+            return None
+        connection = db.session.connection()
+        dbapi_connection = connection.connection.dbapi_connection
+        with dbapi_connection.cursor() as cursor:
+            if not hasattr(cursor, 'copy_expert'):
+                return None
+            count = cls._copy_batches(cursor, connection, rows, batch_size)
+
+        db.session.info.setdefault(QUERY_CACHE_TABLES_KEY, set()).add(table.name)
+        return count
+
+    @classmethod
+    def _copy_batches(cls, cursor, connection, rows, batch_size):
+        table = cls.__table__
+
+        python_defaults = [
+            (column.name, column.default)
+            for column in table.columns
+            if column.default is not None
+            and (column.default.is_callable or column.default.is_scalar)
+            and column.name not in TIMESTAMP_COLUMNS
+        ]
+        preparer = connection.dialect.identifier_preparer
+        processors = {
+            column.name: column.type.bind_processor(connection.dialect) for column in table.columns
+        }
+        count = 0
+
+        for batch in _chunks(rows, batch_size):
+            for group in _group_by_keys(batch):
+                names = list(group[0])
+                defaults = [(name, default) for name, default in python_defaults if name not in names]
+                columns = names + [name for name, _ in defaults]
+                column_processors = [processors[name] for name in columns]
+
+                buffer = io.StringIO()
+                for row in group:
+                    values = [row[name] for name in names]
+                    values += [
+                        default.arg(None) if default.is_callable else default.arg
+                        for _, default in defaults
+                    ]
+                    fields = (_copy_field(value, process) for value, process in zip(values, column_processors))
+                    buffer.write(','.join(fields) + '\\n')
+                buffer.seek(0)
+
+                column_list = ', '.join(preparer.quote(name) for name in columns)
+                cursor.copy_expert(
+                    f'COPY {preparer.format_table(table)} ({column_list}) FROM STDIN WITH (FORMAT csv)',
+                    buffer,
+                )
+            count += len(batch)
+        return count
+'''
+    with open(models_path / 'bulk.py', 'w', encoding='utf-8') as f:
+        f.write(bulk_content)
+
+    # ========================
+    # db/models/querying.py
+    # ========================
+    querying_content = '''"""Query mixin with keyset pagination and batched iteration
+
+OFFSET pagination reads and discards every skipped row, so deep pages get
+slower as the table grows. Keyset (seek) pagination instead remembers the
+(created_at, id) of the last row and asks for rows past it, which the
+(created_at, id) index answers directly however deep the page is.
+"""
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import String, tuple_, type_coerce
+from sqlalchemy.orm import selectinload
+
+from ..database import db
+
+
+@dataclass
+class KeysetPage:
+    """One page of keyset pagination results"""
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self):
+        return self.next_cursor is not None
+
+
+def encode_cursor(created_at, id_):
+    """Encode a (created_at, id) position as an opaque URL-safe string
+
+    created_at is a datetime, or the text SQLite stored for it.
+    """
+    stamp = created_at if isinstance(created_at, str) else created_at.isoformat()
+    raw = json.dumps([stamp, id_], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor produced by encode_cursor() into (created_at text, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, id_ = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        datetime.fromisoformat(created_at)
+        return created_at, int(id_)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+class QueryMixin:
+    """Adds keyset pagination, batched iteration and eager-load presets
+
+    Presets name groups of relationships to load with selectinload:
+
+        class User(BaseModel):
+            __load_presets__ = {'with_roles': ('roles',)}
+
+        User.with_preset('with_roles').filter_by(active=True).all()
+    """
+
+    __load_presets__ = {}
+
+    @classmethod
+    def with_preset(cls, preset, query=None):
+        """Apply a named selectinload preset to a query
+
+        Raises:
+            ValueError: If the preset is not declared in __load_presets__
+        """
+        query = cls.query if query is None else query
+        if preset is None:
+            return query
+        if preset not in cls.__load_presets__:
+            raise ValueError(f"{cls.__name__} has no load preset '{preset}'")
+        return query.options(*(
+            selectinload(getattr(cls, name)) for name in cls.__load_presets__[preset]
+        ))
+
+    @classmethod
+    def keyset_page(cls, cursor=None, limit=50, query=None, order='desc', preset=None):
+        """Fetch one page ordered by (created_at, id)
+
+        Args:
+            cursor: next_cursor of the previous page, or None for the first page
+            limit: Maximum number of items per page
+            query: Optional filtered query to paginate (default: cls.query)
+            order: 'desc' for newest first, 'asc' for oldest first
+            preset: Optional __load_presets__ name to eager-load relationships
+
+        Returns:
+            KeysetPage with items and next_cursor (None on the last page)
+
+        Raises:
+            ValueError: If the cursor or order is invalid
+        """
+        if order not in ('asc', 'desc'):
+            raise ValueError(f"order must be 'asc' or 'desc', not {order!r}")
+
+        query = cls.with_preset(preset, query)
+        # SQLite keeps created_at as text, '... HH:MM:SS' from CURRENT_TIMESTAMP
+        # or '... HH:MM:SS.ffffff' from Python datetimes, and compares it as
+        # text: seek on the stored text so both sides have the same form
+        as_text = query.session.get_bind(mapper=cls.__mapper__).dialect.name == 'sqlite'
+        created_at = type_coerce(cls.created_at, String) if as_text else cls.created_at
+        key = tuple_(created_at, cls.id)
+
+        if cursor is not None:
+            stamp, id_ = decode_cursor(cursor)
+            position = tuple_(stamp if as_text else datetime.fromisoformat(stamp), id_)
+            query = query.filter(key < position if order == 'desc' else key > position)
+
+        if order == 'desc':
+            query = query.order_by(created_at.desc(), cls.id.desc())
+        else:
+            query = query.order_by(created_at.asc(), cls.id.asc())
+
+        # One extra row tells us whether another page exists
+        rows = query.add_columns(created_at).limit(limit + 1).all()
+        items = [row[0] for row in rows[:limit]]
+        if len(rows) <= limit:
+            return KeysetPage(items=items)
+
+        last_created_at = rows[limit - 1][1]
+        return KeysetPage(items=items, next_cursor=encode_cursor(last_created_at, items[-1].id))
+
+    @classmethod
+    def iter_batches(cls, size=1000, query=None, preset=None):
+        """Iterate over a whole table in batches of at most ``size`` rows
+
+        Seeks by primary key instead of OFFSET and expunges each batch from
+        the session once the caller is done with it, so memory stays
+        bounded by the batch size however large the table is.
+
+        Yields:
+            Lists of model instances
+        """
+        query = cls.with_preset(preset, query)
+        last_id = None
+
+        while True:
+            batch_query = query.order_by(cls.id.asc())
+            if last_id is not None:
+                batch_query = batch_query.filter(cls.id > last_id)
+
+            batch = batch_query.limit(size).all()
+            if not batch:
+                return
+
+            last_id = batch[-1].id
+            yield batch
+
+            for obj in batch:
+                if obj in db.session:
+                    db.session.expunge(obj)
+'''
+    with open(models_path / 'querying.py', 'w', encoding='utf-8') as f:
+        f.write(querying_content)
+
+    # ========================
+    # db/models/serialization.py
+    # ========================
+    serialization_content = '''"""Serialization mixin with per-class cached column metadata"""
+from operator import attrgetter
+
+from sqlalchemy import inspect as sa_inspect
+
+
+class SerializerMixin:
+    """Adds to_dict() and serialize_many() to BaseModel
+
+    Column and relationship accessors are computed once per class on first
+    use instead of walking ``__table__.columns`` on every call. Columns
+    listed in ``__serialize_exclude__`` (e.g. password hashes) are left out
+    unless explicitly requested with ``include``.
+    """
+
+    __serialize_exclude__ = frozenset()
+
+    @classmethod
+    def _serialization_meta(cls):
+        """Return (columns, relationships) accessor tuples for this class"""
+        meta = cls.__dict__.get('_serialization_meta_cache')
+        if meta is None:
+            mapper = sa_inspect(cls)
+            columns = tuple(
+                (attr.key, attrgetter(attr.key)) for attr in mapper.column_attrs
+            )
+            relationships = tuple(
+                (rel.key, rel.uselist, rel.lazy == 'dynamic', attrgetter(rel.key))
+                for rel in mapper.relationships
+            )
+            meta = (columns, relationships)
+            cls._serialization_meta_cache = meta
+        return meta
+
+    @classmethod
+    def _wanted(cls, key, include, exclude):
+        if include is not None:
+            return key in include
+        return key not in cls.__serialize_exclude__ and key not in exclude
+
+    def to_dict(self, include=None, exclude=None, depth=0):
+        """Serialize this instance to a dict
+
+        Args:
+            include: Optional set of field names to serialize (only these)
+            exclude: Optional set of field names to leave out
+            depth: How many levels of relationships to follow (default 0);
+                a relationship named in ``include`` is always followed
+
+        Returns:
+            dict of field name to value
+        """
+        columns, relationships = self._serialization_meta()
+        exclude = exclude or ()
+
+        data = {
+            key: getter(self)
+            for key, getter in columns
+            if self._wanted(key, include, exclude)
+        }
+
+        for key, uselist, dynamic, getter in relationships:
+            explicit = include is not None and key in include
+            if not explicit and (depth <= 0 or dynamic):
+                continue
+            if not self._wanted(key, include, exclude):
+                continue
+
+            value = getter(self)
+            child_depth = max(depth - 1, 0)
+            if uselist:
+                data[key] = [item.to_dict(depth=child_depth) for item in value]
+            else:
+                data[key] = value.to_dict(depth=child_depth) if value is not None else None
+
+        return data
+
+    @classmethod
+    def serialize_many(cls, rows, include=None, exclude=None, depth=0):
+        """Serialize model instances or Row tuples in bulk
+
+        Rows from column queries such as
+        ``db.session.execute(select(User.id, User.email))`` are converted
+        straight from their tuples without hydrating ORM objects. The
+        field positions are resolved once from the first row. Rows holding
+        a single entity, as from ``select(User)``, serialize that instance.
+
+        Returns:
+            list of dicts
+
+        Raises:
+            TypeError: For rows mixing model instances with other columns
+        """
+        exclude = exclude or ()
+        result = []
+        positions = None
+
+        for row in rows:
+            if not isinstance(row, SerializerMixin) and len(row) == 1 and isinstance(row[0], SerializerMixin):
+                row = row[0]
+            if isinstance(row, SerializerMixin):
+                result.append(row.to_dict(include=include, exclude=exclude, depth=depth))
+                continue
+
+            if positions is None:
+                if any(isinstance(value, SerializerMixin) for value in row):
+                    raise TypeError(
+                        f'Cannot serialize rows mixing model instances and columns: {row._fields}'
+                    )
+                positions = tuple(
+                    (index, key)
+                    for index, key in enumerate(row._fields)
+                    if cls._wanted(key, include, exclude)
+                )
+            result.append({key: row[index] for index, key in positions})
+
+        return result
+'''
+    with open(models_path / 'serialization.py', 'w', encoding='utf-8') as f:
+        f.write(serialization_content)
+
+    # ========================
+    # db/models/sharded.py
+    # ========================
+    sharded_content = '''"""Mixin marking a BaseModel subclass as hash-sharded (see db/sharding.py)"""
+import uuid
+
+from sqlalchemy import event
+
+from ..database import db
+from ..sharding import SHARDED_BIND, shards
+
+
+class ShardedMixin:
+    """Store the model's rows on the shard owning the hash of __shard_key__
+
+    Put it before BaseModel and name the shard key column:
+
+        class Event(ShardedMixin, BaseModel):
+            __shard_key__ = 'user_id'
+            user_id = db.Column(db.Integer, nullable=False, index=True)
+
+    Sharded tables live on every shard and on none of the other binds, so
+    they cannot have foreign keys to regular tables. Query them through
+    ``shards.session`` rather than ``Model.query``. The shard key must not
+    change after insert.
+    """
+    __bind_key__ = SHARDED_BIND
+    __shard_key__ = None
+
+    # Unique across shards, so rows can move between them
+    id = db.Column(db.Uuid, primary_key=True, default=uuid.uuid4)
+    # Hash slot of the shard key - rebalancing moves rows by slot range
+    shard_slot = db.Column(db.Integer, nullable=False, index=True)
+
+
+@event.listens_for(ShardedMixin, 'before_insert', propagate=True)
+def _assign_slot(mapper, connection, target):
+    target.shard_slot = shards.slot_for(getattr(target, target.__shard_key__))
+'''
+    with open(models_path / 'sharded.py', 'w', encoding='utf-8') as f:
+        f.write(sharded_content)
+
+    # ========================
+    # db/models/partitioned.py
+    # ========================
+    partitioned_content = '''"""Mixin partitioning a BaseModel subclass by created_at (see db/partitioning.py)"""
+from sqlalchemy.orm import declared_attr
+
+from ..database import db
+from ..partitioning import EXPIRE_ACTIONS, INTERVALS, PARTITION_COLUMN
+
+
+class PartitionedModel:
+    """Range-partition the model's table on created_at (PostgreSQL)
+
+    Put it before BaseModel and pick the partition size and retention:
+
+        class AuditEvent(PartitionedModel, BaseModel):
+            __partition_interval__ = 'month'   # 'day', 'week' or 'month'
+            __partition_retention__ = 12       # months kept before the current one
+            __partition_expire__ = 'detach'    # or 'drop'
+            action = db.Column(db.String(50), nullable=False)
+
+    The primary key becomes (id, created_at) in PostgreSQL, so other tables
+    cannot have foreign keys to a partitioned table and unique indexes must
+    include created_at. created_at must not change after insert. Filter on
+    created_at to get partition pruning.
+    """
+    __partition_interval__ = 'month'
+    __partition_premake__ = 3
+    __partition_retention__ = None
+    __partition_expire__ = 'detach'
+
+    @declared_attr.directive
+    def __table_args__(cls):
+        """BaseModel's (created_at, id) index plus the partitioning clause"""
+        if cls.__partition_interval__ not in INTERVALS:
+            raise ValueError(f'{cls.__name__}.__partition_interval__ must be one of {INTERVALS}')
+        if cls.__partition_expire__ not in EXPIRE_ACTIONS:
+            raise ValueError(f'{cls.__name__}.__partition_expire__ must be one of {EXPIRE_ACTIONS}')
+        return (
+            db.Index(f'ix_{cls.__tablename__}_created_at_id', 'created_at', 'id'),
+            {
+                'postgresql_partition_by': f'RANGE ({PARTITION_COLUMN})',
+                'info': {'partitioning': {
+                    'interval': cls.__partition_interval__,
+                    'premake': cls.__partition_premake__,
+                    'retention': cls.__partition_retention__,
+                    'expire': cls.__partition_expire__,
+                }},
+            },
+        )
+'''
+    with open(models_path / 'partitioned.py', 'w', encoding='utf-8') as f:
+        f.write(partitioned_content)
+
     click.echo("✅ Created db/database.py")
+    click.echo("✅ Created db/sqlite.py (opt-in single-writer SQLite mode)")
+    click.echo("✅ Created db/routing.py and db/replicas.py (read/write splitting)")
+    click.echo("✅ Created db/sharding.py (opt-in hash sharding)")
+    click.echo("✅ Created db/partitioning.py (time-range partitioning on PostgreSQL)")
+    click.echo("✅ Created db/maintenance.py and db/advisor.py (flask db maintain / advise)")
+    click.echo("✅ Created benchmarks/sqlite_writers.py")
     click.echo("✅ Created db/models/")
     click.echo("✅ Created db/models/base.py")
+    click.echo("✅ Created db/models/bulk.py")
+    click.echo("✅ Created db/models/querying.py")
+    click.echo("✅ Created db/models/serialization.py")
+    click.echo("✅ Created db/models/sharded.py (ShardedMixin)")
+    click.echo("✅ Created db/models/partitioned.py (PartitionedModel)")
     click.echo("✅ Created db/__init__.py and db/models/__init__.py")
\ No newline at end of file
@@ -2,13 +2,17 @@
 import click
 from pathlib import Path
 
+from cli.templates.server_files import APP_TARGETS, WORKER_CLASSES
 
-def create(project_path, db_type='sqlite'):
+
+def create(project_path, db_type='sqlite', server_mode='sync', pgbouncer=False):
     """Create Dockerfile and docker-compose.yml based on database type
 
     Args:
         project_path: Path to project directory
         db_type: Database type ('sqlite' or 'postgres')
+        server_mode: 'sync' (sync workers), 'async' (asgi:app on uvicorn workers) or 'gevent' (gevent workers)
+        pgbouncer: Add a PgBouncer service (PostgreSQL only) and connect the app through it
     """
 
     # ========================
@@ -53,21 +57,31 @@ COPY . .
 ENV PATH="/opt/venv/bin:$PATH" \\
     PYTHONUNBUFFERED=1 \\
     PYTHONDONTWRITEBYTECODE=1 \\
-    FLASK_APP=app.py
+    FLASK_APP=app.py \\
+    TEMPLATE_CACHE_DIR=/var/cache/jinja
+
+# Precompile templates into the shared bytecode cache (outside the /app
+# volume, so bind mounts in docker-compose do not hide it). An in-memory
+# database keeps the build independent of the real DATABASE_URL.
+RUN DATABASE_URL=sqlite:// flask templates compile
+
+# Prometheus multiprocess mode: workers share metrics through this directory
+# (emptied by gunicorn.conf.py on startup)
+ENV PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus_multiproc
 
 # Create non-root user for security
-RUN useradd -m -u 1000 appuser && chown -R appuser:appuser /app
+RUN useradd -m -u 1000 appuser && chown -R appuser:appuser /app /var/cache/jinja
 USER appuser
 
 # Expose port
 EXPOSE 5000
 
-# Health check
+# Health check - bash probe against /readyz (no Python interpreter start-up)
 HEALTHCHECK --interval=30s --timeout=10s --start-period=40s --retries=3 \\
-    CMD python -c "import requests; requests.get('http://localhost:5000/health', timeout=5)"
+    CMD ["bash", "/app/healthcheck.sh", "/readyz"]
 
-# Run application with gunicorn for production
-CMD ["gunicorn", "--bind", "0.0.0.0:5000", "--workers", "4", "--timeout", "60", "--access-logfile", "-", "--error-logfile", "-", "app:app"]
+# Run application with gunicorn for production (settings in gunicorn.conf.py)
+CMD ["gunicorn", "-c", "gunicorn.conf.py", "app:app"]
 '''
 
     # ========================
@@ -89,7 +103,7 @@ services:
       - ./instance:/app/instance
     command: flask run --host=0.0.0.0
     healthcheck:
-      test: ["CMD", "curl", "-f", "http://localhost:5000/health"]
+      test: ["CMD", "bash", "/app/healthcheck.sh", "/readyz"]
       interval: 30s
       timeout: 10s
       retries: 3
@@ -112,8 +126,11 @@ services:
       POSTGRES_USER: ${DB_USER:-flaskuser}
       POSTGRES_PASSWORD: ${DB_PASSWORD:-flaskpassword}
       POSTGRES_DB: ${DB_NAME:-flaskmeridian_db}
+      REPLICATION_USER: ${REPLICATION_USER:-replicator}
+      REPLICATION_PASSWORD: ${REPLICATION_PASSWORD:-replicatorpassword}
     volumes:
       - postgres_data:/var/lib/postgresql/data
+      - ./docker/postgres/primary-init.sh:/docker-entrypoint-initdb.d/10-replication.sh:ro
     ports:
       - "5432:5432"
     healthcheck:
@@ -122,20 +139,80 @@ services:
       timeout: 5s
       retries: 5
 
+  # Shards for trying out DATABASE_SHARD_URLS locally: docker-compose --profile shards up
+  shard-1:
+    image: postgres:15-alpine
+    container_name: flaskmeridian_shard_1
+    profiles: ["shards"]
+    environment:
+      POSTGRES_USER: ${DB_USER:-flaskuser}
+      POSTGRES_PASSWORD: ${DB_PASSWORD:-flaskpassword}
+      POSTGRES_DB: ${DB_NAME:-flaskmeridian_db}
+    volumes:
+      - postgres_shard_1_data:/var/lib/postgresql/data
+    ports:
+      - "5441:5432"
+
+  shard-2:
+    image: postgres:15-alpine
+    container_name: flaskmeridian_shard_2
+    profiles: ["shards"]
+    environment:
+      POSTGRES_USER: ${DB_USER:-flaskuser}
+      POSTGRES_PASSWORD: ${DB_PASSWORD:-flaskpassword}
+      POSTGRES_DB: ${DB_NAME:-flaskmeridian_db}
+    volumes:
+      - postgres_shard_2_data:/var/lib/postgresql/data
+    ports:
+      - "5442:5432"
+
+  # Streaming replica of db for trying out DATABASE_REPLICA_URLS locally:
+  # docker-compose --profile replicas up
+  db-replica:
+    image: postgres:15-alpine
+    container_name: flaskmeridian_db_replica
+    profiles: ["replicas"]
+    user: postgres
+    depends_on:
+      db:
+        condition: service_healthy
+    environment:
+      PGDATA: /var/lib/postgresql/data
+      REPLICATION_USER: ${REPLICATION_USER:-replicator}
+      PGPASSWORD: ${REPLICATION_PASSWORD:-replicatorpassword}
+    entrypoint: ["bash", "/usr/local/bin/replica-entrypoint.sh"]
+    volumes:
+      - postgres_replica_data:/var/lib/postgresql/data
+      - ./docker/postgres/replica-entrypoint.sh:/usr/local/bin/replica-entrypoint.sh:ro
+    ports:
+      - "5433:5432"
+    healthcheck:
+      test: ["CMD-SHELL", "pg_isready -U ${DB_USER:-flaskuser}"]
+      interval: 10s
+      timeout: 5s
+      retries: 5
+
   app:
     build: .
     container_name: flaskmeridian_app
     depends_on:
       db:
         condition: service_healthy
+      db-replica:
+        condition: service_healthy
+        required: false  # Only started with --profile replicas
     ports:
       - "${FLASK_PORT:-5000}:5000"
     env_file: .env
+    environment:
+      DATABASE_URL: postgresql://${DB_USER:-flaskuser}:${DB_PASSWORD:-flaskpassword}@db:5432/${DB_NAME:-flaskmeridian_db}
+      # Read from db-replica (start it with --profile replicas):
+      # DATABASE_REPLICA_URLS: postgresql://${DB_USER:-flaskuser}:${DB_PASSWORD:-flaskpassword}@db-replica:5432/${DB_NAME:-flaskmeridian_db}
     volumes:
       - .:/app
-    command: gunicorn --bind 0.0.0.0:5000 --workers 4 --timeout 60 --access-logfile - --error-logfile - app:app
+    command: gunicorn -c gunicorn.conf.py app:app
     healthcheck:
-      test: ["CMD", "curl", "-f", "http://localhost:5000/health"]
+      test: ["CMD", "bash", "/app/healthcheck.sh", "/readyz"]
       interval: 30s
       timeout: 10s
       retries: 3
@@ -144,6 +221,119 @@ services:
 volumes:
   postgres_data:
     driver: local
+  postgres_replica_data:
+    driver: local
+  postgres_shard_1_data:
+    driver: local
+  postgres_shard_2_data:
+    driver: local
+'''
+
+    # ========================
+    # PgBouncer - transaction pooling between the app containers and PostgreSQL
+    # ========================
+    pgbouncer = pgbouncer and db_type == 'postgres'
+    if pgbouncer:
+        docker_compose_content = docker_compose_content.replace('''  app:
+    build: .
+''', '''  # Every app container connects here; PostgreSQL only sees DEFAULT_POOL_SIZE connections
+  pgbouncer:
+    image: edoburu/pgbouncer:v1.24.1-p1
+    container_name: flaskmeridian_pgbouncer
+    depends_on:
+      db:
+        condition: service_healthy
+    environment:
+      DB_HOST: db
+      DB_USER: ${DB_USER:-flaskuser}
+      DB_PASSWORD: ${DB_PASSWORD:-flaskpassword}
+      DB_NAME: ${DB_NAME:-flaskmeridian_db}
+      AUTH_TYPE: scram-sha-256
+      POOL_MODE: transaction
+      LISTEN_PORT: 6432
+      MAX_CLIENT_CONN: ${PGBOUNCER_MAX_CLIENT_CONN:-2000}
+      DEFAULT_POOL_SIZE: ${PGBOUNCER_POOL_SIZE:-20}
+    ports:
+      - "6432:6432"
+
+  app:
+    build: .
+''').replace('''    container_name: flaskmeridian_app
+    depends_on:
+      db:
+        condition: service_healthy
+''', '''    container_name: flaskmeridian_app
+    depends_on:
+      pgbouncer:
+        condition: service_started
+      db:
+        condition: service_healthy
+''').replace(
+            'DATABASE_URL: postgresql://${DB_USER:-flaskuser}:${DB_PASSWORD:-flaskpassword}@db:5432/',
+            'DATABASE_URL: postgresql://${DB_USER:-flaskuser}:${DB_PASSWORD:-flaskpassword}@pgbouncer:6432/',
+        )
+
+    # ========================
+    # Async / gevent server modes: worker class and app target
+    # ========================
+    target = APP_TARGETS[server_mode]
+    if server_mode != 'sync':
+        dockerfile_content = dockerfile_content.replace(
+            'CMD ["gunicorn", "-c", "gunicorn.conf.py", "app:app"]',
+            f'ENV GUNICORN_WORKER_CLASS={WORKER_CLASSES[server_mode]}\n'
+            f'CMD ["gunicorn", "-c", "gunicorn.conf.py", "{target}"]',
+        )
+        docker_compose_content = docker_compose_content.replace(
+            'gunicorn -c gunicorn.conf.py app:app', f'gunicorn -c gunicorn.conf.py {target}'
+        )
+    if server_mode == 'async':
+        # flask run cannot serve the ASGI app
+        docker_compose_content = docker_compose_content.replace(
+            'flask run --host=0.0.0.0', f'uvicorn {target} --host 0.0.0.0 --port 5000'
+        )
+
+    # ========================
+    # healthcheck.sh - container health probe
+    # ========================
+    healthcheck_content = '''#!/bin/bash
+# Container health probe: HTTP GET over bash's /dev/tcp, so neither curl
+# nor a Python interpreter is needed in the image.
+#
+# Usage: healthcheck.sh [path] [port]    (defaults: /livez 5000)
+set -e
+path="${1:-/livez}"
+port="${2:-5000}"
+
+exec 3<>"/dev/tcp/127.0.0.1/$port"
+printf 'GET %s HTTP/1.0\\r\\nHost: localhost\\r\\nConnection: close\\r\\n\\r\\n' "$path" >&3
+read -r -t 5 _ status _ <&3
+[ "$status" = "200" ]
+'''
+
+    # ========================
+    # docker/postgres - streaming replication for the db-replica service
+    # ========================
+    primary_init_content = '''#!/bin/bash
+# Runs once, when the db service creates its data directory: adds the role
+# db-replica streams WAL with and lets it connect for replication.
+set -e
+psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-EOSQL
+    CREATE ROLE "$REPLICATION_USER" WITH REPLICATION LOGIN PASSWORD '$REPLICATION_PASSWORD';
+EOSQL
+echo "host replication $REPLICATION_USER all scram-sha-256" >> "$PGDATA/pg_hba.conf"
+'''
+
+    replica_entrypoint_content = '''#!/bin/bash
+# db-replica entrypoint: clones db with pg_basebackup on first start, then
+# runs as a hot standby following it (-R writes standby.signal and
+# primary_conninfo). Remove the postgres_replica_data volume to re-clone.
+set -e
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_isready -h db -U "$REPLICATION_USER"; do sleep 1; done
+    pg_basebackup -h db -U "$REPLICATION_USER" -D "$PGDATA" -R -X stream
+    chmod 0700 "$PGDATA"
+fi
+exec postgres
 '''
 
     # ========================
@@ -249,6 +439,11 @@ services:
     tty: true
 '''
 
+    if server_mode == 'async':
+        docker_compose_override = docker_compose_override.replace(
+            'flask run --host=0.0.0.0', f'uvicorn {target} --host 0.0.0.0 --port 5000 --reload'
+        )
+
     if db_type == 'postgres':
         docker_compose_override += '''
   db:
@@ -265,11 +460,24 @@ services:
         f.write(dockerfile_content)
     click.echo("✅ Created Dockerfile (multi-stage production build)")
 
+    with open(project_path / 'healthcheck.sh', 'w', encoding='utf-8', newline='\n') as f:
+        f.write(healthcheck_content)
+    (project_path / 'healthcheck.sh').chmod(0o755)
+    click.echo("✅ Created healthcheck.sh (container probe for /livez and /readyz)")
+
     with open(project_path / 'docker-compose.yml', 'w', encoding='utf-8') as f:
         f.write(docker_compose_content)
 
     if db_type == 'postgres':
-        click.echo("✅ Created docker-compose.yml (with PostgreSQL service)")
+        click.echo("✅ Created docker-compose.yml (with PostgreSQL service and read replica)")
+        postgres_path = project_path / 'docker' / 'postgres'
+        postgres_path.mkdir(parents=True, exist_ok=True)
+        for name, content in (('primary-init.sh', primary_init_content),
+                              ('replica-entrypoint.sh', replica_entrypoint_content)):
+            with open(postgres_path / name, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(content)
+            (postgres_path / name).chmod(0o755)
+        click.echo("✅ Created docker/postgres/ (streaming replication scripts)")
     else:
         click.echo("✅ Created docker-compose.yml (SQLite version)")
 
@@ -281,11 +489,14 @@ services:
         f.write(dockerignore_content)
     click.echo("✅ Created .dockerignore")
 
+    if pgbouncer:
+        _create_pgbouncer_benchmark(project_path)
+
     # Print Docker usage instructions
-    _print_docker_usage(db_type)
+    _print_docker_usage(db_type, pgbouncer)
 
 
-def _print_docker_usage(db_type):
+def _print_docker_usage(db_type, pgbouncer=False):
     """Print Docker usage instructions"""
     click.echo("\n" + "=" * 70)
     click.echo("🐳 Docker Setup Complete!")
@@ -311,7 +522,11 @@ def _print_docker_usage(db_type):
         click.echo("   Port: 5432")
         click.echo("   User: flaskuser")
         click.echo("   Password: flaskpassword")
-        click.echo("   Database: flaskmeridian_db\n")
+        click.echo("   Database: flaskmeridian_db")
+        click.echo("   Read replica: db-replica (localhost:5433), with --profile replicas")
+        if pgbouncer:
+            click.echo("   PgBouncer: pgbouncer (localhost:6432), the app's DATABASE_URL")
+        click.echo("")
 
     click.echo("Development Mode:")
     click.echo("   - docker-compose.override.yml enables FLASK_DEBUG=True")
@@ -331,4 +546,218 @@ def _print_docker_usage(db_type):
     if db_type == 'postgres':
         click.echo("   docker-compose exec db psql -U flaskuser -d flaskmeridian_db  # Access database\n")
     else:
-        click.echo("")
\ No newline at end of file
+        click.echo("")
+
+def _create_pgbouncer_benchmark(project_path):
+    """Create benchmarks/pgbouncer_connections.py (server connections vs app replicas)"""
+    # ========================
+    # benchmarks/pgbouncer_connections.py
+    # ========================
+    benchmark_content = '''"""Load test: PostgreSQL server connections as app replicas scale, direct vs PgBouncer
+
+Usage:
+    docker-compose up -d db pgbouncer
+    python -m benchmarks.pgbouncer_connections [--replicas 1,2,4] [--workers 4]
+                                               [--direct-url URL] [--bouncer-url URL]
+
+Each app replica is a gunicorn server with --workers sync workers, like one
+app container. Its endpoint holds a database connection for --query-ms
+(pg_sleep) while --concurrency clients per replica keep every worker busy.
+A monitor connection samples pg_stat_activity meanwhile, and the report
+shows the most server connections the replicas had open at once:
+- direct     workers connect to PostgreSQL: replicas x workers x pool size
+- pgbouncer  workers connect to the bouncer: flat at its DEFAULT_POOL_SIZE
+
+--bouncer-url defaults to DATABASE_URL from .env, --direct-url to the
+same URL on port 5432.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
+
+QUERY_SECONDS = float(os.getenv('BENCH_QUERY_MS', 20)) / 1000
+
+SERVER_CONNECTIONS = text(
+    "SELECT count(*) FROM pg_stat_activity WHERE datname = current_database() "
+    "AND backend_type = 'client backend' AND pid <> pg_backend_pid()"
+)
+
+
+# ========================
+# App under test (gunicorn factory)
+# ========================
+def bench_app():
+    from app import create_app
+    from db.database import db
+
+    app = create_app()
+
+    @app.route('/bench/db')
+    def bench_db():
+        db.session.execute(text('SELECT pg_sleep(:seconds)'), {'seconds': QUERY_SECONDS})
+        return {'ok': True}
+
+    return app
+
+
+# ========================
+# Connection monitor
+# ========================
+class ConnectionMonitor:
+    """Sample the database's client connections in a background thread"""
+
+    def __init__(self, url, interval=0.05):
+        self.engine = create_engine(url, poolclass=NullPool)
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def count(self):
+        with self.engine.connect() as connection:
+            return connection.execute(SERVER_CONNECTIONS).scalar()
+
+    def __enter__(self):
+        self.peak = 0
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        with self.engine.connect() as connection:
+            while not self._stop.is_set():
+                self.peak = max(self.peak, connection.execute(SERVER_CONNECTIONS).scalar())
+                connection.rollback()
+                time.sleep(self.interval)
+
+
+# ========================
+# Load generator
+# ========================
+async def _request(port):
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b'GET /bench/db HTTP/1.1\\r\\nHost: localhost\\r\\nConnection: close\\r\\n\\r\\n')
+    await writer.drain()
+    status_line = await reader.readline()
+    await reader.read()
+    writer.close()
+    return int(status_line.split()[1]), time.perf_counter() - start
+
+
+async def _load(ports, concurrency, total):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(port):
+        async with semaphore:
+            try:
+                return await _request(port)
+            except (OSError, IndexError, ValueError):
+                return None, 0.0
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one(ports[i % len(ports)]) for i in range(total)))
+    return results, time.perf_counter() - started
+
+
+def _wait_ready(port, server, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError('gunicorn exited; run from the project root')
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/livez', timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('gunicorn did not become ready')
+
+
+def run(mode, url, replicas, monitor, args):
+    env = dict(os.environ, DATABASE_URL=url, DB_PGBOUNCER=str(mode == 'pgbouncer'),
+               BENCH_QUERY_MS=str(args.query_ms), GUNICORN_WORKER_CLASS='sync',
+               PROMETHEUS_MULTIPROC_DIR='', SQL_INSTRUMENTATION='off', DATABASE_REPLICA_URLS='')
+    ports = [args.port + i for i in range(replicas)]
+    servers = [
+        subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+             'benchmarks.pgbouncer_connections:bench_app()',
+             '--bind', f'127.0.0.1:{port}', '--workers', str(args.workers),
+             '--access-logfile', '/dev/null'],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        for port in ports
+    ]
+    try:
+        for port, server in zip(ports, servers):
+            _wait_ready(port, server)
+        baseline = monitor.count()
+        with monitor:
+            results, elapsed = asyncio.run(
+                _load(ports, args.concurrency * replicas, args.requests * replicas)
+            )
+    finally:
+        for server in servers:
+            server.send_signal(signal.SIGTERM)
+        for server in servers:
+            server.wait(timeout=30)
+
+    ok = sum(1 for status, _ in results if status == 200)
+    return (f'{mode:<11}{replicas:>9}{args.workers:>9}{monitor.peak - baseline:>14}'
+            f'{ok / elapsed:>10.0f}{len(results) - ok:>8}')
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--replicas', default='1,2,4')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--concurrency', type=int, default=16, help='clients per replica')
+    parser.add_argument('--requests', type=int, default=500, help='requests per replica')
+    parser.add_argument('--query-ms', type=float, default=20)
+    parser.add_argument('--bouncer-url', default=os.getenv('DATABASE_URL'))
+    parser.add_argument('--direct-url')
+    parser.add_argument('--port', type=int, default=5070)
+    args = parser.parse_args()
+
+    bouncer_url = make_url(args.bouncer_url)
+    if bouncer_url.get_backend_name() != 'postgresql':
+        parser.error('needs a PostgreSQL DATABASE_URL (--bouncer-url)')
+    direct_url = make_url(args.direct_url) if args.direct_url else bouncer_url.set(port=5432)
+    modes = {
+        'direct': direct_url.render_as_string(hide_password=False),
+        'pgbouncer': bouncer_url.render_as_string(hide_password=False),
+    }
+    # pg_stat_activity is read on PostgreSQL itself, not through the bouncer
+    monitor = ConnectionMonitor(modes['direct'])
+
+    print(f"{'mode':<11}{'replicas':>9}{'workers':>9}{'server conns':>14}{'req/s':>10}{'errors':>8}")
+    for mode, url in modes.items():
+        for replicas in (int(n) for n in args.replicas.split(',')):
+            print(run(mode, url, replicas, monitor, args), flush=True)
+
+
+if __name__ == '__main__':
+    main()
+'''
+    benchmarks_path = project_path / 'benchmarks'
+    benchmarks_path.mkdir(exist_ok=True)
+    with open(benchmarks_path / 'pgbouncer_connections.py', 'w', encoding='utf-8') as f:
+        f.write(benchmark_content)
+    click.echo("✅ Created benchmarks/pgbouncer_connections.py")
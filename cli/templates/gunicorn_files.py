@@ -0,0 +1,298 @@
+"""Gunicorn configuration generator - gunicorn.conf.py with worker lifecycle hooks"""
+import click
+
+
+def create(project_path):
+    """Create gunicorn.conf.py used by the Dockerfile and docker-compose,
+    and benchmarks/worker_memory.py measuring its preload setting
+
+    Args:
+        project_path: Path to project directory
+    """
+
+    gunicorn_content = '''"""Gunicorn configuration for FlaskMeridian app
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app      (sync workers)
+    gunicorn -c gunicorn.conf.py asgi:app     (async server mode, uvicorn workers)
+
+With GUNICORN_WORKER_CLASS=gevent, gevent_patch is the first module this
+file imports, ahead of dotenv and the app, so nothing holds an unpatched
+lock or socket. The setting is read from the environment or .env.
+
+Settings can be overridden from the environment (GUNICORN_WORKERS, ...).
+
+With GUNICORN_PRELOAD=True (the default) the app is imported once in the
+master and workers are forked from it. gc.freeze() before each fork moves
+every object the master created into a permanent generation the collector
+never scans, so the workers' collections do not write to (and copy) the
+shared pages. Each worker disposes the inherited connection pools, so no
+database connection is shared between processes.
+
+Each worker runs lifecycle.warm_up() before accepting connections, so it
+only takes traffic once its pool is open and templates are compiled.
+
+Workers whose RSS grows past GUNICORN_MAX_WORKER_RSS_MB are restarted
+gracefully: the worker finishes the request in flight, exits, and the
+master forks a fresh one. The route that pushed it over the ceiling is
+logged. GUNICORN_MAX_REQUESTS recycles workers after a number of requests
+regardless of memory. Uvicorn workers (GUNICORN_WORKER_CLASS in async
+server mode) do not call the per-request hooks, so there only
+GUNICORN_MAX_REQUESTS applies.
+"""
+import os
+
+
+def _env_worker_class():
+    """GUNICORN_WORKER_CLASS from the environment, else from .env
+
+    Parsed by hand: dotenv imports logging and threading, which gevent has
+    to patch first.
+    """
+    value = os.environ.get('GUNICORN_WORKER_CLASS')
+    if value is None and os.path.exists('.env'):
+        with open('.env', encoding='utf-8') as f:
+            for line in f:
+                key, _, rest = line.partition('=')
+                if key.strip() == 'GUNICORN_WORKER_CLASS':
+                    value = rest.split('#')[0].strip().strip('\\'"')
+    return value
+
+
+if _env_worker_class() == 'gevent':
+    import gevent_patch  # noqa: F401  (must run before any other import)
+
+import gc  # noqa: E402
+import resource  # noqa: E402
+import shutil  # noqa: E402
+
+from dotenv import load_dotenv  # noqa: E402
+
+# Read GUNICORN_* settings from .env too (the environment takes precedence)
+load_dotenv()
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', 4))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'sync')
+# Concurrent requests per gevent or uvicorn worker
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True').lower() in ('true', '1', 'yes')
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 100))
+accesslog = '-'
+errorlog = '-'
+
+# Worker memory ceiling in MiB (0 disables the watchdog)
+max_worker_rss_mb = int(os.getenv('GUNICORN_MAX_WORKER_RSS_MB', 512))
+
+
+def _rss_mb():
+    """Current resident set size of this process in MiB"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError):
+        # Not Linux: peak RSS is the closest cheap measure (KiB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if os.uname().sysname == 'Darwin' else peak / 1024
+
+
+def _flask_app(app):
+    """The Flask app behind a loaded application (asgi.py wraps it)"""
+    return getattr(app, 'flask_app', app)
+
+
+def _dispose_engines(server, close):
+    """Dispose the SQLAlchemy pools of the preloaded app"""
+    from db.database import db
+    app = _flask_app(server.app.wsgi())
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=close)
+
+
+def on_starting(server):
+    """Reset the Prometheus multiprocess directory before any worker starts
+
+    Files left by a previous run would otherwise be aggregated forever.
+    """
+    path = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def when_ready(server):
+    """Compile templates once for all workers, then close the master's connections"""
+    if preload_app:
+        from lifecycle import warm_up
+        warm_up(_flask_app(server.app.wsgi()), steps=('templates', 'url_rules'))
+        _dispose_engines(server, close=True)
+
+
+def pre_fork(server, worker):
+    """Freeze the master's objects so workers share their pages"""
+    if preload_app:
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    """Drop pool state inherited from the master without closing its sockets"""
+    if preload_app:
+        _dispose_engines(server, close=False)
+
+
+def post_worker_init(worker):
+    """Warm the worker up before it accepts its first connection"""
+    from lifecycle import warm_up
+    app = _flask_app(worker.wsgi)
+    if worker_class == 'gevent':
+        # argon2 would otherwise hold the hub for the whole hash
+        gevent_patch.offload_password_hashing(app)
+    state = warm_up(app)
+    worker.log.info('Worker %s ready (warm-up %s ms): %s', worker.pid, state.get('ms', 0), state['steps'])
+
+
+def pre_request(worker, req):
+    if max_worker_rss_mb:
+        worker.rss_before_request = _rss_mb()
+
+
+def post_request(worker, req, environ, resp):
+    """Restart this worker gracefully once it exceeds the RSS ceiling"""
+    if not max_worker_rss_mb or not worker.alive:
+        return
+    rss = _rss_mb()
+    if rss > max_worker_rss_mb:
+        growth = rss - getattr(worker, 'rss_before_request', rss)
+        worker.log.warning(
+            'Worker %s RSS %.0f MiB exceeds %d MiB after %s %s (+%.1f MiB); restarting it',
+            worker.pid, rss, max_worker_rss_mb, req.method, req.path, growth,
+        )
+        # Finish the current request, then exit; the master forks a replacement
+        worker.alive = False
+
+
+def child_exit(server, worker):
+    """Drop the live gauges (in-flight requests, pool usage) of an exited worker"""
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
+'''
+    with open(project_path / 'gunicorn.conf.py', 'w', encoding='utf-8') as f:
+        f.write(gunicorn_content)
+
+    # ========================
+    # benchmarks/worker_memory.py
+    # ========================
+    benchmark_content = '''"""Memory benchmark: gunicorn workers with and without preload + gc.freeze
+
+Usage:
+    python -m benchmarks.worker_memory [--workers 4] [--requests 200]
+
+Starts gunicorn twice (GUNICORN_PRELOAD=False, then True), warms the
+workers with a few requests and reports RSS, PSS (RSS with shared pages
+divided among the processes sharing them) and USS (memory private to the
+process, i.e. what would be freed if it exited) for every worker.
+Linux only: the numbers come from /proc/<pid>/smaps_rollup.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def _smaps(pid):
+    """Return (rss, pss, uss) in KiB for a process"""
+    values = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                values[parts[0].rstrip(':')] = int(parts[1])
+    uss = values.get('Private_Clean', 0) + values.get('Private_Dirty', 0)
+    return values.get('Rss', 0), values.get('Pss', 0), uss
+
+
+def _children(pid):
+    children = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces; fields resume after ')'
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == pid:
+            children.append(int(entry))
+    return sorted(children)
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            response.read()
+            return True
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def measure(preload, workers, requests, port):
+    env = dict(os.environ, GUNICORN_PRELOAD=str(preload), PROMETHEUS_MULTIPROC_DIR='')
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:app',
+         '--bind', f'127.0.0.1:{port}', '--workers', str(workers)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base = f'http://127.0.0.1:{port}'
+    try:
+        deadline = time.monotonic() + 60
+        while len(_children(server.pid)) < workers or not _get(f'{base}/health'):
+            if time.monotonic() > deadline or server.poll() is not None:
+                raise RuntimeError('gunicorn did not start; run from the project root')
+            time.sleep(0.2)
+
+        for i in range(requests):
+            _get(f'{base}/' if i % 2 else f'{base}/health')
+        time.sleep(1)
+
+        return _smaps(server.pid), [(pid, _smaps(pid)) for pid in _children(server.pid)]
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=200, help='Warm-up requests')
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+
+    for preload in (False, True):
+        master, workers = measure(preload, args.workers, args.requests, args.port)
+        label = 'preload + gc.freeze' if preload else 'no preload'
+        print(f'\\n{label}')
+        print(f"{'process':<16}{'RSS MiB':>10}{'PSS MiB':>10}{'USS MiB':>10}")
+        print(f"{'master':<16}" + ''.join(f'{kib / 1024:>10.1f}' for kib in master))
+        for pid, values in workers:
+            print(f"{f'worker {pid}':<16}" + ''.join(f'{kib / 1024:>10.1f}' for kib in values))
+        totals = [sum(values[i] for _, values in workers) + master[i] for i in range(3)]
+        print(f"{'total':<16}{'':>10}{totals[1] / 1024:>10.1f}{totals[2] / 1024:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
+'''
+    with open(project_path / 'benchmarks' / 'worker_memory.py', 'w', encoding='utf-8') as f:
+        f.write(benchmark_content)
+
+    click.echo("✅ Created gunicorn.conf.py (preload + gc.freeze, worker lifecycle hooks)")
+    click.echo("✅ Created benchmarks/worker_memory.py")
@@ -42,6 +42,12 @@ def create_base(templates_path):
             margin: 0;
         }
 
+        header nav a {
+            color: white;
+            margin-right: 1rem;
+            text-decoration: none;
+        }
+
         main {
             background-color: white;
             padding: 2rem;
@@ -63,6 +69,20 @@ def create_base(templates_path):
     <header>
         <div class="container">
             <h1>{% block header_title %}Flask Application{% endblock %}</h1>
+            {# Navigation is identical for every user with the same roles #}
+            {% cache 'nav', 600, 'role' %}
+            <nav>
+                <a href="{{ url_for('main.index') }}">Home</a>
+                {% if current_user is defined %}
+                    {% if current_user.is_authenticated %}
+                        <a href="{{ url_for('security.logout') }}">Sign out</a>
+                    {% else %}
+                        <a href="{{ url_for('security.login') }}">Sign in</a>
+                        <a href="{{ url_for('security.register') }}">Register</a>
+                    {% endif %}
+                {% endif %}
+            </nav>
+            {% endcache %}
         </div>
     </header>
 
@@ -72,9 +92,11 @@ def create_base(templates_path):
         {% endblock %}
     </main>
 
+    {% cache 'footer', 3600 %}
     <footer class="container">
         <p>&copy; 2024 Your Flask App. Built with FlaskMeridian.</p>
     </footer>
+    {% endcache %}
 
     <script src="{{ url_for('static', filename='js/script.js') }}"></script>
     {% block extra_js %}{% endblock %}
@@ -0,0 +1,377 @@
+"""Lifecycle files generator - worker warm-up, health probes and warm-up benchmark"""
+import click
+
+
+def create(project_path):
+    """Create the lifecycle/ package and benchmarks/warmup_latency.py
+
+    Args:
+        project_path: Path to project directory
+    """
+
+    lifecycle_path = project_path / 'lifecycle'
+    lifecycle_path.mkdir(exist_ok=True)
+
+    # ========================
+    # lifecycle/__init__.py
+    # ========================
+    init_content = '''"""Worker lifecycle module for FlaskMeridian app"""
+from .probes import init_probes
+from .warmup import is_warmup_request, warm_up
+
+__all__ = ['init_probes', 'is_warmup_request', 'warm_up']
+'''
+    with open(lifecycle_path / '__init__.py', 'w', encoding='utf-8') as f:
+        f.write(init_content)
+
+    # ========================
+    # lifecycle/warmup.py
+    # ========================
+    warmup_content = '''"""Worker warm-up
+
+Runs in every gunicorn worker after it loads the app and before it accepts
+connections (gunicorn.conf.py calls it from post_worker_init), so the first
+real requests do not pay for:
+- opening database connections (pool_size connections per engine)
+- loading and compiling Jinja templates
+- compiling the URL map's matcher
+- first-use work in views, forms and lazily imported modules
+  (internal test-client GETs of WARMUP_ROUTES)
+
+With preload_app the template and URL map steps also run once in the
+gunicorn master, so the compiled templates are shared by every worker.
+
+The result is stored in ``app.extensions['warmup']``; /readyz reports the
+worker as not ready until it has finished. Warm-up requests are not counted
+in metrics, traced or profiled (see ``is_warmup_request``).
+"""
+import logging
+from time import perf_counter
+
+from sqlalchemy import text
+from werkzeug.exceptions import HTTPException
+
+from db.database import db
+
+logger = logging.getLogger(__name__)
+
+# Set in the WSGI environ of warm-up requests; clients cannot send it
+WARMUP_ENVIRON_KEY = 'flaskmeridian.warmup'
+
+
+def is_warmup_request(environ):
+    """Whether a request was sent by the worker's own warm-up"""
+    return bool(environ.get(WARMUP_ENVIRON_KEY))
+
+
+def _open_pool_connections(app):
+    """Open pool_size connections per engine and return them to the pool"""
+    opened = 0
+    with app.app_context():
+        for engine in db.engines.values():
+            size = engine.pool.size() if hasattr(engine.pool, 'size') else 1
+            connections = []
+            try:
+                for _ in range(size):
+                    connection = engine.connect()
+                    connection.execute(text('SELECT 1'))
+                    connections.append(connection)
+            finally:
+                for connection in connections:
+                    connection.close()
+            opened += len(connections)
+    return opened
+
+
+def _load_templates(app):
+    """Compile every template into the environment's in-memory cache"""
+    loaded = 0
+    for name in app.jinja_env.list_templates(extensions=('html', 'txt', 'xml')):
+        try:
+            app.jinja_env.get_template(name)
+            loaded += 1
+        except Exception:
+            logger.warning('Warm-up could not load template %s', name, exc_info=True)
+    return loaded
+
+
+def _exercise_url_map(app):
+    """Match and build every rule without arguments"""
+    adapter = app.url_map.bind('localhost')
+    exercised = 0
+    for rule in app.url_map.iter_rules():
+        if rule.arguments:
+            continue
+        method = next(iter(rule.methods - {'HEAD', 'OPTIONS'}), 'GET')
+        try:
+            adapter.match(adapter.build(rule.endpoint, method=method), method=method)
+        except HTTPException:
+            pass  # Redirects and method mismatches still compiled the matcher
+        exercised += 1
+    return exercised
+
+
+def _request_routes(app, routes):
+    """GET each route through the test client; return {route: status}"""
+    statuses = {}
+    client = app.test_client()
+    for route in routes:
+        try:
+            response = client.get(
+                route, headers={'X-Warmup': '1'}, environ_base={WARMUP_ENVIRON_KEY: True},
+            )
+            statuses[route] = response.status_code
+            response.close()
+        except Exception:
+            logger.warning('Warm-up request to %s failed', route, exc_info=True)
+            statuses[route] = None
+    return statuses
+
+
+STEPS = ('connections', 'templates', 'url_rules', 'routes')
+
+
+def warm_up(app, steps=STEPS):
+    """Run the warm-up steps and record the result in app.extensions['warmup']"""
+    state = app.extensions['warmup'] = {'ready': False, 'steps': {}}
+    if not app.config.get('WARMUP_ENABLED', True):
+        state['ready'] = True
+        return state
+
+    routes = [route.strip() for route in app.config.get('WARMUP_ROUTES', '/').split(',') if route.strip()]
+    available = {
+        'connections': lambda: _open_pool_connections(app),
+        'templates': lambda: _load_templates(app),
+        'url_rules': lambda: _exercise_url_map(app),
+        'routes': lambda: _request_routes(app, routes),
+    }
+
+    started = perf_counter()
+    for name in steps:
+        step = available[name]
+        step_started = perf_counter()
+        try:
+            result = step()
+        except Exception:
+            # A failed step only loses its speed-up; the worker still serves
+            logger.exception('Warm-up step %s failed', name)
+            result = None
+        state['steps'][name] = {
+            'result': result,
+            'ms': round((perf_counter() - step_started) * 1000, 1),
+        }
+
+    state['ms'] = round((perf_counter() - started) * 1000, 1)
+    state['ready'] = True
+    return state
+'''
+    with open(lifecycle_path / 'warmup.py', 'w', encoding='utf-8') as f:
+        f.write(warmup_content)
+
+    # ========================
+    # benchmarks/warmup_latency.py
+    # ========================
+    benchmark_content = '''"""Latency benchmark: first requests to fresh workers, with and without warm-up
+
+Usage:
+    python -m benchmarks.warmup_latency [--workers 4] [--requests 40] [--routes /,/login]
+
+Starts gunicorn twice (WARMUP_ENABLED=False, then True). Once every worker
+has logged that it is ready (after its warm-up, when enabled), it sends
+--requests requests per worker concurrently and reports p50 / p99 / max
+latency: the requests users hit right after a deploy.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _count_ready(stream, ready):
+    """Count the workers' ready log lines (keeps draining the pipe afterwards)"""
+    for line in stream:
+        if 'ready (warm-up' in line:
+            ready.release()
+
+
+def _timed_get(url):
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            response.read()
+    except urllib.error.HTTPError:
+        pass
+    return (time.perf_counter() - start) * 1000
+
+
+def _percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def measure(warmup, workers, requests, routes, port):
+    env = dict(os.environ, WARMUP_ENABLED=str(warmup), PROMETHEUS_MULTIPROC_DIR='')
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:app',
+         '--bind', f'127.0.0.1:{port}', '--workers', str(workers)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    ready = threading.Semaphore(0)
+    threading.Thread(target=_count_ready, args=(server.stderr, ready), daemon=True).start()
+    try:
+        for _ in range(workers):
+            if not ready.acquire(timeout=60):
+                raise RuntimeError('gunicorn workers did not start; run from the project root')
+
+        urls = [f'http://127.0.0.1:{port}{routes[i % len(routes)]}' for i in range(requests * workers)]
+        with ThreadPoolExecutor(max_workers=workers * 2) as pool:
+            return list(pool.map(_timed_get, urls))
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=40, help='Requests per worker')
+    parser.add_argument('--routes', default='/', help='Comma-separated routes to request')
+    parser.add_argument('--port', type=int, default=5056)
+    args = parser.parse_args()
+    routes = [route.strip() for route in args.routes.split(',') if route.strip()]
+
+    print(f"{'warm-up':<10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for warmup in (False, True):
+        latencies = measure(warmup, args.workers, args.requests, routes, args.port)
+        print(f"{'on' if warmup else 'off':<10}"
+              f'{_percentile(latencies, 50):>10.1f}{_percentile(latencies, 99):>10.1f}{max(latencies):>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
+'''
+    with open(project_path / 'benchmarks' / 'warmup_latency.py', 'w', encoding='utf-8') as f:
+        f.write(benchmark_content)
+
+    # ========================
+    # lifecycle/probes.py
+    # ========================
+    probes_content = '''"""Liveness and readiness probes answered below Flask
+
+ProbeMiddleware wraps the WSGI app and answers two paths before Flask
+routing, sessions, request hooks, metrics or tracing run:
+
+- /livez   200 while the process can serve HTTP at all
+- /readyz  200 when warm-up has finished and every database engine answers
+           ``SELECT 1``; 503 with the failing checks otherwise
+
+Database checks are cached for READYZ_CACHE_SECONDS, so frequent probes
+from several orchestrators cost at most one query per worker per interval.
+"""
+import json
+import threading
+from time import monotonic
+
+from sqlalchemy import text
+
+from db.database import db
+from db.replicas import is_replica_bind
+
+LIVEZ = b'ok\\n'
+
+
+class ProbeMiddleware:
+    """Serve /livez and /readyz without dispatching into Flask"""
+
+    def __init__(self, wsgi_app, app):
+        self.wsgi_app = wsgi_app
+        self.app = app
+        self.ttl = app.config.get('READYZ_CACHE_SECONDS', 2.0)
+        self._lock = threading.Lock()
+        self._checked_at = None
+        self._db_checks = {}
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO')
+        if path == '/livez':
+            start_response('200 OK', [
+                ('Content-Type', 'text/plain'),
+                ('Content-Length', str(len(LIVEZ))),
+                ('Cache-Control', 'no-store'),
+            ])
+            return [LIVEZ]
+        if path == '/readyz':
+            return self._readyz(start_response)
+        return self.wsgi_app(environ, start_response)
+
+    def _check_databases(self):
+        """Run SELECT 1 on every engine; return {bind: 'ok' | error}"""
+        checks = {}
+        with self.app.app_context():
+            for bind, engine in db.engines.items():
+                name = bind or 'default'
+                try:
+                    with engine.connect() as connection:
+                        connection.execute(text('SELECT 1'))
+                    status = 'ok'
+                except Exception as e:
+                    status = f'{type(e).__name__}: {e}'[:200]
+                pool = engine.pool
+                checks[name] = {
+                    'status': status,
+                    'checked_out': pool.checkedout() if hasattr(pool, 'checkedout') else None,
+                    'pool_size': pool.size() if hasattr(pool, 'size') else None,
+                }
+        return checks
+
+    def _database_status(self):
+        now = monotonic()
+        if self._checked_at is None or now - self._checked_at >= self.ttl:
+            # One thread refreshes; the others keep answering from the cache
+            if self._lock.acquire(blocking=self._checked_at is None):
+                try:
+                    self._db_checks = self._check_databases()
+                    self._checked_at = monotonic()
+                finally:
+                    self._lock.release()
+        return self._db_checks
+
+    def _readyz(self, start_response):
+        warmed_up = self.app.extensions.get('warmup', {}).get('ready', True)
+        databases = self._database_status()
+        # A failing read replica is ejected, not a reason to stop serving
+        ready = warmed_up and all(check['status'] == 'ok' for name, check in databases.items()
+                                  if not is_replica_bind(name))
+
+        body = json.dumps({
+            'status': 'ready' if ready else 'unavailable',
+            'warmed_up': warmed_up,
+            'databases': databases,
+        }).encode('utf-8')
+        start_response('200 OK' if ready else '503 Service Unavailable', [
+            ('Content-Type', 'application/json'),
+            ('Content-Length', str(len(body))),
+            ('Cache-Control', 'no-store'),
+        ])
+        return [body]
+
+
+def init_probes(app):
+    """Install /livez and /readyz in front of the app and any other middleware
+
+    Call last in create_app so the probes bypass every other wrapper.
+    """
+    app.wsgi_app = ProbeMiddleware(app.wsgi_app, app)
+'''
+    with open(lifecycle_path / 'probes.py', 'w', encoding='utf-8') as f:
+        f.write(probes_content)
+
+    click.echo("✅ Created lifecycle/warmup.py (post-fork worker warm-up)")
+    click.echo("✅ Created lifecycle/probes.py (/livez and /readyz below Flask)")
+    click.echo("✅ Created benchmarks/warmup_latency.py")
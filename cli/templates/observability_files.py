@@ -0,0 +1,1396 @@
+"""Observability files generator - SQL instrumentation, metrics and tracing"""
+import click
+
+
+def create(project_path):
+    """Create the observability/ package
+
+    Args:
+        project_path: Path to project directory
+    """
+
+    observability_path = project_path / 'observability'
+    observability_path.mkdir(exist_ok=True)
+
+    # ========================
+    # observability/__init__.py
+    # ========================
+    init_content = '''"""Observability module for FlaskMeridian app"""
+from .metrics import init_metrics
+from .profiling import init_profiling
+from .sql import sql_instrumentation
+from .tracing import init_tracing, outbound_span
+
+__all__ = ['init_metrics', 'init_profiling', 'init_tracing', 'outbound_span', 'sql_instrumentation']
+'''
+    with open(observability_path / '__init__.py', 'w', encoding='utf-8') as f:
+        f.write(init_content)
+
+    # ========================
+    # observability/sql.py
+    # ========================
+    sql_content = '''"""Per-request SQL instrumentation
+
+Hooks SQLAlchemy's before/after_cursor_execute events on every engine and
+Flask's request hooks to record, for each instrumented request:
+- the number of statements and total database time, sent back in a
+  ``Server-Timing`` header (visible in the browser dev tools)
+- statements repeated with different parameters (N+1 candidates)
+- statements slower than SQL_SLOW_QUERY_MS
+
+SQL_INSTRUMENTATION in .env selects the mode:
+- auto     every request when FLASK_DEBUG is on, sampled otherwise
+- on       every request
+- sample   a SQL_SAMPLE_RATE fraction of requests
+- off      disabled
+
+Process-wide statement totals are kept in ``sql_instrumentation.hot``
+(bounded). Every SQL_HOT_FLUSH_SECONDS each worker writes them to
+SQL_HOT_DIR, where ``flask db advise`` reads the hot statements of all
+workers. Files not rewritten for a few flush intervals (exited workers)
+are removed on the next flush.
+"""
+import atexit
+import glob
+import json
+import logging
+import os
+import random
+import threading
+from collections import Counter
+from time import monotonic, perf_counter, time
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Flush intervals after which a hot statements file is considered abandoned
+HOT_STALE_FLUSHES = 5
+
+
+class RequestSQLStats:
+    """Statements executed while handling one request"""
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = Counter()
+
+    def record(self, statement, seconds):
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold):
+        """Statements executed at least ``threshold`` times"""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+class HotStatements:
+    """Bounded process-wide totals per statement"""
+
+    def __init__(self, max_entries=500):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._totals = {}
+
+    def record(self, statement, seconds, count=1):
+        with self._lock:
+            entry = self._totals.get(statement)
+            if entry is None:
+                if len(self._totals) >= self.max_entries:
+                    # Forget the cheapest statement to make room
+                    cheapest = min(self._totals, key=lambda sql: self._totals[sql][1])
+                    del self._totals[cheapest]
+                entry = self._totals[statement] = [0, 0.0]
+            entry[0] += count
+            entry[1] += seconds
+
+    def top(self, limit=20):
+        """Return [(statement, count, total_seconds)] by total time, highest first"""
+        with self._lock:
+            items = [(sql, count, seconds) for sql, (count, seconds) in self._totals.items()]
+        return sorted(items, key=lambda item: item[2], reverse=True)[:limit]
+
+    def clear(self):
+        with self._lock:
+            self._totals.clear()
+
+    def dump(self, path):
+        """Write the totals to a JSON file (replaced atomically)"""
+        with self._lock:
+            items = [[sql, count, seconds] for sql, (count, seconds) in self._totals.items()]
+        partial = f'{path}.{threading.get_ident()}.tmp'
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump(items, f)
+        os.replace(partial, path)
+
+    def load(self, directory):
+        """Add the totals every worker dumped into directory"""
+        for path in glob.glob(os.path.join(directory, 'hot-*.json')):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    items = json.load(f)
+            except (OSError, ValueError):
+                continue  # Being replaced, or not ours
+            for sql, count, seconds in items:
+                self.record(sql, seconds, count)
+
+
+class SQLInstrumentation:
+    """Collects per-request SQL statistics from SQLAlchemy engine events"""
+
+    def __init__(self):
+        self.mode = 'off'
+        self.sample_rate = 0.0
+        self.slow_query_seconds = 0.2
+        self.n_plus_one_threshold = 5
+        self.hot = HotStatements()
+        self.hot_dir = None
+        self.hot_flush_seconds = 60
+        self._hot_flushed = monotonic()
+        self._listening = False
+
+    def init_app(self, app):
+        """Read configuration and register engine and request hooks"""
+        mode = app.config.get('SQL_INSTRUMENTATION', 'auto')
+        if mode == 'auto':
+            mode = 'on' if app.debug else 'sample'
+        self.mode = mode
+        self.sample_rate = app.config.get('SQL_SAMPLE_RATE', 0.01)
+        self.slow_query_seconds = app.config.get('SQL_SLOW_QUERY_MS', 200) / 1000
+        self.n_plus_one_threshold = app.config.get('SQL_N_PLUS_ONE_THRESHOLD', 5)
+        self.hot_dir = app.config.get('SQL_HOT_DIR') or None
+        self.hot_flush_seconds = app.config.get('SQL_HOT_FLUSH_SECONDS', 60)
+        app.extensions['sql_instrumentation'] = self
+
+        if self.mode == 'off':
+            return
+
+        if not self._listening:
+            event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+            event.listen(Engine, 'handle_error', self._handle_error)
+            if self.hot_dir:
+                atexit.register(self.flush_hot)
+            self._listening = True
+
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+    # ========================
+    # Request hooks
+    # ========================
+    def _start_request(self):
+        if self.mode == 'on' or random.random() < self.sample_rate:
+            g.sql_stats = RequestSQLStats()
+
+    def _finish_request(self, response):
+        if self.hot_dir and monotonic() - self._hot_flushed >= self.hot_flush_seconds:
+            self.flush_hot()
+
+        stats = g.pop('sql_stats', None)
+        if stats is None:
+            return response
+
+        total_ms = (perf_counter() - stats.started) * 1000
+        db_ms = stats.seconds * 1000
+        response.headers.add(
+            'Server-Timing', f'db;dur={db_ms:.2f};desc="{stats.count} queries"'
+        )
+        response.headers.add('Server-Timing', f'app;dur={total_ms:.2f}')
+
+        for statement, count in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                'Possible N+1 on %s %s: statement ran %d times: %s',
+                request.method, request.path, count, _shorten(statement),
+            )
+        return response
+
+    def flush_hot(self):
+        """Write this worker's hot statements to SQL_HOT_DIR"""
+        self._hot_flushed = monotonic()
+        if not self.hot_dir:
+            return
+        try:
+            os.makedirs(self.hot_dir, exist_ok=True)
+            self.hot.dump(os.path.join(self.hot_dir, f'hot-{os.getpid()}.json'))
+        except OSError as exc:
+            logger.warning('Could not write hot statements to %s: %s', self.hot_dir, exc)
+            return
+        self._prune_hot()
+
+    def _prune_hot(self):
+        """Remove files of workers that stopped flushing (exited or restarted)"""
+        cutoff = time() - max(self.hot_flush_seconds * HOT_STALE_FLUSHES, 60)
+        for path in glob.glob(os.path.join(self.hot_dir, 'hot-*.json')):
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass  # Removed by another worker
+
+    # ========================
+    # Engine events
+    # ========================
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start_time', []).append(perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('query_start_time')
+        if not starts:
+            return
+        elapsed = perf_counter() - starts.pop()
+
+        self.hot.record(statement, elapsed)
+
+        if elapsed >= self.slow_query_seconds:
+            logger.warning('Slow query (%.1f ms): %s', elapsed * 1000, _shorten(statement))
+
+        if has_request_context():
+            stats = g.get('sql_stats')
+            if stats is not None:
+                stats.record(statement, elapsed)
+
+    def _handle_error(self, exception_context):
+        # after_cursor_execute does not run for a failed statement
+        connection = exception_context.connection
+        starts = connection.info.get('query_start_time') if connection is not None else None
+        if starts:
+            starts.pop()
+
+
+def _shorten(statement, limit=300):
+    statement = ' '.join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + '...'
+
+
+sql_instrumentation = SQLInstrumentation()
+'''
+    with open(observability_path / 'sql.py', 'w', encoding='utf-8') as f:
+        f.write(sql_content)
+
+    # ========================
+    # observability/metrics.py
+    # ========================
+    metrics_content = '''"""Prometheus metrics and /metrics endpoint
+
+Exposes per-endpoint latency histograms, in-flight request gauges,
+SQLAlchemy connection pool usage, password hashing timings and query cache
+hits, misses and database time saved. The query cache hit ratio is
+``rate(query_cache_hits_total[5m]) / (rate(query_cache_hits_total[5m]) +
+rate(query_cache_misses_total[5m]))``.
+
+Under gunicorn every worker is a separate process with its own counters.
+When PROMETHEUS_MULTIPROC_DIR is set (the Dockerfile does), each worker
+writes its values to memory-mapped files in that directory and /metrics
+aggregates all of them, whichever worker serves the scrape. gunicorn.conf.py
+empties the directory on startup and drops the live gauges of exited workers.
+
+Set METRICS_TOKEN in .env to require ``Authorization: Bearer <token>``.
+"""
+import hmac
+import os
+from time import perf_counter
+
+from flask import Response, abort, g, request
+from sqlalchemy import event
+
+_multiproc_dir = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+if _multiproc_dir:
+    # Must exist before the first metric is created
+    os.makedirs(_multiproc_dir, exist_ok=True)
+
+from prometheus_client import (  # noqa: E402 - needs PROMETHEUS_MULTIPROC_DIR first
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from lifecycle import is_warmup_request  # noqa: E402
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by endpoint',
+    ['method', 'endpoint', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'http_requests_in_flight',
+    'Requests currently being handled',
+    multiprocess_mode='livesum',
+)
+POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out_connections',
+    'Connections currently checked out of the pool',
+    ['bind'],
+    multiprocess_mode='livesum',
+)
+POOL_OVERFLOW = Gauge(
+    'db_pool_overflow_connections',
+    'Connections open beyond pool_size',
+    ['bind'],
+    multiprocess_mode='livesum',
+)
+POOL_CHECKOUTS = Counter(
+    'db_pool_checkouts_total',
+    'Connection checkouts from the pool',
+    ['bind'],
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    'password_hash_duration_seconds',
+    'Time spent hashing or verifying passwords (argon2)',
+    ['operation'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+QUERY_CACHE_HITS = Counter(
+    'query_cache_hits_total',
+    'ORM queries answered from the query cache',
+)
+QUERY_CACHE_MISSES = Counter(
+    'query_cache_misses_total',
+    'Cacheable ORM queries that went to the database',
+)
+QUERY_CACHE_SAVED_SECONDS = Counter(
+    'query_cache_saved_db_seconds_total',
+    'Database time the query cache hits would have cost',
+)
+
+
+def _endpoint_label():
+    # Endpoint names keep label cardinality bounded; raw paths would not
+    return request.endpoint or 'unmatched'
+
+
+def _start_request():
+    if is_warmup_request(request.environ):
+        return
+    g.metrics_start = perf_counter()
+    g.metrics_in_flight = True
+    REQUESTS_IN_FLIGHT.inc()
+
+
+def _observe(status, start):
+    REQUEST_LATENCY.labels(request.method, _endpoint_label(), status).observe(
+        perf_counter() - start
+    )
+
+
+def _record_request(response):
+    start = g.pop('metrics_start', None)
+    if start is not None:
+        _observe(str(response.status_code), start)
+    return response
+
+
+def _finish_request(exc):
+    start = g.pop('metrics_start', None)
+    if start is not None:
+        # after_request never ran because the view raised
+        _observe('500', start)
+    if g.pop('metrics_in_flight', False):
+        REQUESTS_IN_FLIGHT.dec()
+
+
+def _instrument_pool(bind, engine):
+    """Track checkouts and overflow of one engine's connection pool"""
+    pool = engine.pool
+    label = bind or 'default'
+
+    def update(*args):
+        if hasattr(pool, 'checkedout'):
+            POOL_CHECKED_OUT.labels(label).set(pool.checkedout())
+        if hasattr(pool, 'overflow'):
+            POOL_OVERFLOW.labels(label).set(max(pool.overflow(), 0))
+
+    def on_checkout(*args):
+        POOL_CHECKOUTS.labels(label).inc()
+        update()
+
+    event.listen(engine, 'checkout', on_checkout)
+    event.listen(engine, 'checkin', update)
+
+
+def _instrument_password_hashing(app):
+    """Time Flask-Security's argon2 hash and verify calls"""
+    security = app.extensions.get('security')
+    if security is None:
+        return
+    context = security.pwd_context
+
+    def timed(operation, func):
+        histogram = PASSWORD_HASH_SECONDS.labels(operation)
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(perf_counter() - start)
+        return wrapper
+
+    context.hash = timed('hash', context.hash)
+    context.verify = timed('verify', context.verify)
+
+
+def _instrument_query_cache(app):
+    """Count query cache hits and misses and the database time saved"""
+    query_cache = app.extensions.get('query_cache')
+    if query_cache is None or getattr(query_cache.stats, 'metered', False):
+        return  # Not set up, or already counted (one instance per process)
+    stats = query_cache.stats
+    record_hit, record_miss = stats.record_hit, stats.record_miss
+
+    def on_hit(saved_seconds):
+        QUERY_CACHE_HITS.inc()
+        QUERY_CACHE_SAVED_SECONDS.inc(saved_seconds)
+        record_hit(saved_seconds)
+
+    def on_miss(db_seconds):
+        QUERY_CACHE_MISSES.inc()
+        record_miss(db_seconds)
+
+    stats.record_hit = on_hit
+    stats.record_miss = on_miss
+    stats.metered = True
+
+
+def metrics_view():
+    """Serve metrics in the Prometheus text format"""
+    token = os.getenv('METRICS_TOKEN')
+    if token:
+        supplied = request.headers.get('Authorization', '').removeprefix('Bearer ')
+        if not hmac.compare_digest(supplied, token):
+            abort(401)
+
+    if _multiproc_dir:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
+
+
+def init_metrics(app):
+    """Register request hooks, pool listeners and the /metrics endpoint
+
+    Call after Flask-Security and the query cache are set up so password
+    hashing and cache hits are measured too.
+    """
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    app.before_request(_start_request)
+    app.after_request(_record_request)
+    app.teardown_request(_finish_request)
+
+    with app.app_context():
+        from db.database import db
+        for bind, engine in db.engines.items():
+            _instrument_pool(bind, engine)
+
+    _instrument_password_hashing(app)
+    _instrument_query_cache(app)
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+'''
+    with open(observability_path / 'metrics.py', 'w', encoding='utf-8') as f:
+        f.write(metrics_content)
+
+    # ========================
+    # observability/tracing.py
+    # ========================
+    tracing_content = '''"""Lightweight OpenTelemetry-style request tracing
+
+Opt in with TRACING_ENABLED=True. Spans are recorded for:
+- each WSGI request (server span, continues an incoming W3C ``traceparent``)
+- each SQL statement
+- each template render
+- argon2 password hash / verify
+- outbound HTTP calls made with ``requests`` or wrapped in ``outbound_span``
+
+Sampling is head-based: the decision is taken once when a request starts
+(TRACING_SAMPLE_RATE, or the sampled flag of an incoming traceparent) and
+inherited by every span of that request. Finished spans are queued and
+exported in batches by a background thread, so exporting never adds
+latency to the request itself.
+
+TRACING_EXPORTER selects where spans go:
+- file      JSON lines in TRACING_FILE (easy to inspect and test offline)
+- console   JSON lines on stderr
+- otlp      OTLP/HTTP JSON to OTEL_EXPORTER_OTLP_ENDPOINT (Jaeger, Tempo, ...)
+- module:Class   any class with export(spans) and shutdown() methods
+"""
+import atexit
+import contextvars
+import importlib
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+
+from flask import g, template_rendered, before_render_template
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from werkzeug.wsgi import ClosingIterator
+
+from lifecycle import is_warmup_request
+
+logger = logging.getLogger(__name__)
+
+SPAN_KIND = {'internal': 1, 'server': 2, 'client': 3}
+
+_current_span = contextvars.ContextVar('current_span', default=None)
+
+
+# ========================
+# Spans
+# ========================
+class SpanContext:
+    """Identifies a span and carries the sampling decision"""
+
+    __slots__ = ('trace_id', 'span_id', 'sampled')
+
+    def __init__(self, trace_id, span_id, sampled):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+    def traceparent(self):
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    @classmethod
+    def from_traceparent(cls, header):
+        """Parse a W3C traceparent header, or return None if it is invalid"""
+        try:
+            version, trace_id, span_id, flags = header.strip().split('-')
+            int(trace_id, 16), int(span_id, 16)
+            if len(trace_id) != 32 or len(span_id) != 16 or version == 'ff':
+                return None
+            return cls(trace_id, span_id, bool(int(flags, 16) & 1))
+        except (AttributeError, ValueError):
+            return None
+
+
+class Span:
+    """A timed operation within a trace"""
+
+    def __init__(self, tracer, name, context, parent_id=None, kind='internal', attributes=None):
+        self.tracer = tracer
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = dict(attributes or {})
+        self.status = 'unset'
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exc):
+        self.status = 'error'
+        self.attributes['exception.type'] = type(exc).__name__
+        self.attributes['exception.message'] = str(exc)
+
+    def end(self):
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.tracer.processor.on_end(self)
+
+    def to_dict(self):
+        return {
+            'trace_id': self.context.trace_id,
+            'span_id': self.context.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'kind': self.kind,
+            'start_ns': self.start_ns,
+            'end_ns': self.end_ns,
+            'duration_ms': round((self.end_ns - self.start_ns) / 1e6, 3),
+            'status': self.status,
+            'attributes': self.attributes,
+            'service': self.tracer.service_name,
+        }
+
+
+class _NonRecordingSpan:
+    """Stands in for spans of unsampled traces; only propagates the context"""
+
+    def __init__(self, context):
+        self.context = context
+
+    def set_attribute(self, key, value):
+        pass
+
+    def record_exception(self, exc):
+        pass
+
+    def end(self):
+        pass
+
+
+# ========================
+# Exporters
+# ========================
+class JSONLinesFileExporter:
+    """Append spans as JSON lines to a file"""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+
+    def export(self, spans):
+        lines = ''.join(json.dumps(span.to_dict(), default=str) + '\\n' for span in spans)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+    def shutdown(self):
+        pass
+
+
+class ConsoleExporter(JSONLinesFileExporter):
+    """Write spans as JSON lines to stderr"""
+
+    def __init__(self):
+        pass
+
+    def export(self, spans):
+        for span in spans:
+            sys.stderr.write(json.dumps(span.to_dict(), default=str) + '\\n')
+
+
+class OTLPHTTPExporter:
+    """Send spans to an OpenTelemetry collector with OTLP/HTTP JSON"""
+
+    def __init__(self, endpoint, service_name, timeout=5):
+        self.url = endpoint.rstrip('/') + '/v1/traces'
+        self.service_name = service_name
+        self.timeout = timeout
+
+    @staticmethod
+    def _value(value):
+        if isinstance(value, bool):
+            return {'boolValue': value}
+        if isinstance(value, int):
+            return {'intValue': str(value)}
+        if isinstance(value, float):
+            return {'doubleValue': value}
+        return {'stringValue': str(value)}
+
+    def _span(self, span):
+        data = {
+            'traceId': span.context.trace_id,
+            'spanId': span.context.span_id,
+            'name': span.name,
+            'kind': SPAN_KIND[span.kind],
+            'startTimeUnixNano': str(span.start_ns),
+            'endTimeUnixNano': str(span.end_ns),
+            'attributes': [
+                {'key': key, 'value': self._value(value)}
+                for key, value in span.attributes.items()
+            ],
+            'status': {'code': 2 if span.status == 'error' else 0},
+        }
+        if span.parent_id:
+            data['parentSpanId'] = span.parent_id
+        return data
+
+    def export(self, spans):
+        body = {
+            'resourceSpans': [{
+                'resource': {'attributes': [
+                    {'key': 'service.name', 'value': {'stringValue': self.service_name}},
+                ]},
+                'scopeSpans': [{
+                    'scope': {'name': 'flaskmeridian'},
+                    'spans': [self._span(span) for span in spans],
+                }],
+            }],
+        }
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(body).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+            method='POST',
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def shutdown(self):
+        pass
+
+
+def create_exporter(config):
+    """Build the exporter named by TRACING_EXPORTER"""
+    name = config.get('TRACING_EXPORTER', 'file')
+    if name == 'file':
+        return JSONLinesFileExporter(config.get('TRACING_FILE', 'instance/traces.jsonl'))
+    if name == 'console':
+        return ConsoleExporter()
+    if name == 'otlp':
+        return OTLPHTTPExporter(
+            config.get('OTEL_EXPORTER_OTLP_ENDPOINT', 'http://localhost:4318'),
+            config.get('TRACING_SERVICE_NAME', 'flaskmeridian-app'),
+        )
+    module_name, _, class_name = name.partition(':')
+    if not class_name:
+        raise ValueError(f"Unknown tracing exporter: {name}")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+# ========================
+# Batch span processor
+# ========================
+class BatchSpanProcessor:
+    """Queue finished spans and export them in batches on a background thread
+
+    The thread is started lazily in each process, so it also works when the
+    app is imported in the gunicorn master before workers are forked.
+    """
+
+    def __init__(self, exporter, max_queue_size=2048, max_batch_size=512, schedule_delay=2.0):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.schedule_delay = schedule_delay
+        self.dropped = 0
+        self._queue = queue.Queue(max_queue_size)
+        self._pid = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def on_end(self, span):
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            # Never block the request; losing a span is better
+            self.dropped += 1
+
+    def _ensure_thread(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(self._queue.maxsize)
+                self._thread = threading.Thread(
+                    target=self._run, name='span-exporter', daemon=True
+                )
+                self._thread.start()
+                self._pid = os.getpid()
+                atexit.register(self.flush)
+
+    def _drain(self, first=None):
+        batch = [] if first is None else [first]
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _export(self, batch):
+        if not batch:
+            return
+        try:
+            self.exporter.export(batch)
+        except Exception:
+            logger.exception('Failed to export %d spans', len(batch))
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def _run(self):
+        while True:
+            try:
+                first = self._queue.get(timeout=self.schedule_delay)
+            except queue.Empty:
+                continue
+            self._export(self._drain(first))
+
+    def flush(self):
+        """Export everything still queued (called at interpreter exit)"""
+        while not self._queue.empty():
+            self._export(self._drain())
+        # Wait for a batch the background thread may be exporting
+        self._queue.join()
+        self.exporter.shutdown()
+
+
+# ========================
+# Tracer
+# ========================
+class Tracer:
+    """Creates spans and tracks the current one with a context variable"""
+
+    def __init__(self, processor, sample_rate=1.0, service_name='flaskmeridian-app'):
+        self.processor = processor
+        self.sample_rate = sample_rate
+        self.service_name = service_name
+
+    @staticmethod
+    def _new_id(bits):
+        return f'{random.getrandbits(bits):0{bits // 4}x}'
+
+    def start_span(self, name, kind='internal', attributes=None, parent=None):
+        """Start a span as a child of ``parent`` (default: the current span)
+
+        Without a parent a new trace starts and the sampling decision is
+        taken here; children always inherit it.
+        """
+        parent = parent if parent is not None else _current_span.get()
+        parent_context = parent.context if parent is not None else None
+
+        if parent_context is None:
+            trace_id = self._new_id(128)
+            sampled = random.random() < self.sample_rate
+        else:
+            trace_id = parent_context.trace_id
+            sampled = parent_context.sampled
+
+        context = SpanContext(trace_id, self._new_id(64), sampled)
+        if not sampled:
+            return _NonRecordingSpan(context)
+        return Span(
+            self, name, context,
+            parent_id=parent_context.span_id if parent_context else None,
+            kind=kind,
+            attributes=attributes,
+        )
+
+    @contextmanager
+    def span(self, name, kind='internal', attributes=None):
+        """Context manager running the block inside a new current span"""
+        span = self.start_span(name, kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+
+tracer = None
+
+
+def current_span():
+    """Return the active span, or None outside a trace"""
+    return _current_span.get()
+
+
+@contextmanager
+def outbound_span(method, url, headers=None):
+    """Trace an outbound call and inject the traceparent header
+
+    Usage:
+        with outbound_span('GET', url) as headers:
+            urllib.request.urlopen(urllib.request.Request(url, headers=headers))
+    """
+    headers = dict(headers or {})
+    if tracer is None:
+        yield headers
+        return
+    with tracer.span(f'HTTP {method}', 'client', {'http.method': method, 'http.url': url}) as span:
+        headers['traceparent'] = span.context.traceparent()
+        yield headers
+
+
+# ========================
+# Instrumentation
+# ========================
+class TracingMiddleware:
+    """WSGI middleware opening a server span around every request"""
+
+    def __init__(self, wsgi_app, tracer):
+        self.wsgi_app = wsgi_app
+        self.tracer = tracer
+
+    def __call__(self, environ, start_response):
+        if is_warmup_request(environ):
+            return self.wsgi_app(environ, start_response)
+        incoming = SpanContext.from_traceparent(environ.get('HTTP_TRACEPARENT', ''))
+        parent = _NonRecordingSpan(incoming) if incoming else None
+        method = environ.get('REQUEST_METHOD', 'GET')
+
+        span = self.tracer.start_span(
+            f'HTTP {method}', 'server',
+            {'http.method': method, 'http.target': environ.get('PATH_INFO', '/')},
+            parent=parent,
+        )
+        token = _current_span.set(span)
+
+        def traced_start_response(status, headers, exc_info=None):
+            code = int(status.split(' ', 1)[0])
+            span.set_attribute('http.status_code', code)
+            if code >= 500:
+                span.status = 'error'
+            headers.append(('traceparent', span.context.traceparent()))
+            return start_response(status, headers, exc_info)
+
+        try:
+            response = self.wsgi_app(environ, traced_start_response)
+        except Exception as e:
+            span.record_exception(e)
+            span.end()
+            raise
+        finally:
+            _current_span.reset(token)
+        # The span covers sending the body too; it ends when the server closes it
+        return ClosingIterator(response, [span.end])
+
+
+def _child_span(tracer, name, kind='internal', attributes=None):
+    """Start a span only inside an active trace (startup work is not traced)"""
+    if _current_span.get() is None:
+        return None
+    return tracer.start_span(name, kind, attributes)
+
+
+def _instrument_sql(tracer):
+    def before(conn, cursor, statement, parameters, context, executemany):
+        span = _child_span(tracer, 'db.query', 'client', {
+            'db.system': conn.dialect.name,
+            'db.statement': statement[:2000],
+        })
+        conn.info.setdefault('trace_spans', []).append(span)
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get('trace_spans')
+        span = spans.pop() if spans else None
+        if span is not None:
+            span.end()
+
+    def error(exception_context):
+        connection = exception_context.connection
+        spans = connection.info.get('trace_spans') if connection is not None else None
+        span = spans.pop() if spans else None
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.end()
+
+    event.listen(Engine, 'before_cursor_execute', before)
+    event.listen(Engine, 'after_cursor_execute', after)
+    event.listen(Engine, 'handle_error', error)
+
+
+def _instrument_templates(app, tracer):
+    def before(sender, template, context, **extra):
+        span = _child_span(tracer, 'template.render', attributes={'template': template.name})
+        g.setdefault('trace_template_spans', []).append(span)
+
+    def after(sender, template, context, **extra):
+        spans = g.get('trace_template_spans')
+        span = spans.pop() if spans else None
+        if span is not None:
+            span.end()
+
+    before_render_template.connect(before, app, weak=False)
+    template_rendered.connect(after, app, weak=False)
+
+
+def _instrument_password_hashing(app, tracer):
+    security = app.extensions.get('security')
+    if security is None:
+        return
+    context = security.pwd_context
+
+    def traced(operation, func):
+        def wrapper(*args, **kwargs):
+            with tracer.span(f'argon2.{operation}'):
+                return func(*args, **kwargs)
+        return wrapper
+
+    context.hash = traced('hash', context.hash)
+    context.verify = traced('verify', context.verify)
+
+
+def _instrument_requests(tracer):
+    """Trace outbound calls made with the requests library, if installed"""
+    try:
+        import requests
+    except ImportError:
+        return
+
+    send = requests.Session.send
+
+    def traced_send(session, prepared, **kwargs):
+        with outbound_span(prepared.method, prepared.url, prepared.headers) as headers:
+            prepared.headers.update(headers)
+            return send(session, prepared, **kwargs)
+
+    requests.Session.send = traced_send
+
+
+def init_tracing(app):
+    """Enable tracing when TRACING_ENABLED is set
+
+    Call after Flask-Security is set up so password hashing is traced too.
+    """
+    global tracer
+    if not app.config.get('TRACING_ENABLED', False):
+        return
+
+    processor = BatchSpanProcessor(create_exporter(app.config))
+    tracer = Tracer(
+        processor,
+        sample_rate=app.config.get('TRACING_SAMPLE_RATE', 0.1),
+        service_name=app.config.get('TRACING_SERVICE_NAME', 'flaskmeridian-app'),
+    )
+    app.extensions['tracer'] = tracer
+
+    app.wsgi_app = TracingMiddleware(app.wsgi_app, tracer)
+    _instrument_sql(tracer)
+    _instrument_templates(app, tracer)
+    _instrument_password_hashing(app, tracer)
+    _instrument_requests(tracer)
+'''
+    with open(observability_path / 'tracing.py', 'w', encoding='utf-8') as f:
+        f.write(tracing_content)
+
+    # ========================
+    # observability/profiling.py
+    # ========================
+    profiling_content = '''"""On-demand and sampled request profiling
+
+Off unless PROFILING_ENABLED=True. A request is profiled when:
+- it sends ``X-Profile: <PROFILING_SECRET>`` and, in apps with
+  authentication, the user has PROFILING_ROLE (admin by default)
+- or it is picked at random with probability PROFILING_SAMPLE_RATE
+  (continuous profiling, uses the low-overhead sampler)
+
+On-demand requests choose the profiler and where the result goes:
+- ``X-Profile-Mode: sampling`` (default) samples the request's stack every
+  PROFILING_INTERVAL_MS (its greenlet's, under gevent workers); ``cprofile``
+  traces every call with cProfile
+- ``X-Profile-Output: file`` (default) writes a speedscope JSON (sampling)
+  or pstats (cProfile) file to PROFILING_DIR and names it in the
+  ``X-Profile-File`` response header; ``inline`` replaces the response
+  with an SVG flame graph (sampling) or a pstats text report (cProfile)
+
+PROFILING_DIR keeps at most PROFILING_MAX_FILES profiles; the oldest are
+deleted first. Open .speedscope.json files at https://www.speedscope.app and
+.prof files with ``python -m pstats`` or snakeviz.
+"""
+import _thread
+import cProfile
+import hmac
+import html
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from flask import current_app, g, request
+
+from lifecycle import is_warmup_request
+
+logger = logging.getLogger(__name__)
+
+# cProfile can only run once per process at a time
+_cprofile_lock = threading.Lock()
+
+
+# ========================
+# Sampling profiler
+# ========================
+def _gevent_monkey():
+    """gevent.monkey when it has patched threads into greenlets, else None"""
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_module_patched('threading'):
+        return monkey
+    return None
+
+
+def _os_threads():
+    """(get_ident, start_new_thread, allocate_lock, sleep) for real OS threads
+
+    Under gevent these are patched to work on greenlets; the originals are
+    needed to sample from a thread that runs while the request's greenlet does.
+    """
+    monkey = _gevent_monkey()
+    if monkey is not None:
+        return (
+            monkey.get_original('_thread', 'get_ident'),
+            monkey.get_original('_thread', 'start_new_thread'),
+            monkey.get_original('_thread', 'allocate_lock'),
+            monkey.get_original('time', 'sleep'),
+        )
+    return _thread.get_ident, _thread.start_new_thread, _thread.allocate_lock, time.sleep
+
+
+class StackSampler:
+    """Sample the calling thread's (or greenlet's) Python stack from an OS thread"""
+
+    def __init__(self, interval=0.005):
+        get_ident, self._start_thread, allocate_lock, self._sleep = _os_threads()
+        self.thread_id = get_ident()
+        # Under gevent several requests share the OS thread; follow this one's greenlet
+        self.greenlet = None
+        if _gevent_monkey() is not None:
+            from greenlet import getcurrent
+            self.greenlet = getcurrent()
+        self.interval = interval
+        self.samples = Counter()
+        self.started = None
+        self.duration = 0.0
+        self._stopped = False
+        self._done = allocate_lock()
+
+    def start(self):
+        self.started = time.perf_counter()
+        self._done.acquire()
+        self._start_thread(self._run, ())
+
+    def stop(self):
+        self._stopped = True
+        # Blocks for at most one interval (the hub too, under gevent)
+        self._done.acquire()
+        self._done.release()
+        self.duration = time.perf_counter() - self.started
+
+    def _frame(self):
+        if self.greenlet is not None and self.greenlet.gr_frame is not None:
+            return self.greenlet.gr_frame  # Switched out, waiting in the hub
+        return sys._current_frames().get(self.thread_id)
+
+    def _run(self):
+        try:
+            while True:
+                self._sleep(self.interval)
+                if self._stopped:
+                    return
+                self._sample(self._frame())
+        finally:
+            self._done.release()
+
+    def _sample(self, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        if stack:
+            self.samples[tuple(reversed(stack))] += 1
+
+    def to_speedscope(self, name):
+        """Return the samples in speedscope's file format"""
+        frames, index = [], {}
+        samples, weights = [], []
+        for stack, count in self.samples.items():
+            ids = []
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+                ids.append(index[frame])
+            samples.append(ids)
+            weights.append(count * self.interval)
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'flaskmeridian',
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights,
+            }],
+        }
+
+    def to_svg(self, title, width=1200, row_height=16):
+        """Render the samples as a self-contained SVG flame graph"""
+        root = {'children': {}, 'count': 0}
+        for stack, count in self.samples.items():
+            node = root
+            node['count'] += count
+            for frame in stack:
+                label = f'{frame[0]} ({os.path.basename(frame[1])}:{frame[2]})'
+                node = node['children'].setdefault(label, {'children': {}, 'count': 0})
+                node['count'] += count
+
+        total = root['count'] or 1
+        rects, depth_max = [], 0
+
+        def walk(node, x, depth):
+            nonlocal depth_max
+            depth_max = max(depth_max, depth)
+            for label, child in sorted(node['children'].items()):
+                w = child['count'] / total * width
+                if w >= 0.5:
+                    rects.append((x, depth, w, label, child['count']))
+                    walk(child, x, depth + 1)
+                x += w
+
+        walk(root, 0.0, 0)
+        height = (depth_max + 2) * row_height
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'font-family="monospace" font-size="11">',
+            f'<text x="4" y="12">{html.escape(title)} - {total} samples</text>',
+        ]
+        for x, depth, w, label, count in rects:
+            y = height - (depth + 1) * row_height
+            hue = 20 + hash(label) % 40
+            text = html.escape(label[: int(w / 7)]) if w > 21 else ''
+            parts.append(
+                f'<g><title>{html.escape(label)}: {count} samples ({count / total:.1%})</title>'
+                f'<rect x="{x:.1f}" y="{y}" width="{w:.1f}" height="{row_height - 1}" '
+                f'fill="hsl({hue},90%,60%)"/>'
+                f'<text x="{x + 2:.1f}" y="{y + 12}">{text}</text></g>'
+            )
+        parts.append('</svg>')
+        return ''.join(parts)
+
+
+# ========================
+# Profiler hooks
+# ========================
+def _authorized():
+    secret = current_app.config.get('PROFILING_SECRET')
+    supplied = request.headers.get('X-Profile')
+    if not secret or not supplied or not hmac.compare_digest(supplied, secret):
+        return False
+    if 'security' not in current_app.extensions:
+        return True
+    from flask_security import current_user
+    role = current_app.config.get('PROFILING_ROLE', 'admin')
+    return current_user.is_authenticated and current_user.has_role(role)
+
+
+def _start_profile():
+    config = current_app.config
+    if is_warmup_request(request.environ):
+        return
+    if _authorized():
+        mode = request.headers.get('X-Profile-Mode', 'sampling')
+        output = request.headers.get('X-Profile-Output', 'file')
+    elif random.random() < config.get('PROFILING_SAMPLE_RATE', 0.0):
+        mode, output = 'sampling', 'file'
+    else:
+        return
+
+    if mode == 'cprofile':
+        if not _cprofile_lock.acquire(blocking=False):
+            logger.info('Profiler busy, not profiling %s', request.path)
+            return
+        profiler = cProfile.Profile()
+        profiler.enable()
+    else:
+        interval = config.get('PROFILING_INTERVAL_MS', 5) / 1000
+        profiler = StackSampler(interval)
+        profiler.start()
+    g.profile = (mode, output, profiler)
+
+
+def _stop_profiler(mode, profiler):
+    if mode == 'cprofile':
+        profiler.disable()
+        _cprofile_lock.release()
+    else:
+        profiler.stop()
+
+
+def _finish_profile(response):
+    state = g.pop('profile', None)
+    if state is None:
+        return response
+    mode, output, profiler = state
+    _stop_profiler(mode, profiler)
+
+    title = f'{request.method} {request.path}'
+    if output == 'inline':
+        if mode == 'cprofile':
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(50)
+            return current_app.response_class(report.getvalue(), mimetype='text/plain')
+        return current_app.response_class(profiler.to_svg(title), mimetype='image/svg+xml')
+
+    response.headers['X-Profile-File'] = _write_profile(mode, profiler, title)
+    return response
+
+
+def _abandon_profile(exc):
+    # The view raised before after_request ran
+    state = g.pop('profile', None)
+    if state is not None:
+        _stop_profiler(state[0], state[2])
+
+
+def _write_profile(mode, profiler, title):
+    """Write the profile to the spool directory and trim it"""
+    directory = current_app.config.get('PROFILING_DIR', 'instance/profiles')
+    os.makedirs(directory, exist_ok=True)
+    stem = f"{time.strftime('%Y%m%dT%H%M%S')}-{request.endpoint or 'unmatched'}-{uuid.uuid4().hex[:8]}"
+
+    if mode == 'cprofile':
+        filename = f'{stem}.prof'
+        profiler.dump_stats(os.path.join(directory, filename))
+    else:
+        filename = f'{stem}.speedscope.json'
+        with open(os.path.join(directory, filename), 'w', encoding='utf-8') as f:
+            json.dump(profiler.to_speedscope(title), f)
+
+    _trim_spool(directory, current_app.config.get('PROFILING_MAX_FILES', 50))
+    return filename
+
+
+def _trim_spool(directory, max_files):
+    entries = sorted(
+        (entry for entry in os.scandir(directory) if entry.is_file()),
+        key=lambda entry: entry.stat().st_mtime,
+    )
+    for entry in entries[:max(len(entries) - max_files, 0)]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass  # Another worker removed it first
+
+
+def init_profiling(app):
+    """Register the profiling request hooks when PROFILING_ENABLED is set"""
+    if not app.config.get('PROFILING_ENABLED', False):
+        return
+    if not app.config.get('PROFILING_SECRET') and not app.config.get('PROFILING_SAMPLE_RATE'):
+        app.logger.warning('PROFILING_ENABLED is set but neither PROFILING_SECRET nor PROFILING_SAMPLE_RATE is')
+
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
+    app.teardown_request(_abandon_profile)
+'''
+    with open(observability_path / 'profiling.py', 'w', encoding='utf-8') as f:
+        f.write(profiling_content)
+
+    click.echo("✅ Created observability/sql.py (query count, Server-Timing, N+1 detection)")
+    click.echo("✅ Created observability/metrics.py (Prometheus /metrics, multiprocess aware)")
+    click.echo("✅ Created observability/tracing.py (opt-in request tracing, OTLP export)")
+    click.echo("✅ Created observability/profiling.py (on-demand and sampled request profiling)")
@@ -15,6 +15,9 @@ flask-sqlalchemy==3.1.1
 click==8.3.1
 python-dotenv==1.0.0
 gunicorn==25.1.0
+flask-caching==2.5.1
+orjson==3.11.4
+prometheus-client==0.23.1
 '''
 
     # Add database driver based on selection
@@ -32,4 +35,7 @@ gunicorn==25.1.0
     click.echo("   ✓ Flask 3.1.3")
     click.echo("   ✓ SQLAlchemy & Flask-SQLAlchemy")
     click.echo("   ✓ python-dotenv for env variables")
-    click.echo("   ✓ gunicorn for production server")
\ No newline at end of file
+    click.echo("   ✓ gunicorn for production server")
+    click.echo("   ✓ Flask-Caching for query and template caching")
+    click.echo("   ✓ orjson for fast JSON responses")
+    click.echo("   ✓ prometheus-client for /metrics")
\ No newline at end of file
@@ -53,7 +53,7 @@ def index():
 
 @main_bp.route('/health')
 def health():
-    """Health check endpoint"""
+    """Health check endpoint (container probes use /livez and /readyz)"""
     return {'status': 'healthy'}, 200
 '''
     with open(routes_path / 'main.py', 'w', encoding='utf-8') as f:
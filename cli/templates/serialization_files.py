@@ -0,0 +1,239 @@
+"""Serialization files generator - fast JSON provider and its micro-benchmark"""
+import click
+
+
+def create(project_path):
+    """Create the serialization/ package and benchmarks/json_providers.py
+
+    Args:
+        project_path: Path to project directory
+    """
+
+    serialization_path = project_path / 'serialization'
+    serialization_path.mkdir(exist_ok=True)
+
+    # ========================
+    # serialization/__init__.py
+    # ========================
+    init_content = '''"""Serialization module for FlaskMeridian app"""
+from .json_provider import FastJSONProvider, init_json
+
+__all__ = ['FastJSONProvider', 'init_json']
+'''
+    with open(serialization_path / '__init__.py', 'w', encoding='utf-8') as f:
+        f.write(init_content)
+
+    # ========================
+    # serialization/json_provider.py
+    # ========================
+    provider_content = '''"""Fast JSON provider backed by orjson or msgspec
+
+JSON_BACKEND in .env selects the encoder:
+- auto     orjson if installed, else msgspec, else stdlib json
+- orjson / msgspec / stdlib   force one backend
+
+Every backend encodes the types views usually return the same way:
+datetimes/dates as ISO 8601 (a zero UTC offset written as ``Z``, as msgspec
+does), Decimals as strings, sets as lists and BaseModel instances through
+to_dict(). Anything the fast encoder rejects (for example non-string keys
+with sorted output, or custom dump arguments) transparently falls back to
+the stdlib encoder.
+"""
+import datetime
+import json
+import logging
+
+from flask.json.provider import DefaultJSONProvider
+
+from db.models import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+logger = logging.getLogger(__name__)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider using the fastest available encoder
+
+    Installed as ``app.json_provider_class`` so extensions that subclass the
+    provider (Flask-Security does) keep the fast encoder.
+    """
+
+    def __init__(self, app, backend=None):
+        super().__init__(app)
+        self.backend = self._select_backend(backend or app.config.get('JSON_BACKEND', 'auto'))
+        self._msgspec_encoders = {}
+
+    @staticmethod
+    def default(obj):
+        """Convert objects the JSON encoders do not support natively"""
+        if isinstance(obj, BaseModel):
+            return obj.to_dict()
+        if isinstance(obj, (datetime.datetime, datetime.time)):
+            value = obj.isoformat()
+            # Match msgspec and orjson's OPT_UTC_Z
+            if obj.utcoffset() == datetime.timedelta(0):
+                value = value[:-len('+00:00')] + 'Z'
+            return value
+        if isinstance(obj, datetime.date):
+            return obj.isoformat()
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        return DefaultJSONProvider.default(obj)
+
+    @staticmethod
+    def _select_backend(backend):
+        if backend in ('auto', 'orjson') and orjson is not None:
+            return 'orjson'
+        if backend in ('auto', 'msgspec') and msgspec is not None:
+            return 'msgspec'
+        if backend not in ('auto', 'stdlib'):
+            logger.warning('JSON backend %r is not installed, using stdlib json', backend)
+        return 'stdlib'
+
+    def _fast_encode(self, obj):
+        """Encode to bytes with the fast backend, or return None to fall back"""
+        try:
+            if self.backend == 'orjson':
+                option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+                if self.sort_keys:
+                    option |= orjson.OPT_SORT_KEYS
+                return orjson.dumps(obj, default=self.default, option=option)
+            if self.backend == 'msgspec':
+                order = 'sorted' if self.sort_keys else None
+                encoder = self._msgspec_encoders.get(order)
+                if encoder is None:
+                    encoder = msgspec.json.Encoder(enc_hook=self.default, order=order)
+                    self._msgspec_encoders[order] = encoder
+                return encoder.encode(obj)
+        except TypeError:
+            return None
+        return None
+
+    def dumps(self, obj, **kwargs):
+        if not kwargs:
+            encoded = self._fast_encode(obj)
+            if encoded is not None:
+                return encoded.decode('utf-8')
+
+        kwargs.setdefault('default', self.default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if not kwargs:
+            if self.backend == 'orjson':
+                return orjson.loads(s)
+            if self.backend == 'msgspec':
+                return msgspec.json.decode(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response without a bytes -> str -> bytes round trip"""
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        if not pretty:
+            encoded = self._fast_encode(self._prepare_response_obj(args, kwargs))
+            if encoded is not None:
+                return self._app.response_class(encoded + b'\\n', mimetype=self.mimetype)
+        return super().response(*args, **kwargs)
+
+
+def init_json(app):
+    """Install FastJSONProvider on the app (JSON_BACKEND selects the encoder)"""
+    app.json_provider_class = FastJSONProvider
+    app.json = FastJSONProvider(app)
+    app.logger.debug('JSON backend: %s', app.json.backend)
+'''
+    with open(serialization_path / 'json_provider.py', 'w', encoding='utf-8') as f:
+        f.write(provider_content)
+
+    # ========================
+    # benchmarks/json_providers.py
+    # ========================
+    benchmark_content = '''"""Micro-benchmark: stdlib vs orjson vs msgspec JSON providers
+
+Usage:
+    python -m benchmarks.json_providers [--number 2000]
+
+Encodes typical payloads (health check, API list page with datetimes and
+Decimals, nested document) through FastJSONProvider with each installed
+backend and reports the time per call.
+"""
+import argparse
+import datetime
+import decimal
+import timeit
+
+from flask import Flask
+
+from serialization.json_provider import FastJSONProvider, msgspec, orjson
+
+
+def _payloads():
+    now = datetime.datetime(2024, 1, 1, 12, 30, 15, 123456)
+    items = [
+        {
+            'id': i,
+            'name': f'Product {i}',
+            'price': decimal.Decimal('19.99') + i,
+            'active': i % 3 != 0,
+            'tags': ['new', 'sale', f'tag-{i % 7}'],
+            'created_at': now + datetime.timedelta(minutes=i),
+        }
+        for i in range(100)
+    ]
+    nested = {
+        'user': {'id': 1, 'email': 'admin@example.com', 'roles': ['admin', 'user']},
+        'settings': {f'key_{i}': {'enabled': True, 'value': i * 1.5} for i in range(50)},
+        'history': [{'at': now, 'event': 'login', 'ip': '127.0.0.1'}] * 50,
+    }
+    return {
+        'health': {'status': 'healthy'},
+        'list_100': {'items': items, 'total': len(items), 'page': 1},
+        'nested': nested,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000, help='Encodings per measurement')
+    args = parser.parse_args()
+
+    backends = ['stdlib']
+    if orjson is not None:
+        backends.append('orjson')
+    if msgspec is not None:
+        backends.append('msgspec')
+
+    app = Flask(__name__)
+    payloads = _payloads()
+
+    print(f"{'payload':<12}" + ''.join(f'{name:>14}' for name in backends))
+    for payload_name, payload in payloads.items():
+        row = f'{payload_name:<12}'
+        for backend in backends:
+            provider = FastJSONProvider(app, backend)
+            seconds = min(timeit.repeat(
+                lambda: provider.dumps(payload), number=args.number, repeat=3
+            ))
+            row += f'{seconds / args.number * 1e6:>11.1f} us'
+        print(row)
+
+
+if __name__ == '__main__':
+    main()
+'''
+    with open(project_path / 'benchmarks' / 'json_providers.py', 'w', encoding='utf-8') as f:
+        f.write(benchmark_content)
+
+    click.echo("✅ Created serialization/json_provider.py (orjson/msgspec with stdlib fallback)")
+    click.echo("✅ Created benchmarks/json_providers.py")
@@ -0,0 +1,637 @@
+"""Server mode files generator - async (ASGI) and gevent variants of the generated app"""
+import click
+
+# gunicorn worker class for each server mode (GUNICORN_WORKER_CLASS)
+WORKER_CLASSES = {
+    'sync': 'sync',
+    'async': 'uvicorn_worker.UvicornWorker',
+    'gevent': 'gevent',
+}
+
+# gunicorn application target for each server mode
+APP_TARGETS = {
+    'sync': 'app:app',
+    'async': 'asgi:app',
+    'gevent': 'app:app',
+}
+
+
+def create(project_path, server_mode='sync', db_type='sqlite', with_auth=False):
+    """Create the files of the selected server mode
+
+    Args:
+        project_path: Path to project directory
+        server_mode: 'sync' (WSGI, nothing extra to create), 'async' or 'gevent'
+        db_type: Database type ('sqlite' or 'postgres')
+        with_auth: Whether Flask-Security-Too authentication is included
+    """
+    if server_mode == 'async':
+        _create_async(project_path, db_type, with_auth)
+    elif server_mode == 'gevent':
+        _create_gevent(project_path, db_type)
+
+    if server_mode != 'sync':
+        _create_benchmark(project_path)
+
+
+def _create_async(project_path, db_type, with_auth):
+    """Create asgi.py, the async_api/ package, the async engine and auth service"""
+
+    async_api_path = project_path / 'async_api'
+    async_api_path.mkdir(exist_ok=True)
+
+    # ========================
+    # asgi.py
+    # ========================
+    asgi_content = '''"""ASGI entry point (async server mode)
+
+Usage:
+    gunicorn -c gunicorn.conf.py asgi:app     (production, uvicorn workers)
+    uvicorn asgi:app --reload                 (development)
+
+Requests under ASYNC_PREFIX (default /api) are served by the Quart app in
+async_api/ as coroutines on the worker's event loop, so many I/O-bound
+requests can wait on the database at once without a thread each. Every
+other path (pages, Flask-Security, /metrics, probes) goes to the regular
+Flask app through a bounded thread pool.
+"""
+import os
+
+from app import create_app
+from async_api import PrefixDispatcher, create_async_app
+
+flask_app = create_app()
+prefix = os.getenv('ASYNC_PREFIX', '/api')
+
+app = PrefixDispatcher(
+    create_async_app(flask_app, prefix),
+    flask_app,
+    prefix,
+    wsgi_threads=int(os.getenv('ASGI_WSGI_THREADS', 10)),
+)
+'''
+    with open(project_path / 'asgi.py', 'w', encoding='utf-8') as f:
+        f.write(asgi_content)
+
+    # ========================
+    # async_api/__init__.py
+    # ========================
+    auth_import = ''
+    auth_setup = ''
+    if with_auth:
+        auth_import = 'from services.async_auth_service import AsyncAuthService\n'
+        auth_setup = "    app.extensions['auth_service'] = AsyncAuthService(flask_app)\n"
+
+    init_content = f'''"""Async API for FlaskMeridian app (async server mode)
+
+A Quart app serving the routes under ASYNC_PREFIX as coroutines; see
+asgi.py for how it is combined with the Flask app.
+"""
+from quart import Quart
+
+from db.async_database import async_db
+{auth_import}
+from .dispatch import PrefixDispatcher
+from .routes import api_bp
+
+__all__ = ['PrefixDispatcher', 'create_async_app']
+
+
+def create_async_app(flask_app, prefix='/api'):
+    """Create the Quart app sharing the Flask app's configuration and database"""
+    app = Quart(__name__)
+    app.config.from_mapping(
+        SECRET_KEY=flask_app.config.get('SECRET_KEY'),
+        DEBUG=flask_app.debug,
+    )
+
+    async_db.init_app(app, flask_app)
+{auth_setup}    app.register_blueprint(api_bp, url_prefix=prefix)
+    return app
+'''
+    with open(async_api_path / '__init__.py', 'w', encoding='utf-8') as f:
+        f.write(init_content)
+
+    # ========================
+    # async_api/dispatch.py
+    # ========================
+    dispatch_content = '''"""Serve the async app and the Flask app from one ASGI server"""
+from a2wsgi import WSGIMiddleware
+
+
+class PrefixDispatcher:
+    """Route ASGI requests to the async app or the Flask app by path prefix"""
+
+    def __init__(self, async_app, flask_app, prefix, wsgi_threads=10):
+        self.async_app = async_app
+        self.flask_app = flask_app
+        self.prefix = prefix.rstrip('/')
+        # Flask views run in this many threads per worker
+        self.wsgi = WSGIMiddleware(flask_app, workers=wsgi_threads)
+
+    def _is_async(self, path):
+        return path == self.prefix or path.startswith(self.prefix + '/')
+
+    async def __call__(self, scope, receive, send):
+        # Lifespan events go to the async app: they open and dispose its engine
+        if scope['type'] == 'lifespan' or self._is_async(scope.get('path', '')):
+            await self.async_app(scope, receive, send)
+        else:
+            await self.wsgi(scope, receive, send)
+'''
+    with open(async_api_path / 'dispatch.py', 'w', encoding='utf-8') as f:
+        f.write(dispatch_content)
+
+    # ========================
+    # async_api/routes.py
+    # ========================
+    routes_content = '''"""Async API routes - add I/O-bound endpoints here
+
+Views are coroutines: await database queries and HTTP calls instead of
+blocking, and push CPU-heavy work to an executor.
+"""
+from quart import Blueprint
+from sqlalchemy import text
+
+from db.async_database import async_db
+
+api_bp = Blueprint('async_api', __name__)
+
+
+@api_bp.route('/ping')
+async def ping():
+    """Liveness of the async app"""
+    return {'status': 'ok'}
+
+
+@api_bp.route('/db')
+async def database_check():
+    """Round trip to the database through the async engine"""
+    async with async_db.session() as session:
+        await session.execute(text('SELECT 1'))
+    return {'database': 'ok'}
+'''
+    if with_auth:
+        routes_content = routes_content.replace(
+            'from sqlalchemy import text\n', 'from sqlalchemy import select, text\n'
+        ).replace(
+            'from db.async_database import async_db\n',
+            'from db.async_database import async_db\nfrom db.models import Role\n',
+        )
+        routes_content += '''
+
+@api_bp.route('/roles')
+async def list_roles():
+    """Role names, loaded with an async ORM query"""
+    async with async_db.session() as session:
+        result = await session.execute(select(Role).order_by(Role.name))
+        roles = result.scalars().all()
+    return {'roles': [role.to_dict(include={'name', 'description'}) for role in roles]}
+'''
+    with open(async_api_path / 'routes.py', 'w', encoding='utf-8') as f:
+        f.write(routes_content)
+
+    # ========================
+    # db/async_database.py
+    # ========================
+    database_content = '''"""Async SQLAlchemy engine for the async API (async server mode)
+
+Uses the same database and models as db/database.py through an async
+driver: aiosqlite for SQLite, asyncpg for PostgreSQL. The engine is
+created when a worker starts serving, on that worker's event loop, and
+disposed when it stops.
+
+Usage in an async view:
+    async with async_db.session() as session:
+        result = await session.execute(select(User).where(User.email == email))
+"""
+import os
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from .database import db
+
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+}
+
+
+def async_database_url(flask_app):
+    """The Flask app's database URL with the matching async driver
+
+    ASYNC_DATABASE_URL in .env overrides it.
+    """
+    override = os.getenv('ASYNC_DATABASE_URL')
+    if override:
+        return make_url(override)
+    with flask_app.app_context():
+        # Flask-SQLAlchemy has already resolved relative SQLite paths
+        url = db.engine.url
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f'No async driver configured for {backend}; set ASYNC_DATABASE_URL')
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+
+class AsyncDatabase:
+    """Per-worker async engine and session factory"""
+
+    def __init__(self):
+        self.engine = None
+        self._sessionmaker = None
+
+    def init_app(self, app, flask_app):
+        url = async_database_url(flask_app)
+
+        @app.before_serving
+        async def open_engine():
+            options = {}
+            if url.get_backend_name() == 'postgresql':
+                options['pool_size'] = int(os.getenv('ASYNC_DB_POOL_SIZE', 20))
+                options['max_overflow'] = int(os.getenv('ASYNC_DB_MAX_OVERFLOW', 10))
+                if flask_app.config.get('DB_PGBOUNCER'):
+                    # Transaction pooling: no statement cache, unique names for unnamed statements
+                    options['connect_args'] = {
+                        'statement_cache_size': 0,
+                        'prepared_statement_cache_size': 0,
+                        'prepared_statement_name_func': lambda: f'__asyncpg_{uuid4()}__',
+                    }
+            self.engine = create_async_engine(url, pool_pre_ping=True, **options)
+            self._sessionmaker = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        @app.after_serving
+        async def dispose_engine():
+            await self.engine.dispose()
+
+    def session(self):
+        """Return a new AsyncSession (use as ``async with``)"""
+        return self._sessionmaker()
+
+
+async_db = AsyncDatabase()
+'''
+    with open(project_path / 'db' / 'async_database.py', 'w', encoding='utf-8') as f:
+        f.write(database_content)
+
+    # ========================
+    # services/async_auth_service.py (auth projects only)
+    # ========================
+    auth_service_content = '''"""Async authentication service - argon2 offloaded to a thread pool
+
+argon2 hashing is deliberately slow CPU work (tens of milliseconds). Run
+on the event loop it would stall every other request of the worker, so
+hash and verify run in a dedicated thread pool (argon2-cffi releases the
+GIL while hashing). They go through Flask-Security's helpers, so hashes
+stay compatible with the login forms of the Flask app.
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from flask_security import hash_password, verify_password
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from db.models import Role, User
+
+
+class AsyncAuthService:
+    """Async counterpart of AuthService for the async API"""
+
+    def __init__(self, flask_app, max_workers=None):
+        self.flask_app = flask_app
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or int(os.getenv('HASH_WORKERS', os.cpu_count() or 2)),
+            thread_name_prefix='argon2',
+        )
+
+    async def _in_executor(self, func, *args):
+        def call():
+            # Flask-Security reads the hashing settings from the app config
+            with self.flask_app.app_context():
+                return func(*args)
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    async def hash_password(self, password):
+        """Hash a password with argon2 without blocking the event loop"""
+        return await self._in_executor(hash_password, password)
+
+    async def verify_password(self, user, password):
+        """Check a password against the user's hash without blocking the event loop"""
+        return await self._in_executor(verify_password, password, user.password)
+
+    @staticmethod
+    async def get_user_by_email(session, email):
+        """Load a user and their roles by email"""
+        result = await session.execute(
+            select(User).options(selectinload(User.roles)).where(User.email == email)
+        )
+        return result.scalar_one_or_none()
+
+    async def authenticate(self, session, email, password):
+        """Return the active user with these credentials, or None"""
+        user = await self.get_user_by_email(session, email)
+        if user is None or not user.active:
+            # Spend the same time as a real check so emails cannot be probed
+            await self.hash_password(password)
+            return None
+        return user if await self.verify_password(user, password) else None
+
+    async def create_user(self, session, email, password, roles=('user',), **fields):
+        """Create and commit a user with the given role names"""
+        user = User(email=email, password=await self.hash_password(password), **fields)
+        if roles:
+            result = await session.execute(select(Role).where(Role.name.in_(roles)))
+            user.roles = list(result.scalars())
+        session.add(user)
+        await session.commit()
+        return user
+'''
+    if with_auth:
+        with open(project_path / 'services' / 'async_auth_service.py', 'w', encoding='utf-8') as f:
+            f.write(auth_service_content)
+
+    click.echo("✅ Created asgi.py (Quart async API + Flask app on one ASGI server)")
+    click.echo("✅ Created async_api/ (async routes)")
+    click.echo("✅ Created db/async_database.py (aiosqlite/asyncpg engine)")
+    if with_auth:
+        click.echo("✅ Created services/async_auth_service.py (argon2 in a thread pool)")
+
+    driver = 'asyncpg==0.32.0' if db_type == 'postgres' else 'aiosqlite==0.22.1'
+    # SQLAlchemy's asyncio extension runs on greenlet
+    _update_requirements(project_path, [
+        'quart==0.22.0', 'a2wsgi==1.10.10', 'uvicorn==0.54.0', 'uvicorn-worker==0.4.0',
+        'greenlet==3.5.6', driver,
+    ])
+
+
+def _create_gevent(project_path, db_type):
+    """Create gevent_patch.py (monkey-patching, psycogreen, hashing off the hub)"""
+
+    # ========================
+    # gevent_patch.py
+    # ========================
+    patch_content = '''"""gevent monkey-patching (gevent server mode)
+
+Import this module before anything else. gunicorn.conf.py does when
+GUNICORN_WORKER_CLASS=gevent, ahead of preloading the app, so SQLAlchemy's
+pool locks, the database driver and every socket are created cooperative.
+Patching later leaves blocking primitives behind, and one blocked call
+stalls every greenlet in the worker.
+
+- psycopg2 is a C extension that waits on the socket itself and blocks
+  the hub; psycogreen installs a wait callback that yields instead.
+- argon2 hashing is CPU-bound. offload_password_hashing() runs it in the
+  hub's pool of native threads (argon2-cffi releases the GIL), so other
+  greenlets keep serving while a password is hashed.
+"""
+from gevent import monkey
+
+monkey.patch_all()
+
+import os  # noqa: E402
+
+import gevent  # noqa: E402
+
+try:
+    from psycogreen.gevent import patch_psycopg
+except ImportError:
+    pass  # SQLite projects: sqlite3 calls are local and short
+else:
+    patch_psycopg()
+
+
+def offload_password_hashing(app, max_workers=None):
+    """Run Flask-Security's hash and verify calls in the hub's thread pool
+
+    Call once per worker, after fork. Each argon2 call holds memory_cost
+    (64 MiB by default) while it runs, so HASH_WORKERS also bounds memory.
+    """
+    security = app.extensions.get('security')
+    if security is None:
+        return
+    threadpool = gevent.get_hub().threadpool
+    threadpool.maxsize = max_workers or int(os.getenv('HASH_WORKERS', os.cpu_count() or 1))
+    context = security.pwd_context
+
+    def offloaded(func):
+        def wrapper(*args, **kwargs):
+            return threadpool.apply(func, args, kwargs)
+        return wrapper
+
+    context.hash = offloaded(context.hash)
+    context.verify = offloaded(context.verify)
+'''
+    with open(project_path / 'gevent_patch.py', 'w', encoding='utf-8') as f:
+        f.write(patch_content)
+
+    click.echo("✅ Created gevent_patch.py (monkey-patching before the app is imported)")
+
+    packages = ['gevent==26.9.0']
+    if db_type == 'postgres':
+        packages.append('psycogreen==1.0.2')
+    _update_requirements(project_path, packages)
+
+
+def _create_benchmark(project_path):
+    """Create benchmarks/io_concurrency.py comparing the server modes"""
+    # ========================
+    # benchmarks/io_concurrency.py
+    # ========================
+    benchmark_content = '''"""Load test: I/O-bound requests under high concurrency, per server mode
+
+Usage:
+    python -m benchmarks.io_concurrency [--concurrency 200] [--requests 2000]
+                                        [--io-ms 50] [--workers 2] [--modes wsgi,gevent]
+
+Each mode serves the same endpoint - one database round trip followed by
+--io-ms of waiting, standing in for a call to a remote service - with
+gunicorn.conf.py and --workers workers:
+- wsgi    sync workers, one request per worker at a time
+- asgi    uvicorn workers running the async API (async server mode)
+- gevent  gevent workers running the Flask app (gevent server mode)
+
+--concurrency clients keep requests in flight; the report shows
+throughput and latency. Sync workers top out at workers / io-ms requests
+per second - one thread each - while asgi and gevent workers keep all
+requests waiting concurrently, up to the database pool for the query.
+Modes the project was not generated or installed for are skipped.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+from sqlalchemy import text
+
+IO_SECONDS = float(os.getenv('BENCH_IO_MS', 50)) / 1000
+
+
+# ========================
+# Apps under test (gunicorn factories)
+# ========================
+def wsgi_app():
+    from app import create_app
+    from db.database import db
+
+    app = create_app()
+
+    @app.route('/bench/io')
+    def bench_io():
+        db.session.execute(text('SELECT 1'))
+        time.sleep(IO_SECONDS)
+        return {'ok': True}
+
+    return app
+
+
+def asgi_app():
+    from app import create_app
+    from async_api import PrefixDispatcher, create_async_app
+    from db.async_database import async_db
+
+    flask_app = create_app()
+    async_app = create_async_app(flask_app, '/api')
+
+    @async_app.route('/api/bench/io')
+    async def bench_io():
+        async with async_db.session() as session:
+            await session.execute(text('SELECT 1'))
+        await asyncio.sleep(IO_SECONDS)
+        return {'ok': True}
+
+    return PrefixDispatcher(async_app, flask_app, '/api')
+
+
+# mode -> (worker class, app factory, path, modules it needs)
+MODES = {
+    'wsgi': ('sync', 'wsgi_app()', '/bench/io', ()),
+    'asgi': ('uvicorn_worker.UvicornWorker', 'asgi_app()', '/api/bench/io', ('uvicorn_worker', 'async_api')),
+    'gevent': ('gevent', 'wsgi_app()', '/bench/io', ('gevent', 'gevent_patch')),
+}
+
+
+# ========================
+# Load generator
+# ========================
+async def _request(port, path):
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f'GET {path} HTTP/1.1\\r\\nHost: localhost\\r\\nConnection: close\\r\\n\\r\\n'.encode())
+    await writer.drain()
+    status_line = await reader.readline()
+    await reader.read()
+    writer.close()
+    return int(status_line.split()[1]), time.perf_counter() - start
+
+
+async def _load(port, path, concurrency, total):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            try:
+                return await _request(port, path)
+            except (OSError, IndexError, ValueError):
+                return None, 0.0
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one() for _ in range(total)))
+    return results, time.perf_counter() - started
+
+
+def _wait_ready(port, server, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError('gunicorn exited; run from the project root')
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/livez', timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('gunicorn did not become ready')
+
+
+def run_mode(mode, args):
+    worker_class, factory, path, _ = MODES[mode]
+    env = dict(os.environ, BENCH_IO_MS=str(args.io_ms), GUNICORN_WORKER_CLASS=worker_class,
+               PROMETHEUS_MULTIPROC_DIR='', SQL_INSTRUMENTATION='off')
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+         f'benchmarks.io_concurrency:{factory}',
+         '--bind', f'127.0.0.1:{args.port}', '--workers', str(args.workers),
+         '--backlog', str(max(args.concurrency * 2, 64)), '--access-logfile', '/dev/null'],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_ready(args.port, server)
+        results, elapsed = asyncio.run(_load(args.port, path, args.concurrency, args.requests))
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+    latencies = sorted(seconds * 1000 for status, seconds in results if status == 200)
+    errors = len(results) - len(latencies)
+    if not latencies:
+        return f'{mode:<8}all {errors} requests failed'
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return (f'{mode:<8}{len(latencies) / elapsed:>10.0f}{p50:>10.1f}{p99:>10.1f}'
+            f'{errors:>8}')
+
+
+def _available(mode):
+    for module in MODES[mode][3]:
+        try:
+            __import__(module)
+        except ImportError:
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--io-ms', type=float, default=50)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--port', type=int, default=5057)
+    parser.add_argument('--modes', default=','.join(mode for mode in MODES if _available(mode)))
+    args = parser.parse_args()
+
+    ceiling = args.workers / (args.io_ms / 1000)
+    print(f'One thread per worker serves at most {ceiling:.0f} req/s at {args.io_ms:g} ms per request\\n')
+    print(f"{'mode':<8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for mode in args.modes.split(','):
+        if not _available(mode):
+            print(f'{mode:<8}skipped (not generated or not installed)')
+            continue
+        print(run_mode(mode, args))
+
+
+if __name__ == '__main__':
+    main()
+'''
+    with open(project_path / 'benchmarks' / 'io_concurrency.py', 'w', encoding='utf-8') as f:
+        f.write(benchmark_content)
+
+    click.echo("✅ Created benchmarks/io_concurrency.py")
+
+
+def _update_requirements(project_path, packages):
+    """Append the server mode's dependencies to requirements.txt"""
+    with open(project_path / 'requirements.txt', 'a', encoding='utf-8') as f:
+        for package in packages:
+            f.write(f'{package}\n')
+
+    names = ', '.join(package.split('==')[0] for package in packages)
+    click.echo(f"✅ Added {names} to requirements.txt")
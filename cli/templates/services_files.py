@@ -9,9 +9,166 @@ def create(services_path):
     init_content = '''"""Services module for FlaskMeridian app
 
 Services contain business logic and are reusable across routes.
+
+Read-heavy lookups of near-static data can use Model.cached() to serve
+results from the query cache (see cache/query_cache.py). Decorate methods
+that only read and tolerate a little replication lag with @read_only()
+(from db) so they read from a replica when DATABASE_REPLICA_URLS is set;
+GET requests read from replicas anyway.
 """
 '''
     with open(services_path / '__init__.py', 'w', encoding='utf-8') as f:
         f.write(init_content)
 
-    click.echo("✅ Created services/__init__.py")
\ No newline at end of file
+    # export_service.py
+    export_content = '''"""Export service - stream large tables as NDJSON or CSV in constant memory
+
+Rows are read with a server-side cursor (``yield_per``) as plain column
+tuples, encoded one at a time and handed to the client or file in ~64 KB
+blocks, optionally gzip-compressed on the fly. Memory use depends on the
+batch size, not on the table size.
+
+Usage in a route (protect it - exports contain your data!):
+
+    from services.export_service import ExportService
+
+    @admin_bp.route('/export/users.ndjson')
+    @auth_required()
+    @roles_required('admin')
+    def export_users():
+        return ExportService.response(User, fmt='ndjson', gzip=True)
+"""
+import csv
+import io
+import zlib
+
+from flask import Response, current_app, stream_with_context
+from sqlalchemy import select
+
+from db import db
+
+FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+BLOCK_SIZE = 64 * 1024
+
+
+class ExportService:
+    """Service for streaming model exports"""
+
+    @staticmethod
+    def fields_for(model, fields=None):
+        """Column names to export, honouring the model's __serialize_exclude__"""
+        columns, _ = model._serialization_meta()
+        names = [key for key, _ in columns if model._wanted(key, None, ())]
+        if fields is not None:
+            unknown = set(fields) - set(names)
+            if unknown:
+                raise ValueError(f"Cannot export fields: {', '.join(sorted(unknown))}")
+            names = [name for name in names if name in fields]
+        return names
+
+    @staticmethod
+    def iter_rows(model, fields, where=None, batch_size=1000):
+        """Yield Row tuples of ``fields`` through a server-side cursor
+
+        Args:
+            model: BaseModel subclass to export
+            fields: Column names to select
+            where: Optional SQLAlchemy filter expression
+            batch_size: Rows fetched from the cursor at a time
+        """
+        stmt = select(*(getattr(model, name) for name in fields)).order_by(model.id)
+        if where is not None:
+            stmt = stmt.where(where)
+
+        result = db.session.execute(
+            stmt.execution_options(yield_per=batch_size, stream_results=True)
+        )
+        try:
+            yield from result
+        finally:
+            result.close()
+
+    @staticmethod
+    def encode_ndjson(rows, fields):
+        """Encode rows as newline-delimited JSON, one line at a time"""
+        dumps = current_app.json.dumps
+        for row in rows:
+            yield dumps(dict(zip(fields, row))) + '\\n'
+
+    @staticmethod
+    def encode_csv(rows, fields):
+        """Encode rows as CSV with a header line, one line at a time
+
+        JSON column values (dicts and lists) are written as JSON text.
+        """
+        dumps = current_app.json.dumps
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(fields)
+        for row in rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow([dumps(value) if isinstance(value, (dict, list)) else value for value in row])
+        yield buffer.getvalue()
+
+    @staticmethod
+    def blocks(lines, gzip=False):
+        """Join encoded lines into ~64 KB byte blocks, optionally gzipped"""
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzip else None
+        pending, size = [], 0
+
+        for line in lines:
+            data = line.encode('utf-8')
+            pending.append(data)
+            size += len(data)
+            if size >= BLOCK_SIZE:
+                block = b''.join(pending)
+                pending, size = [], 0
+                if compressor:
+                    block = compressor.compress(block)
+                if block:
+                    yield block
+
+        block = b''.join(pending)
+        if compressor:
+            block = compressor.compress(block) + compressor.flush()
+        if block:
+            yield block
+
+    @classmethod
+    def stream(cls, model, fmt='ndjson', fields=None, where=None, gzip=False, batch_size=1000):
+        """Generate the encoded export as byte blocks
+
+        Raises:
+            ValueError: If the format or a field name is not supported
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+
+        names = cls.fields_for(model, fields)
+        rows = cls.iter_rows(model, names, where=where, batch_size=batch_size)
+        encode = cls.encode_ndjson if fmt == 'ndjson' else cls.encode_csv
+        return cls.blocks(encode(rows, names), gzip=gzip)
+
+    @classmethod
+    def response(cls, model, fmt='ndjson', fields=None, where=None, gzip=False, batch_size=1000):
+        """Build a streaming download Response for a model export"""
+        filename = f"{model.__tablename__}.{fmt}" + ('.gz' if gzip else '')
+        body = cls.stream(model, fmt, fields=fields, where=where, gzip=gzip, batch_size=batch_size)
+
+        return Response(
+            stream_with_context(body),
+            mimetype='application/gzip' if gzip else FORMATS[fmt],
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+        )
+'''
+    with open(services_path / 'export_service.py', 'w', encoding='utf-8') as f:
+        f.write(export_content)
+
+    click.echo("✅ Created services/__init__.py")
+    click.echo("✅ Created services/export_service.py (streaming NDJSON/CSV exports)")
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""Shared fixtures: a generated project and Flask apps on SQLite"""
+import sys
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+from cli.commands.build import _setup_auth, _setup_project_structure
+
+# Top-level packages of a generated project
+GENERATED_PACKAGES = {
+    'benchmarks', 'cache', 'commands', 'db', 'lifecycle', 'observability',
+    'routes', 'serialization', 'services',
+}
+
+
+@pytest.fixture(scope='session')
+def project(tmp_path_factory):
+    """Generate a project with authentication once and make it importable"""
+    path = tmp_path_factory.mktemp('project')
+    _setup_project_structure(path)
+    _setup_auth(path)
+    sys.path.insert(0, str(path))
+    yield path
+    sys.path.remove(str(path))
+    for name in [name for name in sys.modules if name.split('.')[0] in GENERATED_PACKAGES]:
+        del sys.modules[name]
+
+
+# Module-level models, so the query cache can pickle their results
+TEST_MODELS = '''
+from db import db
+from db.models import BaseModel, ShardedMixin
+
+
+class Item(BaseModel):
+    __tablename__ = 'item'
+
+    sku = db.Column(db.String(20), unique=True, nullable=False)
+    name = db.Column(db.String(50))
+    price = db.Column(db.Numeric(10, 2))
+    data = db.Column(db.JSON)
+    quantity = db.Column(db.Integer, default=1)
+
+
+class Event(ShardedMixin, BaseModel):
+    __tablename__ = 'event'
+    __shard_key__ = 'user_id'
+
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    kind = db.Column(db.String(20))
+'''
+
+
+@pytest.fixture(scope='session')
+def models(project):
+    """Models shared by the tests (one metadata for the whole session)"""
+    (project / 'test_models.py').write_text(TEST_MODELS, encoding='utf-8')
+    from db.models import Role, User
+    from test_models import Event, Item
+
+    yield SimpleNamespace(Event=Event, Item=Item, Role=Role, User=User)
+    del sys.modules['test_models']
+
+
+@pytest.fixture
+def make_app(project, models, tmp_path):
+    """Return a factory for Flask apps on a fresh SQLite file
+
+    Keyword arguments override the app config. The app context of the last
+    app built stays pushed until the test ends.
+    """
+    from cache import init_cache, query_cache
+    from db.database import db, init_db
+
+    contexts = []
+
+    def make(**config):
+        app = Flask('tests')
+        app.config.update(
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / f'app{len(contexts)}.db'}",
+            CACHE_TYPE='SimpleCache',
+            SECRET_KEY='test',
+            TESTING=True,
+        )
+        app.config.update(config)
+        init_cache(app)
+        init_db(app)
+        query_cache.init_app(app)
+        context = app.app_context()
+        context.push()
+        contexts.append(context)
+        return app
+
+    yield make
+    for context in reversed(contexts):
+        db.session.remove()
+        context.pop()
+    query_cache.enabled = False
+    query_cache.stats.reset()
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
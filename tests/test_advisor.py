@@ -0,0 +1,89 @@
+"""Index advisor (db/advisor.py): SQL parsing and advice on SQLite"""
+import pytest
+
+
+@pytest.fixture
+def advisor(project):
+    from db import advisor
+
+    return advisor
+
+
+@pytest.fixture
+def hot_dir(app, models, tmp_path):
+    """Write hot statements the way the workers dump them; return the directory"""
+    from observability.sql import HotStatements
+
+    def write(*statements):
+        hot = HotStatements()
+        for statement, calls, seconds in statements:
+            hot.record(statement, seconds, calls)
+        hot.dump(str(tmp_path / 'hot-1.json'))
+        return str(tmp_path)
+
+    return write
+
+
+def test_numbered_parameters(advisor):
+    numbered = advisor.numbered_parameters
+
+    assert numbered('SELECT * FROM t WHERE a = %(a)s AND b = %(b)s OR a > %(a)s') == (
+        'SELECT * FROM t WHERE a = $1 AND b = $2 OR a > $1', 2)
+    assert numbered("SELECT * FROM t WHERE a = %s AND b LIKE 'x%%'") == (
+        "SELECT * FROM t WHERE a = $1 AND b LIKE 'x%'", 1)
+    assert numbered('SELECT * FROM t WHERE a = $2 AND b = $1') == ('SELECT * FROM t WHERE a = $2 AND b = $1', 2)
+    assert numbered('SELECT 1') == ('SELECT 1', 0)
+
+
+def test_predicate_columns_resolve_aliases(advisor):
+    statement = (
+        'SELECT o.id FROM "orders" AS o JOIN users AS u ON u.id = o.user_id '
+        'WHERE o.status IN (%s) AND o.created_at >= %s AND u.deleted_at IS NULL '
+        'AND u.email IS NOT NULL ORDER BY o.total DESC'
+    )
+
+    assert advisor.aliases(statement) == {'o': 'orders', 'u': 'users'}
+    assert advisor.predicate_columns(statement) == {
+        'users': (['id', 'deleted_at'], []),
+        'orders': (['status', 'user_id'], ['created_at']),
+    }
+    assert ('orders', 'total') in advisor.used_columns(statement)
+
+
+def test_advise_suggests_an_index_for_a_full_scan(advisor, hot_dir):
+    from db import db
+
+    advice = advisor.advise(db.engine, hot_dir=hot_dir(
+        ('SELECT item.id FROM item WHERE item.name = ? AND item.price > ?', 10, 2.0),
+        ('SELECT role.name FROM role WHERE role.name = ?', 5, 1.0),
+        ('SELECT nosuch.x FROM nosuch WHERE nosuch.x = ?', 1, 0.5),
+    ))
+
+    assert advice.suggestions == [advisor.Suggestion('item', ('name', 'price'), ['full scan'], 10, 2.0)]
+    explained = {entry.statement.split()[1]: entry for entry in advice.explained}
+    assert explained['item.id'].full_scans == {'item'}
+    assert explained['role.name'].full_scans == set()
+    assert 'no such table' in explained['nosuch.x'].error
+
+
+def test_created_index_is_no_longer_suggested(advisor, hot_dir):
+    from db import db
+
+    directory = hot_dir(('SELECT item.id FROM item WHERE item.name = ?', 1, 1.0))
+    [suggestion] = advisor.advise(db.engine, hot_dir=directory).suggestions
+
+    assert advisor.create_index(db.engine, suggestion) == 'ix_item_name'
+    assert advisor.advise(db.engine, hot_dir=directory).suggestions == []
+
+
+def test_unindexed_foreign_keys_and_unused_indexes(advisor, hot_dir):
+    from db import db
+
+    with db.engine.begin() as connection:
+        connection.exec_driver_sql('CREATE TABLE child (id INTEGER PRIMARY KEY, item_id INTEGER REFERENCES item (id))')
+
+    advice = advisor.advise(db.engine, hot_dir=hot_dir(('SELECT role.id FROM role WHERE role.name = ?', 1, 0.1)))
+
+    assert advisor.Suggestion('child', ('item_id',), ['foreign key to item'], 0, 0.0) in advice.suggestions
+    assert ('role', 'ix_role_created_at_id', ['created_at', 'id']) in advice.unused
+    assert all(table == 'role' for table, _, _ in advice.unused)
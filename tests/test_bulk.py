@@ -0,0 +1,78 @@
+"""bulk_insert() / bulk_upsert() of the generated BulkMixin"""
+from decimal import Decimal
+
+from sqlalchemy import JSON, LargeBinary
+from sqlalchemy.dialects import postgresql
+
+
+def _items(Item):
+    return {item.sku: item for item in Item.query.order_by(Item.sku)}
+
+
+def test_bulk_insert_fills_defaults_and_timestamps(app, models):
+    Item = models.Item
+    rows = [{'sku': f's{number}', 'price': Decimal('1.50')} for number in range(5)]
+    rows.append({'sku': 'odd', 'name': 'other keys', 'quantity': 7})
+
+    assert Item.bulk_insert(rows, chunk_size=2) == 6
+
+    items = _items(Item)
+    assert len(items) == 6
+    assert items['s0'].quantity == 1
+    assert items['s0'].created_at is not None
+    assert items['odd'].name == 'other keys'
+    assert items['odd'].quantity == 7
+
+
+def test_bulk_upsert_updates_rows_colliding_on_conflict_cols(app, models):
+    Item = models.Item
+    Item.bulk_insert([{'sku': 'a', 'name': 'old', 'quantity': 1}])
+
+    sent = Item.bulk_upsert(
+        [{'sku': 'a', 'name': 'new', 'quantity': 2}, {'sku': 'b', 'name': 'b', 'quantity': 3}],
+        conflict_cols=['sku'],
+    )
+
+    assert sent == 2
+    items = _items(Item)
+    assert (items['a'].name, items['a'].quantity) == ('new', 2)
+    assert items['b'].quantity == 3
+
+
+def test_bulk_upsert_with_no_update_cols_keeps_existing_rows(app, models):
+    Item = models.Item
+    Item.bulk_insert([{'sku': 'a', 'name': 'old'}])
+
+    Item.bulk_upsert([{'sku': 'a', 'name': 'new'}], conflict_cols=['sku'], update_cols=[])
+
+    assert _items(Item)['a'].name == 'old'
+
+
+def test_bulk_insert_is_seen_by_the_query_cache(make_app, models):
+    make_app(QUERY_CACHE_ENABLED=True)
+    Item = models.Item
+    assert Item.cached().all() == []
+
+    Item.bulk_insert([{'sku': 'a'}])
+
+    assert [item.sku for item in Item.cached().all()] == ['a']
+
+
+def test_copy_field_quotes_values_and_leaves_none_unquoted(project):
+    from db.models.bulk import _copy_field
+
+    assert _copy_field(None) == ''
+    assert _copy_field('') == '""'
+    assert _copy_field('say "hi", bye') == '"say ""hi"", bye"'
+    assert _copy_field(3) == '"3"'
+    assert _copy_field(b'\x00\xff') == '"\\x00ff"'
+
+
+def test_copy_field_writes_json_columns_as_json(project):
+    from db.models.bulk import _copy_field
+
+    dialect = postgresql.psycopg2.dialect()
+    process = JSON().bind_processor(dialect)
+
+    assert _copy_field({'a': [1, None]}, process) == '"{""a"": [1, null]}"'
+    assert _copy_field(b'\x01', LargeBinary().bind_processor(dialect)) == '"\\x01"'
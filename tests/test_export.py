@@ -0,0 +1,104 @@
+"""Streaming NDJSON/CSV exports (ExportService and flask export)"""
+import csv
+import gzip
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.fixture
+def items(app, models):
+    from db import db
+    from serialization import init_json
+
+    init_json(app)
+    db.session.add_all([
+        models.Item(sku='a', name='Café, "naïve"', price=Decimal('1.50'), data={'tags': ['x']}),
+        models.Item(sku='b', name='line\nbreak', price=None, data=None),
+    ])
+    db.session.commit()
+    return models.Item
+
+
+def _export(model, **kwargs):
+    from services.export_service import ExportService
+
+    return b''.join(ExportService.stream(model, **kwargs))
+
+
+def test_ndjson_writes_one_object_per_row(items):
+    lines = _export(items, fields=['sku', 'name', 'price', 'data']).decode('utf-8').splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {'sku': 'a', 'name': 'Café, "naïve"', 'price': '1.50', 'data': {'tags': ['x']}},
+        {'sku': 'b', 'name': 'line\nbreak', 'price': None, 'data': None},
+    ]
+
+
+def test_csv_quotes_values_and_writes_a_header(items):
+    text = _export(items, fmt='csv', fields=['sku', 'name', 'price', 'data']).decode('utf-8')
+
+    header, first, second = csv.reader(io.StringIO(text))
+
+    assert header == ['sku', 'name', 'price', 'data']
+    assert first[:3] == ['a', 'Café, "naïve"', '1.50']
+    assert json.loads(first[3]) == {'tags': ['x']}
+    assert second == ['b', 'line\nbreak', '', '']
+
+
+def test_gzip_output_decompresses_to_the_plain_export(items, monkeypatch):
+    from services import export_service
+
+    plain = _export(items, fmt='csv')
+    # Several blocks, so the compressor is flushed only once at the end
+    monkeypatch.setattr(export_service, 'BLOCK_SIZE', 8)
+    blocks = list(export_service.ExportService.stream(items, fmt='csv', gzip=True))
+
+    assert len(blocks) > 1
+    assert gzip.decompress(b''.join(blocks)) == plain
+
+
+def test_excluded_columns_are_not_exported(app, models):
+    from services.export_service import ExportService
+
+    fields = ExportService.fields_for(models.User)
+
+    assert 'email' in fields
+    assert 'password' not in fields
+    with pytest.raises(ValueError):
+        ExportService.fields_for(models.User, ['email', 'password'])
+
+
+def test_where_and_batch_size(items):
+    lines = _export(items, fields=['sku'], where=items.sku == 'b', batch_size=1).splitlines()
+
+    assert [json.loads(line) for line in lines] == [{'sku': 'b'}]
+
+
+def test_unsupported_format_is_rejected(items):
+    with pytest.raises(ValueError):
+        _export(items, fmt='xml')
+
+
+def test_response_is_a_download(app, items):
+    from services.export_service import ExportService
+
+    with app.test_request_context():
+        response = ExportService.response(items, fmt='csv', gzip=True)
+        body = b''.join(response.response)
+
+    assert response.mimetype == 'application/gzip'
+    assert response.headers['Content-Disposition'] == 'attachment; filename="item.csv.gz"'
+    assert gzip.decompress(body).startswith(b'sku,name,')
+
+
+def test_export_command_writes_the_file(app, items, tmp_path):
+    from commands.export import export_command
+
+    output = tmp_path / 'items.ndjson'
+    result = app.test_cli_runner().invoke(export_command, ['item', '--fields', 'sku', '-o', str(output)])
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in output.read_text().splitlines()] == [{'sku': 'a'}, {'sku': 'b'}]
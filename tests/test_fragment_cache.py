@@ -0,0 +1,74 @@
+"""{% cache %} fragment tag of the generated project"""
+from types import SimpleNamespace
+
+import pytest
+from flask import render_template_string
+
+
+@pytest.fixture
+def render(app, monkeypatch):
+    """Render a cached block counting how often its body runs, as a given user"""
+    from cache import fragments
+
+    fragments.init_fragment_cache(app)
+    calls = []
+    app.jinja_env.globals['body'] = lambda: calls.append(1) or len(calls)
+
+    def render(source, user=None):
+        monkeypatch.setattr(fragments, '_current_user', lambda: user)
+        with app.test_request_context():
+            return render_template_string(source)
+
+    render.calls = calls
+    return render
+
+
+def _user(id, *roles):
+    return SimpleNamespace(
+        is_authenticated=True, get_id=lambda: str(id), roles=[SimpleNamespace(name=name) for name in roles],
+    )
+
+
+def test_fragment_is_rendered_once(render):
+    source = "{% cache 'footer', 60 %}{{ body() }}{% endcache %}"
+
+    assert render(source) == render(source) == '1'
+    assert len(render.calls) == 1
+
+
+def test_disabled_fragment_cache_always_renders(app, render):
+    app.config['FRAGMENT_CACHE_ENABLED'] = False
+    source = "{% cache 'footer' %}{{ body() }}{% endcache %}"
+
+    assert [render(source), render(source)] == ['1', '2']
+
+
+def test_version_bump_renders_again(app, render):
+    source = "{% cache 'footer' %}{{ body() }}{% endcache %}"
+    render(source)
+    app.config['FRAGMENT_CACHE_VERSION'] = '2'
+
+    assert render(source) == '2'
+
+
+def test_role_vary_shares_fragments_between_users_with_the_same_roles(render):
+    source = "{% cache 'nav', 60, 'role' %}{{ body() }}{% endcache %}"
+
+    assert render(source, _user(1, 'admin', 'user')) == '1'
+    assert render(source, _user(2, 'user', 'admin')) == '1'
+    assert render(source, _user(3, 'user')) == '2'
+    assert render(source, SimpleNamespace(is_authenticated=False)) == '3'
+    assert render(source) == '3'
+
+
+def test_user_vary_keeps_one_fragment_per_user(render):
+    source = "{% cache 'profile', 60, 'user' %}{{ body() }}{% endcache %}"
+
+    assert render(source, _user(1, 'admin')) == '1'
+    assert render(source, _user(2, 'admin')) == '2'
+    assert render(source, _user(1, 'admin')) == '1'
+
+
+def test_unknown_vary_value_is_rejected(render):
+    with pytest.raises(ValueError):
+        render("{% cache 'nav', 60, 'locale' %}{{ body() }}{% endcache %}")
@@ -0,0 +1,79 @@
+"""FastJSONProvider gives the same JSON with every backend"""
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+
+BACKENDS = ['stdlib', 'orjson', 'msgspec']
+
+
+@pytest.fixture(params=BACKENDS)
+def provider(request, app):
+    from serialization import json_provider
+
+    if request.param != 'stdlib' and getattr(json_provider, request.param) is None:
+        pytest.skip(f'{request.param} is not installed')
+    provider = json_provider.FastJSONProvider(app, backend=request.param)
+    assert provider.backend == request.param
+    return provider
+
+
+def _payload(models):
+    utc = datetime.timezone.utc
+    return {
+        'naive': datetime.datetime(2024, 1, 2, 3, 4, 5, 6000),
+        'utc': datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=utc),
+        'offset': datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+        'date': datetime.date(2024, 1, 2),
+        'time': datetime.time(3, 4, 5, tzinfo=utc),
+        'price': Decimal('19.99'),
+        'tags': {'sale'},
+        'role': models.Role(name='admin'),
+        'nested': [{'b': 1, 'a': None}],
+    }
+
+
+EXPECTED = {
+    'naive': '2024-01-02T03:04:05.006000',
+    'utc': '2024-01-02T03:04:05Z',
+    'offset': '2024-01-02T03:04:05+02:00',
+    'date': '2024-01-02',
+    'time': '03:04:05Z',
+    'price': '19.99',
+    'tags': ['sale'],
+    'nested': [{'b': 1, 'a': None}],
+}
+
+
+def test_backends_encode_the_same_values(provider, models):
+    decoded = json.loads(provider.dumps(_payload(models)))
+
+    assert decoded.pop('role')['name'] == 'admin'
+    assert decoded == EXPECTED
+
+
+def test_sort_keys_orders_nested_objects(provider):
+    provider.sort_keys = True
+
+    decoded = json.loads(provider.dumps({'b': {'d': 1, 'c': 2}, 'a': 0}))
+
+    assert list(decoded) == ['a', 'b']
+    assert list(decoded['b']) == ['c', 'd']
+
+
+def test_dump_arguments_fall_back_to_the_stdlib_encoder(provider):
+    assert provider.dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_loads_round_trips(provider):
+    assert provider.loads(provider.dumps({'a': [1, 'x', None]})) == {'a': [1, 'x', None]}
+
+
+def test_response_body_is_the_encoded_payload(provider, app):
+    app.json = provider
+    with app.test_request_context():
+        response = provider.response(price=Decimal('1.50'), at=datetime.date(2024, 1, 2))
+
+    assert response.mimetype == 'application/json'
+    assert json.loads(response.get_data()) == {'price': '1.50', 'at': '2024-01-02'}
@@ -0,0 +1,52 @@
+"""Keyset pagination of the generated QueryMixin on SQLite"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+
+@pytest.fixture
+def generated(app, models):
+    """Yield (app, db, Item) on a fresh SQLite database"""
+    from db import db
+    yield app, db, models.Item
+
+
+def _insert_same_second(db, Item):
+    # Rows written by CURRENT_TIMESTAMP (text without fraction) and by Python
+    # datetimes (with microseconds), all within one second
+    stamp = '2026-01-01 12:00:00'
+    for number in range(1, 11):
+        db.session.execute(text('INSERT INTO item (id, sku, created_at) VALUES (:id, :sku, :created_at)'),
+                           {'id': number, 'sku': f'e{number}', 'created_at': stamp})
+    for number in range(11, 14):
+        db.session.add(Item(id=number, sku=f'e{number}', created_at=datetime(2026, 1, 1, 12, 0, 0, number)))
+    db.session.commit()
+
+
+def _all_pages(Item, order):
+    ids, cursor = [], None
+    for _ in range(10):  # 13 rows / 4 per page: 4 pages
+        page = Item.keyset_page(cursor=cursor, limit=4, order=order)
+        ids.extend(item.id for item in page.items)
+        if not page.has_more:
+            return ids
+        cursor = page.next_cursor
+    pytest.fail(f'pagination did not end, ids so far: {ids}')
+
+
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+def test_rows_sharing_a_timestamp_are_each_returned_once(generated, order):
+    app, db, Item = generated
+    _insert_same_second(db, Item)
+
+    ids = _all_pages(Item, order)
+
+    expected = list(range(1, 14))
+    assert ids == (expected if order == 'asc' else expected[::-1])
+
+
+def test_invalid_cursor_raises_value_error(generated):
+    app, db, Item = generated
+    with pytest.raises(ValueError):
+        Item.keyset_page(cursor='not-a-cursor')
@@ -0,0 +1,73 @@
+"""Query-result cache of the generated project"""
+import pytest
+
+
+@pytest.fixture
+def cached_app(make_app):
+    return make_app(QUERY_CACHE_ENABLED=True)
+
+
+def _names(Role):
+    return sorted(role.name for role in Role.cached().all())
+
+
+def test_repeated_query_is_served_from_the_cache(cached_app, models):
+    from cache import query_cache
+    from db import db
+
+    db.session.add(models.Role(name='admin'))
+    db.session.commit()
+
+    assert _names(models.Role) == ['admin']
+    assert _names(models.Role) == ['admin']
+    assert query_cache.stats.hits == 1
+    assert query_cache.stats.misses == 1
+
+
+def test_commit_invalidates_the_tables_written(cached_app, models):
+    from db import db
+
+    assert _names(models.Role) == []
+    db.session.add(models.Role(name='admin'))
+    db.session.commit()
+
+    assert _names(models.Role) == ['admin']
+
+
+def test_bulk_update_invalidates_on_commit(cached_app, models):
+    from db import db
+
+    db.session.add(models.Role(name='admin'))
+    db.session.commit()
+    assert _names(models.Role) == ['admin']
+
+    db.session.execute(db.update(models.Role).values(name='root'))
+    db.session.commit()
+
+    assert _names(models.Role) == ['root']
+
+
+def test_rolled_back_writes_never_reach_the_cache(cached_app, models):
+    from db import db
+
+    db.session.add(models.Role(name='temp'))
+    db.session.flush()
+    # The transaction sees its own write...
+    assert _names(models.Role) == ['temp']
+    db.session.rollback()
+
+    # ...but nobody else does once it is rolled back
+    with cached_app.app_context():
+        assert _names(models.Role) == []
+
+
+def test_pending_writes_bypass_a_warm_cache(cached_app, models):
+    from cache import query_cache
+    from db import db
+
+    assert _names(models.Role) == []
+    db.session.add(models.Role(name='new'))
+
+    assert _names(models.Role) == ['new']
+    assert query_cache.stats.hits == 0
+    db.session.rollback()
@@ -0,0 +1,105 @@
+"""Read replica routing and ejection (db/replicas.py), on SQLite files"""
+import pytest
+
+
+@pytest.fixture
+def replica_app(make_app, tmp_path):
+    """An app whose two replicas are read-only connections to its own database"""
+    primary = tmp_path / 'primary.db'
+    replica = f'sqlite:///file:{primary}?mode=ro&uri=true'
+    return make_app(
+        SQLALCHEMY_DATABASE_URI=f'sqlite:///{primary}',
+        DATABASE_REPLICA_URLS=f'{replica},{replica}',
+        REPLICA_STICKY_SECONDS=5,
+    )
+
+
+def _bind_name(models):
+    """Run a query on db.session and name the engine it used"""
+    from db import db
+
+    db.session.execute(db.select(models.Role)).all()
+    engine = db.session.get_bind(models.Role.__mapper__)
+    db.session.rollback()
+    return next(key or 'primary' for key, value in db.engines.items() if value is engine)
+
+
+def test_reads_outside_read_only_use_the_primary(replica_app, models):
+    assert _bind_name(models) == 'primary'
+
+
+def test_read_only_rotates_over_the_replicas(replica_app, models):
+    from db import read_only
+
+    with read_only():
+        names = [_bind_name(models) for _ in range(4)]
+
+    assert sorted(names) == ['replica_1', 'replica_1', 'replica_2', 'replica_2']
+    assert names[0] != names[1]
+
+
+def test_transaction_keeps_its_replica_until_it_writes(replica_app, models):
+    from db import db, read_only
+
+    with read_only():
+        db.session.execute(db.select(models.Role)).all()
+        reader = db.session.get_bind(models.Role.__mapper__)
+        assert db.session.get_bind(models.Role.__mapper__) is reader
+
+        db.session.add(models.Role(name='admin'))
+        db.session.flush()
+        assert db.session.get_bind(models.Role.__mapper__) is db.engine
+        db.session.commit()
+
+
+def test_get_requests_read_replicas_until_the_client_writes(replica_app, models):
+    from db import db
+
+    @replica_app.route('/roles', methods=['GET', 'POST'])
+    def roles():
+        from flask import request
+        if request.method == 'POST':
+            db.session.add(models.Role(name='admin'))
+            db.session.commit()
+        return _bind_name(models)
+
+    client = replica_app.test_client()
+    assert client.get('/roles').text.startswith('replica_')
+
+    response = client.post('/roles')
+    assert response.text == 'primary'
+    assert 'db_primary=1' in response.headers['Set-Cookie']
+
+    # The sticky cookie keeps the client on the primary for its next reads
+    assert client.get('/roles').text == 'primary'
+
+
+def test_failing_replica_is_ejected(make_app, models, tmp_path):
+    from db import read_only
+    from flask import current_app
+
+    primary = tmp_path / 'primary.db'
+    make_app(
+        SQLALCHEMY_DATABASE_URI=f'sqlite:///{primary}',
+        DATABASE_REPLICA_URLS=f"sqlite:///{tmp_path / 'missing' / 'replica.db'},sqlite:///file:{primary}?mode=ro&uri=true",
+    )
+
+    with read_only():
+        assert {_bind_name(models) for _ in range(3)} == {'replica_2'}
+
+    health = current_app.extensions['replicas'].as_dict()
+    assert health['replica_1']['available'] is False
+    assert health['replica_1']['ejected_for'] > 0
+    assert health['replica_2'] == {'available': True, 'lag_seconds': 0.0, 'ejected_for': 0}
+
+
+def test_reads_fall_back_to_the_primary_when_every_replica_is_out(replica_app, models):
+    from db import read_only
+    from flask import current_app
+
+    replica_set = current_app.extensions['replicas']
+    for replica in replica_set.replicas:
+        replica_set.eject(replica, 'test')
+
+    with read_only():
+        assert _bind_name(models) == 'primary'
@@ -0,0 +1,56 @@
+"""to_dict() and serialize_many() of the generated SerializerMixin"""
+import pytest
+
+
+@pytest.fixture
+def user(app, models):
+    from db import db
+
+    role = models.Role(name='admin')
+    user = models.User(email='a@example.com', username='a', password='hash', roles=[role])
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def test_to_dict_leaves_out_excluded_columns(user):
+    data = user.to_dict()
+
+    assert data['email'] == 'a@example.com'
+    assert 'password' not in data
+    assert 'fs_uniquifier' not in data
+    assert 'roles' not in data
+
+
+def test_to_dict_include_and_depth(user):
+    assert user.to_dict(include={'password'}) == {'password': 'hash'}
+    assert [role['name'] for role in user.to_dict(depth=1)['roles']] == ['admin']
+
+
+def test_serialize_many_column_rows(user, models):
+    from db import db
+
+    User = models.User
+    rows = db.session.execute(db.select(User.id, User.email, User.password)).all()
+
+    assert User.serialize_many(rows, exclude={'password'}) == [{'id': user.id, 'email': 'a@example.com'}]
+
+
+def test_serialize_many_single_entity_rows(user, models):
+    from db import db
+
+    User = models.User
+    rows = db.session.execute(db.select(User)).all()
+
+    assert User.serialize_many(rows, include={'id', 'email'}) == [{'id': user.id, 'email': 'a@example.com'}]
+    assert User.serialize_many(rows) == [user.to_dict()]
+
+
+def test_serialize_many_rejects_rows_mixing_entities_and_columns(user, models):
+    from db import db
+
+    User = models.User
+    rows = db.session.execute(db.select(User, User.email)).all()
+
+    with pytest.raises(TypeError):
+        User.serialize_many(rows)
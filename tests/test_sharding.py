@@ -0,0 +1,153 @@
+"""Hash sharding (db/sharding.py) on SQLite shard files"""
+from operator import attrgetter
+
+import pytest
+from sqlalchemy import event, select
+
+
+@pytest.fixture
+def make_sharded_app(make_app, tmp_path, monkeypatch):
+    """Build apps on one primary with the first ``count`` of three shard files"""
+    from db import sharding
+
+    # move() waits SHARD_MAP_TTL for the workers to reload the map
+    monkeypatch.setattr(sharding, 'sleep', lambda seconds: None)
+
+    def make(count=2):
+        urls = [f"sqlite:///{tmp_path / f'shard{number}.db'}" for number in range(1, count + 1)]
+        return make_app(
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'primary.db'}",
+            DATABASE_SHARD_URLS=','.join(urls),
+            SHARD_SLOTS=256,
+            SHARD_MAP_TTL=0,
+        )
+
+    return make
+
+
+def _add_events(Event, user_ids):
+    from db import shards
+
+    shards.session.add_all([Event(user_id=user_id, kind='login') for user_id in user_ids])
+    shards.session.commit()
+
+
+def _stored(Event):
+    """{shard: sorted user ids stored there}"""
+    from db import shards
+
+    stored = {}
+    for name, engine in shards.engines.items():
+        with engine.connect() as connection:
+            stored[name] = sorted(connection.scalars(select(Event.__table__.c.user_id)))
+    return stored
+
+
+def test_hash_ring_gives_a_new_shard_slots_from_every_other_shard(project):
+    from db.sharding import HashRing
+
+    slots = 1024
+    before = HashRing(['shard_1', 'shard_2', 'shard_3'])
+    after = HashRing(['shard_1', 'shard_2', 'shard_3', 'shard_4'])
+    moved = [slot for slot in range(slots) if before.owner(slot, slots) != after.owner(slot, slots)]
+
+    assert {after.owner(slot, slots) for slot in moved} == {'shard_4'}
+    assert {before.owner(slot, slots) for slot in moved} == {'shard_1', 'shard_2', 'shard_3'}
+    assert 0.15 < len(moved) / slots < 0.35
+
+    ranges = after.ranges(slots)
+    assert ranges[0][0] == 0 and ranges[-1][1] == slots - 1
+    assert all(end + 1 == start for (_, end, _), (start, _, _) in zip(ranges, ranges[1:]))
+
+
+def test_rows_are_stored_on_the_shard_of_their_key(make_sharded_app, models):
+    from db import shards
+
+    make_sharded_app()
+    _add_events(models.Event, range(40))
+
+    stored = _stored(models.Event)
+    assert all(stored.values())
+    for name, user_ids in stored.items():
+        assert {shards.shard_for(user_id) for user_id in user_ids} == {name}
+
+
+def test_queries_on_the_shard_key_only_visit_its_shards(make_sharded_app, models):
+    from db import shards
+
+    make_sharded_app()
+    Event = models.Event
+    _add_events(Event, range(20))
+    visited = []
+    for name, engine in shards.engines.items():
+        event.listen(engine, 'before_cursor_execute', lambda *args, name=name: visited.append(name))
+
+    events = shards.session.scalars(select(Event).where(Event.user_id == 3)).all()
+    assert [row.user_id for row in events] == [3]
+    assert visited == [shards.shard_for(3)]
+
+    visited.clear()
+    assert len(shards.session.scalars(select(Event).where(Event.kind == 'login')).all()) == 20
+    assert sorted(visited) == sorted(shards.engines)
+
+
+def test_fan_out_merges_sorted_shard_results(make_sharded_app, models):
+    from db import shards
+
+    make_sharded_app()
+    Event = models.Event
+    _add_events(Event, range(30))
+
+    latest = shards.fan_out(
+        select(Event).order_by(Event.user_id.desc()).limit(5),
+        key=attrgetter('user_id'), reverse=True, limit=5,
+    )
+
+    assert [row.user_id for row in latest] == [29, 28, 27, 26, 25]
+
+
+def test_rebalance_moves_rows_to_a_new_shard(make_sharded_app, models):
+    from db import shards
+
+    Event = models.Event
+    make_sharded_app(2)
+    _add_events(Event, range(60))
+
+    make_sharded_app(3)
+    # The map seeded for two shards is kept; the third shard starts empty
+    assert _stored(Event)['shard_3'] == []
+    moves = shards.plan()
+    assert {target for _, _, _, target in moves} == {'shard_3'}
+
+    moved = shards.move(moves, echo=lambda message: None)
+
+    stored = _stored(Event)
+    assert moved == len(stored['shard_3']) > 0
+    assert sorted(sum(stored.values(), [])) == list(range(60))
+    for name, user_ids in stored.items():
+        assert {shards.shard_for(user_id) for user_id in user_ids} <= {name}
+    assert shards.plan() == []
+
+
+def test_writes_to_a_moving_range_are_refused(make_sharded_app, models):
+    from db import shards
+    from db.sharding import MOVING, ShardMoveInProgress
+
+    make_sharded_app()
+    slot = shards.slot_for(7)
+    owner = shards.shard_for(7)
+    shards._update_map([(slot, slot, owner, owner)], owner_index=2, state=MOVING)
+
+    assert shards.shard_for(7) == owner
+    with pytest.raises(ShardMoveInProgress):
+        _add_events(models.Event, [7])
+    shards.session.rollback()
+
+
+def test_move_rejects_unknown_shards(make_sharded_app):
+    from db import shards
+
+    make_sharded_app()
+
+    with pytest.raises(ValueError):
+        shards.move([(0, 10, 'shard_1', 'shard_9')])
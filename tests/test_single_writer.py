@@ -0,0 +1,98 @@
+"""Single-writer SQLite mode: read routing and the write queue"""
+import pytest
+from sqlalchemy import insert, update
+
+
+@pytest.fixture
+def writer_app(make_app):
+    return make_app(SQLITE_SINGLE_WRITER=True, SQLITE_BATCH_WINDOW_MS=50)
+
+
+def _bind_url(session, model):
+    return str(session.get_bind(model.__mapper__).url)
+
+
+def test_in_memory_database_keeps_the_default_mode(make_app):
+    from db import write_queue
+
+    app = make_app(SQLITE_SINGLE_WRITER=True, SQLALCHEMY_DATABASE_URI='sqlite://')
+
+    assert 'db_read_router' not in app.extensions
+    assert not write_queue.batching
+
+
+def test_reads_use_the_reader_until_the_transaction_writes(writer_app, models):
+    from db import db
+
+    Role = models.Role
+    assert 'mode=ro' in _bind_url(db.session, Role)
+
+    db.session.add(Role(name='admin'))
+    db.session.flush()
+    assert 'mode=ro' not in _bind_url(db.session, Role)
+
+    db.session.commit()
+    assert 'mode=ro' in _bind_url(db.session, Role)
+
+
+def test_use_writer_routes_reads_to_the_writer(writer_app, models):
+    from db import db, use_writer
+
+    use_writer()
+
+    assert 'mode=ro' not in _bind_url(db.session, models.Role)
+    db.session.rollback()
+
+
+def test_write_queue_batches_jobs_and_isolates_failures(writer_app, models):
+    from db import write_queue
+
+    items = models.Item.__table__
+    futures = [write_queue.submit(insert(items).values(sku=sku)) for sku in ('a', 'b', 'a', 'c')]
+    transactions = [write_queue.submit(lambda connection: id(connection.get_transaction())) for _ in range(2)]
+
+    assert [future.exception(timeout=5) is None for future in futures] == [True, True, False, True]
+    assert len({future.result(timeout=5) for future in transactions}) == 1
+    assert sorted(item.sku for item in models.Item.query) == ['a', 'b', 'c']
+
+
+def test_write_queue_execute_returns_the_rowcount_and_invalidates_the_cache(make_app, models):
+    from db import db, write_queue
+
+    make_app(SQLITE_SINGLE_WRITER=True, QUERY_CACHE_ENABLED=True)
+    Role = models.Role
+    db.session.add(Role(name='admin'))
+    db.session.commit()
+    assert [role.name for role in Role.cached().all()] == ['admin']
+
+    assert write_queue.execute(update(Role.__table__).values(name='root')) == 1
+
+    assert [role.name for role in Role.cached().all()] == ['root']
+
+
+def test_write_queue_execute_refuses_while_the_session_holds_the_writer(writer_app, models):
+    from db import db, write_queue
+
+    db.session.add(models.Role(name='admin'))
+    db.session.flush()
+
+    with pytest.raises(RuntimeError):
+        write_queue.execute(update(models.Role.__table__).values(name='root'))
+    db.session.rollback()
+
+
+@pytest.mark.parametrize('single_writer', [False, True])
+def test_track_login_updates_the_login_columns(make_app, models, single_writer):
+    from db import db
+    from services.auth_service import AuthService
+
+    make_app(SQLITE_SINGLE_WRITER=single_writer)
+    user = models.User(email='a@example.com', username='a', password='hash', current_login_ip='10.0.0.1')
+    db.session.add(user)
+    db.session.commit()
+
+    AuthService.track_login(user, '10.0.0.2')
+    AuthService.track_login(user, '10.0.0.3')
+
+    assert user.login_count == 2
+    assert (user.last_login_ip, user.current_login_ip) == ('10.0.0.2', '10.0.0.3')